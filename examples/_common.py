@@ -0,0 +1,77 @@
+"""Shared setup for the example scripts.
+
+Builds a single ``docutray.Client`` per process so that examples run
+together (e.g. imported from one script) share the same connection pool.
+"""
+
+import functools
+import json
+import os
+import sys
+
+from dotenv import load_dotenv
+
+import docutray
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def get_api_key():
+    """Return the API key from the environment or exit with a hint."""
+    load_dotenv()
+
+    api_key = os.getenv("DOCUTRAY_API_KEY")
+    if not api_key:
+        print("Error: DOCUTRAY_API_KEY not set.")
+        print("Copy .env.example to .env and add your API key.")
+        sys.exit(1)
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Return the shared synchronous client, creating it on first use."""
+    return docutray.Client(api_key=get_api_key())
+
+
+def print_json(data):
+    """Pretty-print JSON data without building the whole document in memory.
+
+    Top-level entries of a dict or list are serialized and written one at a
+    time, using orjson when it is installed and ``json.dump`` (which also
+    writes incrementally) otherwise.
+    """
+    if orjson is None:
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+
+    if isinstance(data, dict) and data:
+        open_, close = b"{\n", b"\n}"
+        chunks = (
+            orjson.dumps({key: value}, option=option) for key, value in data.items()
+        )
+    elif isinstance(data, list) and data:
+        open_, close = b"[\n", b"\n]"
+        chunks = (orjson.dumps([item], option=option) for item in data)
+    else:
+        out.write(orjson.dumps(data, option=option) + b"\n")
+        out.flush()
+        return
+
+    # Each chunk is a one-entry container already indented for this level;
+    # strip its brackets and join the entries into the outer container.
+    out.write(open_)
+    for index, chunk in enumerate(chunks):
+        if index:
+            out.write(b",\n")
+        out.write(chunk[2:-2])
+    out.write(close + b"\n")
+    out.flush()
@@ -7,24 +7,16 @@ Usage:
     python convert_document.py
 """
 
-import json
+import asyncio
 import os
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
+from _common import get_api_key, get_client, print_json
 
 import docutray
 
-load_dotenv()
-
-api_key = os.getenv("DOCUTRAY_API_KEY")
-if not api_key:
-    print("Error: DOCUTRAY_API_KEY not set.")
-    print("Copy .env.example to .env and add your API key.")
-    sys.exit(1)
-
-client = docutray.Client(api_key=api_key)
+client = get_client()
 
 
 def convert_from_file():
@@ -41,7 +33,7 @@ def convert_from_file():
 
     print("Conversion successful!")
     print("\nExtracted data:")
-    print(json.dumps(result.data, indent=2, ensure_ascii=False))
+    print_json(result.data)
 
 
 # --- Additional usage examples (each call consumes API credits) ---
@@ -58,7 +50,7 @@ def convert_from_url():
 
     print("Conversion successful!")
     print("\nExtracted data:")
-    print(json.dumps(result.data, indent=2, ensure_ascii=False))
+    print_json(result.data)
 
 
 def convert_async_with_polling():
@@ -69,13 +61,130 @@ def convert_async_with_polling():
     )
     print(f"Conversion started: {result.conversion_id}")
 
-    final = result.wait(on_status=lambda s: print(f"  Status: {s.status}"))
+    final = result.wait(
+        on_status=lambda s: print(f"  Status: {s.status}"),
+        max_poll_interval=15.0,
+        backoff_factor=1.5,
+        jitter=0.1,
+    )
 
     if final.is_success():
-        print(json.dumps(final.data, indent=2, ensure_ascii=False))
+        print_json(final.data)
     elif final.is_error():
         print(f"Conversion failed: {final.error}")
 
 
+def submit_conversion():
+    """Start a conversion and exit without waiting for the result.
+
+    Only one request is made here; store the returned ID and call
+    ``check_conversion`` later (e.g. from a scheduled job) instead of
+    keeping a process alive while the conversion runs.
+    """
+    status = client.convert.run_async(
+        file=Path("sample_invoice.pdf"),
+        document_type_code="invoice",
+    )
+    print(f"Conversion submitted: {status.conversion_id}")
+    return status.conversion_id
+
+
+def check_conversion(conversion_id):
+    """Check a previously submitted conversion with a single status request."""
+    status = client.convert.get_status(conversion_id)
+
+    if status.is_success():
+        print_json(status.data)
+    elif status.is_error():
+        print(f"Conversion failed: {status.error}")
+    else:
+        print(f"Conversion still {status.status}, check again later.")
+
+
+SUPPORTED_EXTENSIONS = (".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".webp")
+BATCH_LOG = Path(".docutray_batch.log")
+
+
+def iter_documents(root):
+    """Yield paths of supported documents directly inside ``root``.
+
+    ``os.scandir`` returns file type information with each entry, so no
+    extra ``stat`` call is needed per file on large directories.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield Path(entry.path)
+
+
+async def convert_batch(paths, *, max_concurrency=16):
+    """Convert several documents concurrently with the async client.
+
+    Every document is submitted with ``run_async`` and polled with
+    ``wait_async``; a semaphore bounds how many conversions are in flight
+    at once so large batches stay within the API rate limits. Failed
+    files are appended to ``conversion.log`` so they can be retried later,
+    and converted files to ``.docutray_batch.log`` so they can be skipped.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with docutray.AsyncClient(api_key=get_api_key()) as async_client:
+
+        async def convert_one(path):
+            async with semaphore:
+                status = await async_client.convert.run_async(
+                    file=path,
+                    document_type_code="invoice",
+                )
+                return await status.wait_async(
+                    max_poll_interval=15.0,
+                    backoff_factor=1.5,
+                    jitter=0.1,
+                )
+
+        results = await asyncio.gather(
+            *(convert_one(path) for path in paths),
+            return_exceptions=True,
+        )
+
+    with (
+        open("conversion.log", "a", encoding="utf-8") as log,
+        BATCH_LOG.open("a", encoding="utf-8") as done,
+    ):
+        for path, result in zip(paths, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"{path.name}: failed ({result})")
+                log.write(f"{path}\t{result}\n")
+            elif result.is_error():
+                print(f"{path.name}: conversion error ({result.error})")
+                log.write(f"{path}\t{result.error}\n")
+            else:
+                print(f"{path.name}: converted")
+                print_json(result.data)
+                done.write(f"{path}\n")
+
+    return results
+
+
+def convert_directory(directory="."):
+    """Convert every supported document in a directory concurrently.
+
+    Files already listed in ``.docutray_batch.log`` by a previous run are
+    skipped, so an interrupted batch can simply be started again.
+    """
+    completed = set()
+    if BATCH_LOG.exists():
+        completed = set(BATCH_LOG.read_text(encoding="utf-8").splitlines())
+
+    paths = sorted(
+        path for path in iter_documents(directory) if str(path) not in completed
+    )
+    if not paths:
+        print(f"No documents left to convert in {directory}")
+        return
+
+    asyncio.run(convert_batch(paths))
+
+
 if __name__ == "__main__":
     convert_from_file()
@@ -9,22 +9,16 @@ Usage:
     python execute_steps.py
 """
 
-import json
+import asyncio
 import os
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
+from _common import get_api_key, get_client, print_json
 
 import docutray
 
-load_dotenv()
-
-api_key = os.getenv("DOCUTRAY_API_KEY")
-if not api_key:
-    print("Error: DOCUTRAY_API_KEY not set.")
-    print("Copy .env.example to .env and add your API key.")
-    sys.exit(1)
+client = get_client()
 
 step_id = os.getenv("DOCUTRAY_STEP_ID")
 if not step_id:
@@ -32,8 +26,6 @@ if not step_id:
     print("Add DOCUTRAY_STEP_ID=your_step_id to your .env file.")
     sys.exit(1)
 
-client = docutray.Client(api_key=api_key)
-
 
 def execute_from_file():
     """Execute a step with a local file."""
@@ -45,12 +37,17 @@ def execute_from_file():
     status = client.steps.run_async(step_id, file=document_path)
     print(f"Execution started: {status.execution_id}")
 
-    result = status.wait(on_status=lambda s: print(f"  Status: {s.status}"))
+    result = status.wait(
+        on_status=lambda s: print(f"  Status: {s.status}"),
+        max_poll_interval=15.0,
+        backoff_factor=1.5,
+        jitter=0.1,
+    )
 
     if result.is_success():
         print("\nStep executed successfully!")
         print("\nResult data:")
-        print(json.dumps(result.data, indent=2, ensure_ascii=False))
+        print_json(result.data)
     elif result.is_error():
         print(f"\nStep execution failed: {result.error}")
 
@@ -65,10 +62,15 @@ def execute_from_url():
     status = client.steps.run_async(step_id, url=url)
     print(f"Execution started: {status.execution_id}")
 
-    result = status.wait(on_status=lambda s: print(f"  Status: {s.status}"))
+    result = status.wait(
+        on_status=lambda s: print(f"  Status: {s.status}"),
+        max_poll_interval=15.0,
+        backoff_factor=1.5,
+        jitter=0.1,
+    )
 
     if result.is_success():
-        print(json.dumps(result.data, indent=2, ensure_ascii=False))
+        print_json(result.data)
     elif result.is_error():
         print(f"Step execution failed: {result.error}")
 
@@ -81,10 +83,69 @@ def execute_with_metadata():
         document_metadata={"source": "sdk_example"},
     )
 
-    result = status.wait()
+    result = status.wait(max_poll_interval=15.0, backoff_factor=1.5, jitter=0.1)
 
     if result.is_success():
-        print(json.dumps(result.data, indent=2, ensure_ascii=False))
+        print_json(result.data)
+
+
+async def execute_all_concurrently():
+    """Run the file, URL and metadata executions concurrently.
+
+    All three executions are submitted up front and then awaited together,
+    so the total wait is that of the slowest execution rather than the sum.
+    """
+    url = "https://storage.googleapis.com/public.docutray.com/api-examples/sample_invoice.pdf"
+    document_path = Path("sample_invoice.pdf")
+
+    async with docutray.AsyncClient(api_key=get_api_key()) as async_client:
+        statuses = await asyncio.gather(
+            async_client.steps.run_async(step_id, file=document_path),
+            async_client.steps.run_async(step_id, url=url),
+            async_client.steps.run_async(
+                step_id,
+                file=document_path,
+                document_metadata={"source": "sdk_example"},
+            ),
+        )
+        results = await asyncio.gather(
+            *(
+                status.wait_async(
+                    max_poll_interval=15.0, backoff_factor=1.5, jitter=0.1
+                )
+                for status in statuses
+            )
+        )
+
+    for label, result in zip(("file", "url", "metadata"), results, strict=True):
+        if result.is_success():
+            print(f"[{label}] Step executed successfully!")
+            print_json(result.data)
+        elif result.is_error():
+            print(f"[{label}] Step execution failed: {result.error}")
+
+
+def submit_execution():
+    """Start a step execution and exit without waiting for the result.
+
+    Store the returned ID and call ``check_execution`` later instead of
+    polling from a long-running process.
+    """
+    status = client.steps.run_async(step_id, file=Path("sample_invoice.pdf"))
+    print(f"Execution submitted: {status.execution_id}")
+    return status.execution_id
+
+
+def check_execution(execution_id):
+    """Check a previously submitted execution with a single status request."""
+    status = client.steps.get_status(execution_id)
+
+    if status.is_success():
+        print_json(status.data)
+    elif status.is_error():
+        print(f"Execution failed: {status.error}")
+    else:
+        print(f"Execution still {status.status}, check again later.")
 
 
 if __name__ == "__main__":
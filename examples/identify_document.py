@@ -4,39 +4,56 @@ NOTE: Running this script makes an API call that consumes credits
 from your DocuTray account.
 
 Usage:
-    python identify_document.py
+    python identify_document.py [--no-cache]
 """
 
-import os
+import hashlib
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
+from _common import get_client
 
-import docutray
+from docutray.types import IdentificationResult
 
-load_dotenv()
+client = get_client()
 
-api_key = os.getenv("DOCUTRAY_API_KEY")
-if not api_key:
-    print("Error: DOCUTRAY_API_KEY not set.")
-    print("Copy .env.example to .env and add your API key.")
-    sys.exit(1)
 
-client = docutray.Client(api_key=api_key)
+CACHE_DIR = Path(".identify_cache")
 
 
-def identify_from_file():
+def identify_cached(document_path, document_type_code_options, *, use_cache=True):
+    """Identify a local file, reusing a previous result for identical input.
+
+    Results are stored in ``.identify_cache/`` keyed by the SHA-256 of the
+    file contents and the document type options, so re-running the example
+    on an unchanged file does not make another (billed) API call.
+    """
+    data = document_path.read_bytes()
+    options = ",".join(sorted(document_type_code_options))
+    cache_key = hashlib.sha256(data + b"|" + options.encode()).hexdigest()
+    cache_file = CACHE_DIR / f"{cache_key}.json"
+
+    if use_cache and cache_file.exists():
+        return IdentificationResult.model_validate_json(cache_file.read_text())
+
+    result = client.identify.run(
+        file=document_path,
+        document_type_code_options=document_type_code_options,
+    )
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_text(result.model_dump_json())
+    return result
+
+
+def identify_from_file(*, use_cache=True):
     """Identify a document from a local file."""
     document_path = Path("sample_invoice.pdf")
     if not document_path.exists():
         print(f"Error: File not found: {document_path}")
         sys.exit(1)
 
-    result = client.identify.run(
-        file=document_path,
-        document_type_code_options=["invoice"],
-    )
+    result = identify_cached(document_path, ["invoice"], use_cache=use_cache)
 
     print(f"Document type: {result.document_type.name}")
     print(f"Code:          {result.document_type.code}")
@@ -75,5 +92,33 @@ def identify_with_options():
     print(f"Confidence:    {result.document_type.confidence:.2%}")
 
 
+def submit_identification():
+    """Start an identification and exit without waiting for the result.
+
+    Store the returned ID and call ``check_identification`` later instead of
+    polling from a long-running process.
+    """
+    status = client.identify.run_async(
+        file=Path("sample_invoice.pdf"),
+        document_type_code_options=["invoice", "receipt"],
+    )
+    print(f"Identification submitted: {status.identification_id}")
+    return status.identification_id
+
+
+def check_identification(identification_id):
+    """Check a previously submitted identification with a single status request."""
+    status = client.identify.get_status(identification_id)
+
+    if status.is_success() and status.document_type is not None:
+        print(f"Document type: {status.document_type.name}")
+        print(f"Confidence:    {status.document_type.confidence:.2%}")
+    elif status.is_error():
+        print(f"Identification failed: {status.error}")
+    else:
+        print(f"Identification still {status.status}, check again later.")
+
+
 if __name__ == "__main__":
-    identify_from_file()
+    # Pass --no-cache to always call the API
+    identify_from_file(use_cache="--no-cache" not in sys.argv)
@@ -18,6 +18,9 @@ Output:
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
 try:
@@ -28,11 +31,117 @@ except ImportError:
     sys.exit(1)
 
 
+# Google-style section headers mapped to the section they start
+_SECTION_MAP = {
+    "args:": "args",
+    "arguments:": "args",
+    "returns:": "returns",
+    "return:": "returns",
+    "raises:": "raises",
+    "raise:": "raises",
+    "exceptions:": "raises",
+    "example:": "example",
+    "examples:": "example",
+}
+
+
+# Static documentation blocks, built once instead of per generator call
+_INDEX_CONTENT = """# DocuTray Python SDK API Reference
+
+This is the API reference for the DocuTray Python SDK.
+
+## Installation
+
+```bash
+pip install docutray
+```
+
+## Modules
+
+### Client
+
+The main entry points for the SDK:
+
+- [`Client`](client.md#client) - Synchronous client
+- [`AsyncClient`](client.md#asyncclient) - Asynchronous client
+
+### Exceptions
+
+Error handling classes:
+
+- [Exception Hierarchy](exceptions.md)
+
+### Resources
+
+API resource classes:
+
+- [Convert](resources/convert.md) - Document conversion
+- [Identify](resources/identify.md) - Document identification
+- [DocumentTypes](resources/document_types.md) - Document type catalog
+- [Steps](resources/steps.md) - Step execution
+- [KnowledgeBases](resources/knowledge_bases.md) - Knowledge base operations
+
+### Types
+
+Response and model types:
+
+- [Convert Types](types/convert.md)
+- [Identify Types](types/identify.md)
+- [Document Type Types](types/document_type.md)
+- [Step Types](types/step.md)
+- [Knowledge Base Types](types/knowledge_base.md)
+- [Shared Types](types/shared.md)
+"""
+
+_EXCEPTIONS_HEADER = """# Exceptions
+
+Exception classes for error handling in the DocuTray SDK.
+
+## Exception Hierarchy
+
+
+```
+DocuTrayError (base)
+├── APIConnectionError (network errors)
+│   └── APITimeoutError (request timeout)
+└── APIError (HTTP errors)
+    ├── BadRequestError (400)
+    ├── AuthenticationError (401)
+    ├── PermissionDeniedError (403)
+    ├── NotFoundError (404)
+    ├── ConflictError (409)
+    ├── UnprocessableEntityError (422)
+    ├── RateLimitError (429)
+    └── InternalServerError (5xx)
+```
+"""
+
+_EXCEPTION_ORDER = (
+    "DocuTrayError",
+    "APIConnectionError",
+    "APITimeoutError",
+    "APIError",
+    "BadRequestError",
+    "AuthenticationError",
+    "PermissionDeniedError",
+    "NotFoundError",
+    "ConflictError",
+    "UnprocessableEntityError",
+    "RateLimitError",
+    "InternalServerError",
+)
+
+
 def is_public(name: str) -> bool:
     """Check if a name represents a public API member."""
     return not name.startswith("_")
 
 
+def _first_line(text: str) -> str:
+    """Return the first line of ``text`` without splitting the rest."""
+    return text.partition("\n")[0] if "\n" in text else text
+
+
 def format_signature(obj: griffe.Function | griffe.Class) -> str:
     """Format a function or class signature for documentation."""
     if isinstance(obj, griffe.Class):
@@ -54,8 +163,13 @@ def format_signature(obj: griffe.Function | griffe.Class) -> str:
     return f"def {obj.name}({', '.join(params)}){returns}"
 
 
+@lru_cache(maxsize=4096)
 def extract_docstring_sections(docstring: str | None) -> dict[str, str]:
-    """Extract Google-style docstring sections."""
+    """Extract Google-style docstring sections.
+
+    Results are cached per docstring, so callers must not mutate the
+    returned dict.
+    """
     if not docstring:
         return {"description": "", "args": "", "returns": "", "raises": "", "example": ""}
 
@@ -73,22 +187,11 @@ def extract_docstring_sections(docstring: str | None) -> dict[str, str]:
     for line in docstring.split("\n"):
         stripped = line.strip()
 
-        # Check for section headers
-        if stripped.lower() in ("args:", "arguments:"):
-            sections[current_section] = "\n".join(current_content).strip()
-            current_section = "args"
-            current_content = []
-        elif stripped.lower() in ("returns:", "return:"):
+        # Check for section headers (all of them end with a colon)
+        section = _SECTION_MAP.get(stripped.lower()) if stripped.endswith(":") else None
+        if section:
             sections[current_section] = "\n".join(current_content).strip()
-            current_section = "returns"
-            current_content = []
-        elif stripped.lower() in ("raises:", "raise:", "exceptions:"):
-            sections[current_section] = "\n".join(current_content).strip()
-            current_section = "raises"
-            current_content = []
-        elif stripped.lower() in ("example:", "examples:"):
-            sections[current_section] = "\n".join(current_content).strip()
-            current_section = "example"
+            current_section = section
             current_content = []
         else:
             current_content.append(line)
@@ -148,39 +251,38 @@ def format_class_doc(cls: griffe.Class) -> str:
             lines.append("**Example:**\n")
             lines.append(f"```python\n{sections['example']}\n```\n")
 
-    # Constructor args (from __init__)
-    init_method = cls.members.get("__init__")
-    if init_method and isinstance(init_method, griffe.Function):
-        if init_method.docstring:
-            init_sections = extract_docstring_sections(init_method.docstring.value)
-            if init_sections["args"]:
-                lines.append("**Arguments:**\n")
-                lines.append(f"{init_sections['args']}\n")
-
-    # Public methods
-    methods = []
+    # Sort members into constructor, public methods and properties in one pass
+    init_method: griffe.Function | None = None
+    methods: list[griffe.Function] = []
+    properties: list[griffe.Attribute] = []
     for name, member in cls.members.items():
-        if isinstance(member, griffe.Function) and is_public(name) and name != "__init__":
-            methods.append(member)
+        if isinstance(member, griffe.Function):
+            if name == "__init__":
+                init_method = member
+            elif is_public(name):
+                methods.append(member)
+        elif isinstance(member, griffe.Attribute) and is_public(name):
+            if hasattr(member, "labels") and "property" in member.labels:
+                properties.append(member)
+
+    # Constructor args (from __init__)
+    if init_method and init_method.docstring:
+        init_sections = extract_docstring_sections(init_method.docstring.value)
+        if init_sections["args"]:
+            lines.append("**Arguments:**\n")
+            lines.append(f"{init_sections['args']}\n")
 
     if methods:
         lines.append("**Methods:**\n")
         for method in sorted(methods, key=lambda m: m.name):
             lines.append(format_method_doc(method))
 
-    # Public properties
-    properties = []
-    for name, member in cls.members.items():
-        if isinstance(member, griffe.Attribute) and is_public(name):
-            if hasattr(member, "labels") and "property" in member.labels:
-                properties.append(member)
-
     if properties:
         lines.append("**Properties:**\n")
         for prop in sorted(properties, key=lambda p: p.name):
             lines.append(f"- `{prop.name}`")
             if prop.docstring:
-                lines.append(f": {prop.docstring.value.splitlines()[0]}")
+                lines.append(f": {_first_line(prop.docstring.value)}")
             lines.append("\n")
 
     return "\n".join(lines)
@@ -188,53 +290,7 @@ def format_class_doc(cls: griffe.Class) -> str:
 
 def generate_index(modules: dict[str, griffe.Module]) -> str:
     """Generate the index.md file content."""
-    content = """# DocuTray Python SDK API Reference
-
-This is the API reference for the DocuTray Python SDK.
-
-## Installation
-
-```bash
-pip install docutray
-```
-
-## Modules
-
-### Client
-
-The main entry points for the SDK:
-
-- [`Client`](client.md#client) - Synchronous client
-- [`AsyncClient`](client.md#asyncclient) - Asynchronous client
-
-### Exceptions
-
-Error handling classes:
-
-- [Exception Hierarchy](exceptions.md)
-
-### Resources
-
-API resource classes:
-
-- [Convert](resources/convert.md) - Document conversion
-- [Identify](resources/identify.md) - Document identification
-- [DocumentTypes](resources/document_types.md) - Document type catalog
-- [Steps](resources/steps.md) - Step execution
-- [KnowledgeBases](resources/knowledge_bases.md) - Knowledge base operations
-
-### Types
-
-Response and model types:
-
-- [Convert Types](types/convert.md)
-- [Identify Types](types/identify.md)
-- [Document Type Types](types/document_type.md)
-- [Step Types](types/step.md)
-- [Knowledge Base Types](types/knowledge_base.md)
-- [Shared Types](types/shared.md)
-"""
-    return content
+    return _INDEX_CONTENT
 
 
 def generate_client_doc(module: griffe.Module) -> str:
@@ -253,43 +309,9 @@ def generate_client_doc(module: griffe.Module) -> str:
 
 def generate_exceptions_doc(module: griffe.Module) -> str:
     """Generate exceptions.md documentation."""
-    lines = ["# Exceptions\n"]
-    lines.append("Exception classes for error handling in the DocuTray SDK.\n")
+    lines = [_EXCEPTIONS_HEADER]
 
-    lines.append("## Exception Hierarchy\n")
-    lines.append("""
-```
-DocuTrayError (base)
-├── APIConnectionError (network errors)
-│   └── APITimeoutError (request timeout)
-└── APIError (HTTP errors)
-    ├── BadRequestError (400)
-    ├── AuthenticationError (401)
-    ├── PermissionDeniedError (403)
-    ├── NotFoundError (404)
-    ├── ConflictError (409)
-    ├── UnprocessableEntityError (422)
-    ├── RateLimitError (429)
-    └── InternalServerError (5xx)
-```
-""")
-
-    exception_order = [
-        "DocuTrayError",
-        "APIConnectionError",
-        "APITimeoutError",
-        "APIError",
-        "BadRequestError",
-        "AuthenticationError",
-        "PermissionDeniedError",
-        "NotFoundError",
-        "ConflictError",
-        "UnprocessableEntityError",
-        "RateLimitError",
-        "InternalServerError",
-    ]
-
-    for name in exception_order:
+    for name in _EXCEPTION_ORDER:
         if name in module.members:
             cls = module.members[name]
             if isinstance(cls, griffe.Class):
@@ -341,12 +363,17 @@ def generate_types_doc(module: griffe.Module, type_name: str) -> str:
                     annotation = field.annotation if field.annotation else "Any"
                     desc = ""
                     if field.docstring:
-                        desc = f" - {field.docstring.value.splitlines()[0]}"
+                        desc = f" - {_first_line(field.docstring.value)}"
                     lines.append(f"- `{field_name}`: `{annotation}`{desc}\n")
 
     return "\n".join(lines)
 
 
+def _write_doc(path: Path, generate: Callable[[], str]) -> None:
+    """Render a documentation file and write it to disk."""
+    path.write_text(generate())
+
+
 def main() -> None:
     """Generate API reference documentation."""
     # Ensure we're in the project root
@@ -369,23 +396,31 @@ def main() -> None:
 
     print("Generating documentation...")
 
+    # Each output file is independent, so collect (path, generator) pairs and
+    # render/write them concurrently once everything has been discovered.
+    tasks: list[tuple[Path, Callable[[], str]]] = []
+
     # Generate index
-    (docs_path / "index.md").write_text(generate_index({}))
-    print("  Generated index.md")
+    tasks.append((docs_path / "index.md", partial(generate_index, {})))
 
     # Generate client documentation
     if "_client" in package.members:
         client_module = package.members["_client"]
         if isinstance(client_module, griffe.Module):
-            (docs_path / "client.md").write_text(generate_client_doc(client_module))
-            print("  Generated client.md")
+            tasks.append(
+                (docs_path / "client.md", partial(generate_client_doc, client_module))
+            )
 
     # Generate exceptions documentation
     if "_exceptions" in package.members:
         exc_module = package.members["_exceptions"]
         if isinstance(exc_module, griffe.Module):
-            (docs_path / "exceptions.md").write_text(generate_exceptions_doc(exc_module))
-            print("  Generated exceptions.md")
+            tasks.append(
+                (
+                    docs_path / "exceptions.md",
+                    partial(generate_exceptions_doc, exc_module),
+                )
+            )
 
     # Generate resource documentation
     resources = {
@@ -403,11 +438,14 @@ def main() -> None:
                 if module_name in resources_pkg.members:
                     res_module = resources_pkg.members[module_name]
                     if isinstance(res_module, griffe.Module):
-                        filename = f"{module_name}.md"
-                        (docs_path / "resources" / filename).write_text(
-                            generate_resource_doc(res_module, display_name)
+                        tasks.append(
+                            (
+                                docs_path / "resources" / f"{module_name}.md",
+                                partial(
+                                    generate_resource_doc, res_module, display_name
+                                ),
+                            )
                         )
-                        print(f"  Generated resources/{filename}")
 
     # Generate types documentation
     types_modules = {
@@ -426,11 +464,20 @@ def main() -> None:
                 if module_name in types_pkg.members:
                     type_module = types_pkg.members[module_name]
                     if isinstance(type_module, griffe.Module):
-                        filename = f"{module_name}.md"
-                        (docs_path / "types" / filename).write_text(
-                            generate_types_doc(type_module, display_name)
+                        tasks.append(
+                            (
+                                docs_path / "types" / f"{module_name}.md",
+                                partial(generate_types_doc, type_module, display_name),
+                            )
                         )
-                        print(f"  Generated types/{filename}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(_write_doc, path, generate) for path, generate in tasks
+        ]
+        for (path, _), future in zip(tasks, futures, strict=True):
+            future.result()
+            print(f"  Generated {path.relative_to(docs_path).as_posix()}")
 
     print("\nAPI reference generation complete!")
     print(f"Output directory: {docs_path}")
@@ -22,7 +22,10 @@ Example:
     >>> print(f"Type: {ident.document_type.name}")
 """
 
-from ._client import AsyncClient, Client
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from ._client import AsyncClient, Client, get_default_client
 from ._exceptions import (
     APIConnectionError,
     APIError,
@@ -37,24 +40,49 @@ from ._exceptions import (
     RateLimitError,
     UnprocessableEntityError,
 )
+from ._http_transport import shutdown, shutdown_async
 from ._pagination import AsyncPage, Page
+from ._polling import wait_for_many_completions, wait_for_many_completions_async
 from ._response import RawResponse
 from ._version import __version__
-from .types import (
-    ConversionResult,
-    ConversionStatus,
-    DocumentType,
-    DocumentTypeMatch,
-    IdentificationResult,
-    IdentificationStatus,
-    KnowledgeBase,
-    KnowledgeBaseDocument,
-    Pagination,
-    SearchResult,
-    SearchResultItem,
-    StepExecutionStatus,
-    SyncResult,
-    ValidationResult,
+
+if TYPE_CHECKING:
+    from .types import (
+        ConversionResult,
+        ConversionStatus,
+        DocumentType,
+        DocumentTypeMatch,
+        IdentificationResult,
+        IdentificationStatus,
+        KnowledgeBase,
+        KnowledgeBaseDocument,
+        Pagination,
+        SearchResult,
+        SearchResultItem,
+        StepExecutionStatus,
+        SyncResult,
+        ValidationResult,
+    )
+
+# Response types are re-exported lazily (PEP 562) so that `import docutray`
+# does not build every pydantic model up front.
+_LAZY_TYPES = frozenset(
+    {
+        "ConversionResult",
+        "ConversionStatus",
+        "DocumentType",
+        "DocumentTypeMatch",
+        "IdentificationResult",
+        "IdentificationStatus",
+        "KnowledgeBase",
+        "KnowledgeBaseDocument",
+        "Pagination",
+        "SearchResult",
+        "SearchResultItem",
+        "StepExecutionStatus",
+        "SyncResult",
+        "ValidationResult",
+    }
 )
 
 __all__ = [
@@ -63,6 +91,9 @@ __all__ = [
     # Clients
     "Client",
     "AsyncClient",
+    "get_default_client",
+    "shutdown",
+    "shutdown_async",
     # Base exceptions
     "DocuTrayError",
     "APIConnectionError",
@@ -80,6 +111,9 @@ __all__ = [
     # Pagination
     "Page",
     "AsyncPage",
+    # Polling
+    "wait_for_many_completions",
+    "wait_for_many_completions_async",
     # Raw Response
     "RawResponse",
     # Types - Conversion
@@ -103,3 +137,16 @@ __all__ = [
     # Types - Shared
     "Pagination",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_TYPES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(".types", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from dataclasses import replace
 from typing import Any
 
 import httpx
 
 from ._constants import (
+    BACKOFF_STRATEGIES,
     DEFAULT_BASE_URL,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_CONFIG,
-    DEFAULT_TIMEOUT,
+    BackoffStrategy,
 )
 from ._exceptions import make_authentication_error
 from ._http import AsyncHTTPClient, SyncHTTPClient
-from ._utils import get_api_key_from_env, mask_api_key
+from ._utils import get_api_key_from_env, mask_api_key, resolve_timeout
 
 
-class BaseClient(ABC):
-    """Abstract base class for synchronous DocuTray clients."""
+class _ClientConfigMixin:
+    """Configuration and request handling shared by the sync and async clients."""
+
+    __slots__ = (
+        "_api_key",
+        "_repr",
+        "_base_url",
+        "_timeout",
+        "_max_retries",
+        "_retry_config",
+        "_http2",
+    )
 
     def __init__(
         self,
@@ -28,8 +39,10 @@ class BaseClient(ABC):
         base_url: str | None = None,
         timeout: httpx.Timeout | float | None = None,
         max_retries: int | None = None,
+        http2: bool = False,
+        backoff_strategy: BackoffStrategy = "exponential_jitter",
     ) -> None:
-        """Initialize the client.
+        """Initialize the client configuration.
 
         Args:
             api_key: The API key for authentication. If not provided,
@@ -39,9 +52,14 @@ class BaseClient(ABC):
                 (seconds) or an httpx.Timeout for granular control.
             max_retries: Maximum number of retry attempts for failed requests.
                 Defaults to 2.
+            http2: Whether to enable HTTP/2 so concurrent requests share one
+                connection. Requires ``pip install docutray[http2]``.
+            backoff_strategy: How delays between retries are chosen, either
+                "exponential_jitter" or "decorrelated".
 
         Raises:
             AuthenticationError: If no API key is provided or found.
+            ValueError: If max_retries or backoff_strategy is invalid.
         """
         resolved_api_key = api_key if api_key is not None else get_api_key_from_env()
         if resolved_api_key is None:
@@ -52,15 +70,97 @@ class BaseClient(ABC):
 
         self._api_key = resolved_api_key
         self._base_url = base_url if base_url is not None else DEFAULT_BASE_URL
-        self._timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+        # Built once here since repr() is used in logs and error reports
+        self._repr = (
+            f"{type(self).__name__}("
+            f"api_key={mask_api_key(resolved_api_key)}, "
+            f"base_url={self._base_url!r})"
+        )
+        self._timeout = resolve_timeout(timeout)
         self._max_retries = (
             max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
         )
 
         if self._max_retries < 0:
             raise ValueError("max_retries must be >= 0")
+        if backoff_strategy not in BACKOFF_STRATEGIES:
+            raise ValueError(
+                "backoff_strategy must be 'exponential_jitter' or 'decorrelated'"
+            )
 
         self._retry_config = DEFAULT_RETRY_CONFIG.with_max_retries(self._max_retries)
+        if backoff_strategy != self._retry_config.backoff_strategy:
+            self._retry_config = replace(
+                self._retry_config, backoff_strategy=backoff_strategy
+            )
+        self._http2 = http2
+
+    @staticmethod
+    def _build_request_kwargs(
+        *,
+        json: dict[str, Any] | None,
+        files: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Build the keyword arguments for an httpx request.
+
+        Args:
+            json: JSON body for the request.
+            files: Files for multipart upload.
+            params: Query parameters.
+            data: Form data for multipart requests.
+
+        Returns:
+            Keyword arguments for the HTTP client's request method.
+        """
+        kwargs: dict[str, Any] = {}
+
+        if params:
+            # Filter out None values
+            kwargs["params"] = {k: v for k, v in params.items() if v is not None}
+
+        if files:
+            # Multipart request - don't use json
+            kwargs["files"] = files
+            if data:
+                kwargs["data"] = data
+        elif json is not None:
+            kwargs["json"] = json
+
+        return kwargs
+
+    def __repr__(self) -> str:
+        return self._repr
+
+
+class BaseClient(_ClientConfigMixin):
+    """Base class for synchronous DocuTray clients.
+
+    Subclasses must implement the context manager protocol.
+    """
+
+    __slots__ = ("_http_client",)
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        max_retries: int | None = None,
+        http2: bool = False,
+        backoff_strategy: BackoffStrategy = "exponential_jitter",
+    ) -> None:
+        """Initialize the client; arguments are described in _ClientConfigMixin."""
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            http2=http2,
+            backoff_strategy=backoff_strategy,
+        )
         self._http_client: SyncHTTPClient | None = None
 
     @property
@@ -72,6 +172,7 @@ class BaseClient(ABC):
                 base_url=self._base_url,
                 timeout=self._timeout,
                 retry_config=self._retry_config,
+                http2=self._http2,
             )
         return self._http_client
 
@@ -98,20 +199,9 @@ class BaseClient(ABC):
         Returns:
             The HTTP response.
         """
-        kwargs: dict[str, Any] = {}
-
-        if params:
-            # Filter out None values
-            kwargs["params"] = {k: v for k, v in params.items() if v is not None}
-
-        if files:
-            # Multipart request - don't use json
-            kwargs["files"] = files
-            if data:
-                kwargs["data"] = data
-        elif json is not None:
-            kwargs["json"] = json
-
+        kwargs = self._build_request_kwargs(
+            json=json, files=files, params=params, data=data
+        )
         return self._http.request(method, path, **kwargs)
 
     def close(self) -> None:
@@ -120,19 +210,10 @@ class BaseClient(ABC):
             self._http_client.close()
             self._http_client = None
 
-    def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}("
-            f"api_key={mask_api_key(self._api_key)}, "
-            f"base_url={self._base_url!r})"
-        )
-
-    @abstractmethod
     def __enter__(self) -> BaseClient:
         """Enter the context manager."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -140,11 +221,16 @@ class BaseClient(ABC):
         exc_tb: object,
     ) -> None:
         """Exit the context manager."""
-        ...
+        raise NotImplementedError
+
 
+class BaseAsyncClient(_ClientConfigMixin):
+    """Base class for asynchronous DocuTray clients.
 
-class BaseAsyncClient(ABC):
-    """Abstract base class for asynchronous DocuTray clients."""
+    Subclasses must implement the async context manager protocol.
+    """
+
+    __slots__ = ("_http_client", "_transport")
 
     def __init__(
         self,
@@ -153,39 +239,24 @@ class BaseAsyncClient(ABC):
         base_url: str | None = None,
         timeout: httpx.Timeout | float | None = None,
         max_retries: int | None = None,
+        http2: bool = False,
+        backoff_strategy: BackoffStrategy = "exponential_jitter",
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the async client.
 
-        Args:
-            api_key: The API key for authentication. If not provided,
-                reads from DOCUTRAY_API_KEY environment variable.
-            base_url: The base URL for API requests.
-            timeout: Request timeout configuration. Can be a single float
-                (seconds) or an httpx.Timeout for granular control.
-            max_retries: Maximum number of retry attempts for failed requests.
-                Defaults to 2.
-
-        Raises:
-            AuthenticationError: If no API key is provided or found.
+        ``transport`` replaces the shared connection pool; the other
+        arguments are described in _ClientConfigMixin.
         """
-        resolved_api_key = api_key if api_key is not None else get_api_key_from_env()
-        if resolved_api_key is None:
-            raise make_authentication_error(
-                "No API key provided. Either pass api_key to the constructor "
-                "or set the DOCUTRAY_API_KEY environment variable."
-            )
-
-        self._api_key = resolved_api_key
-        self._base_url = base_url if base_url is not None else DEFAULT_BASE_URL
-        self._timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
-        self._max_retries = (
-            max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            http2=http2,
+            backoff_strategy=backoff_strategy,
         )
-
-        if self._max_retries < 0:
-            raise ValueError("max_retries must be >= 0")
-
-        self._retry_config = DEFAULT_RETRY_CONFIG.with_max_retries(self._max_retries)
+        self._transport = transport
         self._http_client: AsyncHTTPClient | None = None
 
     @property
@@ -197,6 +268,8 @@ class BaseAsyncClient(ABC):
                 base_url=self._base_url,
                 timeout=self._timeout,
                 retry_config=self._retry_config,
+                http2=self._http2,
+                transport=self._transport,
             )
         return self._http_client
 
@@ -223,20 +296,9 @@ class BaseAsyncClient(ABC):
         Returns:
             The HTTP response.
         """
-        kwargs: dict[str, Any] = {}
-
-        if params:
-            # Filter out None values
-            kwargs["params"] = {k: v for k, v in params.items() if v is not None}
-
-        if files:
-            # Multipart request - don't use json
-            kwargs["files"] = files
-            if data:
-                kwargs["data"] = data
-        elif json is not None:
-            kwargs["json"] = json
-
+        kwargs = self._build_request_kwargs(
+            json=json, files=files, params=params, data=data
+        )
         return await self._http.request(method, path, **kwargs)
 
     async def close(self) -> None:
@@ -245,19 +307,10 @@ class BaseAsyncClient(ABC):
             await self._http_client.close()
             self._http_client = None
 
-    def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}("
-            f"api_key={mask_api_key(self._api_key)}, "
-            f"base_url={self._base_url!r})"
-        )
-
-    @abstractmethod
     async def __aenter__(self) -> BaseAsyncClient:
         """Enter the async context manager."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -265,4 +318,4 @@ class BaseAsyncClient(ABC):
         exc_tb: object,
     ) -> None:
         """Exit the async context manager."""
-        ...
+        raise NotImplementedError
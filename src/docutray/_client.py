@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
+from collections.abc import Awaitable
 from functools import cached_property
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
 import httpx
 from typing_extensions import Self
 
 from ._base_client import BaseAsyncClient, BaseClient
-from .resources.convert import AsyncConvert, Convert
-from .resources.document_types import AsyncDocumentTypes, DocumentTypes
-from .resources.identify import AsyncIdentify, Identify
-from .resources.knowledge_bases import AsyncKnowledgeBases, KnowledgeBases
-from .resources.steps import AsyncSteps, Steps
+from ._constants import DEFAULT_MAX_CONCURRENCY, BackoffStrategy
+
+if TYPE_CHECKING:
+    # Resource modules are imported on first access to keep `import docutray` light
+    from .resources.convert import AsyncConvert, Convert
+    from .resources.document_types import AsyncDocumentTypes, DocumentTypes
+    from .resources.identify import AsyncIdentify, Identify
+    from .resources.knowledge_bases import AsyncKnowledgeBases, KnowledgeBases
+    from .resources.steps import AsyncSteps, Steps
+
+T = TypeVar("T")
 
 
 class Client(BaseClient):
@@ -44,6 +55,11 @@ class Client(BaseClient):
         max_retries: Maximum number of retry attempts for failed requests.
             Retries use exponential backoff with jitter.
             Defaults to 2.
+        http2: Whether to enable HTTP/2. Requires the ``h2`` package
+            (``pip install docutray[http2]``). Defaults to False.
+        backoff_strategy: How delays between retries are chosen.
+            "exponential_jitter" (default) or "decorrelated", which spreads
+            out retries from many clients hitting the same rate limit.
     """
 
     def __init__(
@@ -53,6 +69,8 @@ class Client(BaseClient):
         base_url: str | None = None,
         timeout: httpx.Timeout | float | None = None,
         max_retries: int | None = None,
+        http2: bool = False,
+        backoff_strategy: BackoffStrategy = "exponential_jitter",
     ) -> None:
         """Initialize the synchronous client."""
         super().__init__(
@@ -60,6 +78,8 @@ class Client(BaseClient):
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            http2=http2,
+            backoff_strategy=backoff_strategy,
         )
 
     @cached_property
@@ -72,6 +92,8 @@ class Client(BaseClient):
             ...     document_type_code="invoice"
             ... )
         """
+        from .resources.convert import Convert
+
         return Convert(self)
 
     @cached_property
@@ -82,6 +104,8 @@ class Client(BaseClient):
             >>> result = client.identify.run(file=Path("document.pdf"))
             >>> print(f"Type: {result.document_type.name}")
         """
+        from .resources.identify import Identify
+
         return Identify(self)
 
     @cached_property
@@ -93,6 +117,8 @@ class Client(BaseClient):
             >>> for t in types.data:
             ...     print(t.name)
         """
+        from .resources.document_types import DocumentTypes
+
         return DocumentTypes(self)
 
     @cached_property
@@ -105,6 +131,8 @@ class Client(BaseClient):
             ...     file=Path("document.pdf")
             ... )
         """
+        from .resources.steps import Steps
+
         return Steps(self)
 
     @cached_property
@@ -119,6 +147,8 @@ class Client(BaseClient):
             >>> for item in results.data:
             ...     print(f"{item.similarity:.2%}: {item.document.content}")
         """
+        from .resources.knowledge_bases import KnowledgeBases
+
         return KnowledgeBases(self)
 
     def __enter__(self) -> Self:
@@ -161,6 +191,14 @@ class AsyncClient(BaseAsyncClient):
         max_retries: Maximum number of retry attempts for failed requests.
             Retries use exponential backoff with jitter.
             Defaults to 2.
+        http2: Whether to enable HTTP/2. Requires the ``h2`` package
+            (``pip install docutray[http2]``). Defaults to False.
+        backoff_strategy: How delays between retries are chosen.
+            "exponential_jitter" (default) or "decorrelated", which spreads
+            out retries from many clients hitting the same rate limit.
+        transport: An ``httpx.AsyncBaseTransport`` to send requests through
+            instead of the shared connection pool, for example an
+            aiohttp-backed transport. The client does not close it.
     """
 
     def __init__(
@@ -170,6 +208,9 @@ class AsyncClient(BaseAsyncClient):
         base_url: str | None = None,
         timeout: httpx.Timeout | float | None = None,
         max_retries: int | None = None,
+        http2: bool = False,
+        backoff_strategy: BackoffStrategy = "exponential_jitter",
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the asynchronous client."""
         super().__init__(
@@ -177,6 +218,9 @@ class AsyncClient(BaseAsyncClient):
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            http2=http2,
+            backoff_strategy=backoff_strategy,
+            transport=transport,
         )
 
     @cached_property
@@ -189,6 +233,8 @@ class AsyncClient(BaseAsyncClient):
             ...     document_type_code="invoice"
             ... )
         """
+        from .resources.convert import AsyncConvert
+
         return AsyncConvert(self)
 
     @cached_property
@@ -199,6 +245,8 @@ class AsyncClient(BaseAsyncClient):
             >>> result = await client.identify.run(file=Path("document.pdf"))
             >>> print(f"Type: {result.document_type.name}")
         """
+        from .resources.identify import AsyncIdentify
+
         return AsyncIdentify(self)
 
     @cached_property
@@ -210,6 +258,8 @@ class AsyncClient(BaseAsyncClient):
             >>> for t in types.data:
             ...     print(t.name)
         """
+        from .resources.document_types import AsyncDocumentTypes
+
         return AsyncDocumentTypes(self)
 
     @cached_property
@@ -222,6 +272,8 @@ class AsyncClient(BaseAsyncClient):
             ...     file=Path("document.pdf")
             ... )
         """
+        from .resources.steps import AsyncSteps
+
         return AsyncSteps(self)
 
     @cached_property
@@ -236,8 +288,72 @@ class AsyncClient(BaseAsyncClient):
             >>> for item in results.data:
             ...     print(f"{item.similarity:.2%}: {item.document.content}")
         """
+        from .resources.knowledge_bases import AsyncKnowledgeBases
+
         return AsyncKnowledgeBases(self)
 
+    @overload
+    async def gather(
+        self,
+        *aws: Awaitable[T],
+        max_concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[T]: ...
+
+    @overload
+    async def gather(
+        self,
+        *aws: Awaitable[T],
+        max_concurrency: int = ...,
+        return_exceptions: bool,
+    ) -> list[T | BaseException]: ...
+
+    async def gather(
+        self,
+        *aws: Awaitable[Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Run several API calls concurrently with bounded concurrency.
+
+        Requests share this client's connection pool; at most
+        ``max_concurrency`` of them are in flight at any time.
+
+        Args:
+            *aws: Awaitables to run, typically resource calls such as
+                ``client.convert.run(...)``.
+            max_concurrency: Maximum number of awaitables running at once.
+            return_exceptions: If True, exceptions are returned in the result
+                list instead of being raised.
+
+        Returns:
+            The results in the same order as the awaitables.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+
+        Example:
+            >>> results = await client.gather(
+            ...     *(client.identify.run(file=path) for path in paths),
+            ...     max_concurrency=8,
+            ... )
+        """
+        if max_concurrency < 1:
+            for aw in aws:
+                if asyncio.iscoroutine(aw):
+                    aw.close()
+            raise ValueError("max_concurrency must be >= 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(
+            *(run(aw) for aw in aws), return_exceptions=return_exceptions
+        )
+
     async def __aenter__(self) -> Self:
         """Enter the async context manager.
 
@@ -254,3 +370,45 @@ class AsyncClient(BaseAsyncClient):
     ) -> None:
         """Exit the async context manager and close the client."""
         await self.close()
+
+
+_default_client: Client | None = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> Client:
+    """Get the process-wide default client.
+
+    The client is created on first use from the DOCUTRAY_API_KEY environment
+    variable and closed automatically at interpreter exit. Libraries that
+    only need a plain client can use it instead of building their own.
+
+    Returns:
+        The shared Client instance.
+
+    Raises:
+        AuthenticationError: If DOCUTRAY_API_KEY is not set.
+
+    Example:
+        >>> from docutray import get_default_client
+        >>> result = get_default_client().convert.run(
+        ...     file=Path("invoice.pdf"),
+        ...     document_type_code="invoice"
+        ... )
+    """
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+def _close_default_client() -> None:
+    """Close the default client at interpreter exit."""
+    if _default_client is not None:
+        _default_client.close()
+
+
+atexit.register(_close_default_client)
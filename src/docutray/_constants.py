@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from typing import Literal
 
 import httpx
 
@@ -23,6 +25,16 @@ DEFAULT_TIMEOUT = httpx.Timeout(
 # For backward compatibility
 DEFAULT_TIMEOUT_SECONDS = 60.0
 
+# Connection pool limits for the transport shared by all clients. Idle
+# connections are kept for 30s (httpx defaults to 5s) so that polling loops
+# and page iteration reuse them between requests.
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+
 # Retry Configuration
 DEFAULT_MAX_RETRIES = 2
 INITIAL_RETRY_DELAY = 0.5  # seconds
@@ -34,6 +46,13 @@ JITTER_MAX = 0.5  # 50% of delay
 # HTTP status codes that should trigger a retry
 RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
+# How retry delays are chosen: "exponential_jitter" adds a random fraction to
+# a capped exponential delay; "decorrelated" draws each delay between the
+# initial delay and three times the previous one, so that clients failing at
+# the same moment do not retry in lockstep
+BackoffStrategy = Literal["exponential_jitter", "decorrelated"]
+BACKOFF_STRATEGIES: frozenset[str] = frozenset({"exponential_jitter", "decorrelated"})
+
 
 @dataclass(frozen=True)
 class RetryConfig:
@@ -47,6 +66,10 @@ class RetryConfig:
         jitter_min: Minimum jitter as fraction of delay (0.0-1.0).
         jitter_max: Maximum jitter as fraction of delay (0.0-1.0).
         retryable_status_codes: HTTP status codes that should trigger a retry.
+        backoff_strategy: How delays between retries are chosen, either
+            "exponential_jitter" or "decorrelated".
+        delays: Backoff delay before jitter for each attempt, computed from
+            the other fields.
     """
 
     max_retries: int = DEFAULT_MAX_RETRIES
@@ -56,6 +79,29 @@ class RetryConfig:
     jitter_min: float = JITTER_MIN
     jitter_max: float = JITTER_MAX
     retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+    backoff_strategy: BackoffStrategy = "exponential_jitter"
+    delays: tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Status codes are checked on every error response; accept any
+        # iterable but store a frozenset for constant-time membership tests
+        if not isinstance(self.retryable_status_codes, frozenset):
+            object.__setattr__(
+                self, "retryable_status_codes", frozenset(self.retryable_status_codes)
+            )
+        # Precompute the capped exponential schedule; the retry loop then
+        # only has to look up the base delay and add jitter.
+        object.__setattr__(
+            self,
+            "delays",
+            tuple(
+                min(
+                    self.initial_delay * (self.exponential_base**attempt),
+                    self.max_delay,
+                )
+                for attempt in range(self.max_retries + 1)
+            ),
+        )
 
     def with_max_retries(self, max_retries: int) -> RetryConfig:
         """Create a new config with a different max_retries value.
@@ -64,8 +110,12 @@ class RetryConfig:
             max_retries: The new maximum number of retries.
 
         Returns:
-            A new RetryConfig with the updated value.
+            A RetryConfig with the updated value. Since the config is frozen,
+            this instance is returned as-is when the value is unchanged.
         """
+        if max_retries == self.max_retries:
+            return self
+
         return RetryConfig(
             max_retries=max_retries,
             initial_delay=self.initial_delay,
@@ -74,12 +124,23 @@ class RetryConfig:
             jitter_min=self.jitter_min,
             jitter_max=self.jitter_max,
             retryable_status_codes=self.retryable_status_codes,
+            backoff_strategy=self.backoff_strategy,
         )
 
 
 # Default retry configuration
 DEFAULT_RETRY_CONFIG = RetryConfig()
 
+# Maximum number of requests AsyncClient.gather() keeps in flight
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Threads shared by wait_for_many_completions(); pollers mostly sleep, so
+# this bounds how many jobs are watched at once rather than CPU use
+DEFAULT_POLL_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # Async Polling Configuration
 DEFAULT_POLL_INTERVAL = 2.0  # seconds between status checks
 DEFAULT_POLL_TIMEOUT = 300.0  # 5 minutes total timeout
+DEFAULT_POLL_BACKOFF_FACTOR = 1.0  # multiplier applied to the interval after each poll
+DEFAULT_POLL_JITTER = 0.0  # random +/- fraction applied to each poll interval
+DEFAULT_MAX_POLL_INTERVAL = 30.0  # seconds, cap for backoff when not specified
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 import httpx
 
+from ._utils import json_loads
+
 
 class DocuTrayError(Exception):
     """Base exception for all DocuTray SDK errors."""
@@ -16,11 +19,17 @@ class DocuTrayError(Exception):
         Args:
             message: The error message.
         """
-        self.message = message
         super().__init__(message)
 
-    def __str__(self) -> str:
-        return self.message
+    @property
+    def message(self) -> str:
+        """The error message, read from the exception args."""
+        return self.args[0] if self.args else ""
+
+    @message.setter
+    def message(self, value: str) -> None:
+        # Rewrite args so str(exc) keeps matching the message
+        self.args = (value, *self.args[1:])
 
 
 class APIConnectionError(DocuTrayError):
@@ -53,6 +62,42 @@ class APITimeoutError(APIConnectionError):
         super().__init__(message, should_retry=True)
 
 
+def _get_header(headers: Mapping[str, str] | None, name: str) -> str | None:
+    """Look up a header case-insensitively.
+
+    Args:
+        headers: Response headers, either ``httpx.Headers`` or a plain mapping.
+        name: Lowercase header name.
+
+    Returns:
+        The header value, or None if not present.
+    """
+    if not headers:
+        return None
+    if isinstance(headers, httpx.Headers):
+        value: str | None = headers.get(name)
+        return value
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _parse_float(value: Any) -> float | None:
+    """Convert a header or body value to float, returning None if invalid."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _int_or_none(value: Any) -> int | None:
+    """Return value if it is an int, otherwise None."""
+    return value if isinstance(value, int) else None
+
+
 class APIError(DocuTrayError):
     """Base class for errors returned by the API.
 
@@ -67,7 +112,7 @@ class APIError(DocuTrayError):
         status_code: int,
         request_id: str | None = None,
         body: Any | None = None,
-        headers: dict[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> None:
         """Initialize the API error.
 
@@ -76,13 +121,14 @@ class APIError(DocuTrayError):
             status_code: HTTP status code from the response.
             request_id: Request ID from X-Request-ID header for debugging.
             body: Parsed JSON response body (can be any JSON type).
-            headers: Response headers.
+            headers: Response headers. ``raise_for_status`` passes the
+                response's case-insensitive ``httpx.Headers`` without copying.
         """
         super().__init__(message)
         self.status_code = status_code
         self.request_id = request_id
         self.body = body
-        self.headers = headers or {}
+        self.headers: Mapping[str, str] = headers if headers is not None else {}
 
     def __repr__(self) -> str:
         return (
@@ -141,6 +187,53 @@ class RateLimitError(APIError):
     `remaining`, and `reset_time` properties when provided by the API.
     """
 
+    __slots__ = (
+        "_retry_after",
+        "_limit_type",
+        "_limit",
+        "_remaining",
+        "_reset_time",
+    )
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int,
+        request_id: str | None = None,
+        body: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize the rate limit error and parse its details once.
+
+        Args:
+            message: Human-readable error description.
+            status_code: HTTP status code from the response.
+            request_id: Request ID from X-Request-ID header for debugging.
+            body: Parsed JSON response body (can be any JSON type).
+            headers: Response headers.
+        """
+        super().__init__(
+            message,
+            status_code=status_code,
+            request_id=request_id,
+            body=body,
+            headers=headers,
+        )
+        body_dict = body if isinstance(body, dict) else {}
+
+        retry_after_value = _get_header(headers, "retry-after")
+        if retry_after_value is None and headers:
+            # Also check body for retryAfter field
+            retry_after_value = body_dict.get("retryAfter")
+        self._retry_after = _parse_float(retry_after_value)
+
+        limit_type = body_dict.get("limitType")
+        self._limit_type = limit_type if isinstance(limit_type, str) else None
+        self._limit = _int_or_none(body_dict.get("limit"))
+        self._remaining = _int_or_none(body_dict.get("remaining"))
+        self._reset_time = _int_or_none(body_dict.get("resetTime"))
+
     @property
     def retry_after(self) -> float | None:
         """Get the recommended wait time in seconds from Retry-After header.
@@ -148,31 +241,7 @@ class RateLimitError(APIError):
         Returns:
             The number of seconds to wait before retrying, or None if not specified.
         """
-        if not self.headers:
-            return None
-
-        # Case-insensitive header lookup
-        retry_after_value: str | None = None
-        for key, value in self.headers.items():
-            if key.lower() == "retry-after":
-                retry_after_value = value
-                break
-
-        if retry_after_value is None:
-            # Also check body for retryAfter field
-            if isinstance(self.body, dict):
-                body_retry = self.body.get("retryAfter")
-                if body_retry is not None:
-                    try:
-                        return float(body_retry)
-                    except (ValueError, TypeError):
-                        pass
-            return None
-
-        try:
-            return float(retry_after_value)
-        except (ValueError, TypeError):
-            return None
+        return self._retry_after
 
     @property
     def limit_type(self) -> str | None:
@@ -181,11 +250,7 @@ class RateLimitError(APIError):
         Returns:
             The limit type as a string, or None if not specified or not a string.
         """
-        if isinstance(self.body, dict):
-            limit_type_val = self.body.get("limitType")
-            if isinstance(limit_type_val, str):
-                return limit_type_val
-        return None
+        return self._limit_type
 
     @property
     def limit(self) -> int | None:
@@ -194,11 +259,7 @@ class RateLimitError(APIError):
         Returns:
             The limit value, or None if not specified.
         """
-        if isinstance(self.body, dict):
-            limit_val = self.body.get("limit")
-            if isinstance(limit_val, int):
-                return limit_val
-        return None
+        return self._limit
 
     @property
     def remaining(self) -> int | None:
@@ -207,11 +268,7 @@ class RateLimitError(APIError):
         Returns:
             The remaining requests, or None if not specified.
         """
-        if isinstance(self.body, dict):
-            remaining_val = self.body.get("remaining")
-            if isinstance(remaining_val, int):
-                return remaining_val
-        return None
+        return self._remaining
 
     @property
     def reset_time(self) -> int | None:
@@ -220,11 +277,7 @@ class RateLimitError(APIError):
         Returns:
             Unix timestamp when limit resets, or None if not specified.
         """
-        if isinstance(self.body, dict):
-            reset_val = self.body.get("resetTime")
-            if isinstance(reset_val, int):
-                return reset_val
-        return None
+        return self._reset_time
 
 
 class InternalServerError(APIError):
@@ -280,34 +333,39 @@ def raise_for_status(response: httpx.Response) -> None:
         return
 
     status_code = response.status_code
-    request_id = response.headers.get("X-Request-ID") or response.headers.get(
-        "x-request-id"
-    )
-    headers = dict(response.headers)
+    # httpx.Headers lookups are already case-insensitive
+    headers = response.headers
+    request_id = headers.get("x-request-id")
 
     # Try to parse JSON body for error message
     body: Any | None = None
-    message: str = response.text or f"HTTP {status_code}"
+    message: str | None = None
 
-    try:
-        body = response.json()
-    except (ValueError, TypeError):
-        # JSON parsing failed, use text response
-        pass
-    else:
-        # JSON parsed successfully, try to extract message if it's a dict
-        if isinstance(body, dict):
-            extracted_message = (
-                (
-                    body.get("error", {}).get("message")
-                    if isinstance(body.get("error"), dict)
-                    else None
+    # Skip the JSON parser for bodies declared as something else, such as
+    # the HTML error pages returned by proxies on 502/504
+    content_type = headers.get("content-type")
+    # Media types are case-insensitive
+    if content_type is None or "json" in content_type.lower():
+        try:
+            body = json_loads(response.content)
+        except (ValueError, TypeError):
+            # JSON parsing failed, use text response
+            pass
+        else:
+            # JSON parsed successfully, try to extract message if it's a dict
+            if isinstance(body, dict):
+                error = body.get("error")
+                extracted_message = (
+                    (error.get("message") if isinstance(error, dict) else None)
+                    or body.get("message")
+                    or body.get("detail")
                 )
-                or body.get("message")
-                or body.get("detail")
-            )
-            if extracted_message:
-                message = str(extracted_message)
+                if extracted_message:
+                    message = str(extracted_message)
+
+    if message is None:
+        # Only decode the body as text when no message was found in the JSON
+        message = response.text or f"HTTP {status_code}"
 
     # Get the appropriate exception class
     exc_class = STATUS_CODE_TO_EXCEPTION.get(status_code)
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import base64
 import mimetypes
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import IO, Any
@@ -13,12 +16,36 @@ from ._types import (
     EXTENSION_TO_CONTENT_TYPE,
     FileInput,
 )
+from ._utils import json_dumps
 
 # Note: The DocuTray API uses "image" as the field name for all document uploads,
 # regardless of whether the document is an actual image or a PDF. This naming
 # convention is part of the API specification.
 _UPLOAD_FIELD_NAME = "image"
 
+# Read size when base64-encoding files; a multiple of 3 so that each chunk
+# encodes without padding
+_BASE64_CHUNK_SIZE = 3 * 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _content_type_for_suffix(suffix: str) -> str:
+    """Map a file suffix to a content type, caching the result per suffix.
+
+    Args:
+        suffix: The file suffix including the dot, e.g. ``.pdf``.
+
+    Returns:
+        The content type, or application/octet-stream if unknown.
+    """
+    content_type = EXTENSION_TO_CONTENT_TYPE.get(suffix.lower())
+    if content_type is not None:
+        return content_type
+
+    # Fall back to mimetypes library
+    mime_type, _ = mimetypes.guess_type(f"document{suffix}")
+    return mime_type or "application/octet-stream"
+
 
 def detect_content_type(path: Path) -> str:
     """Detect content type from file extension.
@@ -29,18 +56,15 @@ def detect_content_type(path: Path) -> str:
     Returns:
         The detected content type, or application/octet-stream if unknown.
     """
-    suffix = path.suffix.lower()
-    if suffix in EXTENSION_TO_CONTENT_TYPE:
-        return EXTENSION_TO_CONTENT_TYPE[suffix]
-
-    # Fall back to mimetypes library
-    mime_type, _ = mimetypes.guess_type(str(path))
-    return mime_type or "application/octet-stream"
+    return _content_type_for_suffix(path.suffix)
 
 
 class FileUpload:
     """Result of preparing a file for multipart upload.
 
+    Use it as a context manager around the request so that files opened by
+    the SDK are closed once the upload is done.
+
     Attributes:
         files: Dictionary for httpx files parameter.
         content_type: The detected or provided content type.
@@ -50,9 +74,29 @@ class FileUpload:
         self,
         files: dict[str, tuple[str, Any, str]],
         content_type: str,
+        *,
+        owned_file: IO[bytes] | None = None,
     ) -> None:
         self.files: dict[str, tuple[str, Any, str]] = files
         self.content_type = content_type
+        self._owned_file = owned_file
+
+    def close(self) -> None:
+        """Close the file handle if it was opened by the SDK."""
+        if self._owned_file is not None:
+            self._owned_file.close()
+            self._owned_file = None
+
+    def __enter__(self) -> FileUpload:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        self.close()
 
 
 def prepare_file_upload(
@@ -64,6 +108,10 @@ def prepare_file_upload(
     """Prepare a file for multipart upload.
 
     Note:
+        A Path is opened rather than read into memory, so httpx streams it
+        from disk. Close the returned FileUpload (or use it in a ``with``
+        block) to release the handle.
+
         When passing a file-like object (BinaryIO), be aware that:
         - The object will be read during the request (consumed)
         - The SDK does not close user-provided file objects
@@ -80,10 +128,11 @@ def prepare_file_upload(
     file_obj: IO[bytes]
     detected_filename: str
     detected_content_type: str
+    owned_file: IO[bytes] | None = None
 
     if isinstance(file, Path):
-        # Read file from path
-        file_obj = BytesIO(file.read_bytes())
+        # Stream from disk; httpx rewinds the handle if the request is retried
+        file_obj = owned_file = file.open("rb")
         detected_filename = file.name
         detected_content_type = content_type or detect_content_type(file)
     elif isinstance(file, bytes):
@@ -98,8 +147,8 @@ def prepare_file_upload(
         detected_filename = filename or (
             file_name_attr if isinstance(file_name_attr, str) else "document"
         )
-        if "/" in detected_filename:
-            detected_filename = detected_filename.rsplit("/", 1)[-1]
+        # Keep only the basename of a path-like name
+        detected_filename = detected_filename.rpartition("/")[2]
         detected_content_type = content_type or CONTENT_TYPE_PDF
 
     # Use provided overrides
@@ -107,7 +156,9 @@ def prepare_file_upload(
     final_content_type = content_type or detected_content_type
 
     files = {_UPLOAD_FIELD_NAME: (final_filename, file_obj, final_content_type)}
-    return FileUpload(files=files, content_type=final_content_type)
+    return FileUpload(
+        files=files, content_type=final_content_type, owned_file=owned_file
+    )
 
 
 def prepare_url_upload(
@@ -157,6 +208,56 @@ def prepare_base64_upload(
     return result
 
 
+@contextmanager
+def prepare_document_request(
+    *,
+    file: FileInput | None,
+    url: str | None,
+    file_base64: str | None,
+    content_type: str | None,
+    fields: dict[str, Any],
+) -> Iterator[dict[str, Any]]:
+    """Build the request arguments for a document given as file, URL or base64.
+
+    A file is sent as a multipart upload, with non-string ``fields``
+    JSON-encoded as form data; a URL or base64 string is sent as a JSON body
+    with ``fields`` merged in. Keep the request inside the ``with`` block so
+    that files opened by the SDK stay open until it is sent.
+
+    Args:
+        file: File to upload (Path, bytes, or file-like object).
+        url: URL of the document (alternative to file).
+        file_base64: Base64-encoded document (alternative to file).
+        content_type: Content type override.
+        fields: Extra request fields, e.g. the document type code.
+
+    Yields:
+        Keyword arguments (``files`` and ``data``, or ``json``) for the
+        client's request method.
+
+    Raises:
+        ValueError: If none of file, url or file_base64 is provided.
+    """
+    if file is not None:
+        with prepare_file_upload(file, content_type=content_type) as upload:
+            # Multipart form data requires JSON-stringified values
+            data = {
+                key: value if isinstance(value, str) else json_dumps(value)
+                for key, value in fields.items()
+            }
+            yield {"files": upload.files, "data": data}
+        return
+
+    if url is not None:
+        body = prepare_url_upload(url, content_type=content_type)
+    elif file_base64 is not None:
+        body = prepare_base64_upload(file_base64, content_type=content_type)
+    else:
+        raise ValueError("Must provide one of: file, url, or file_base64")
+    body.update(fields)
+    yield {"json": body}
+
+
 def encode_file_to_base64(file: FileInput) -> str:
     """Encode a file to base64 string.
 
@@ -166,12 +267,39 @@ def encode_file_to_base64(file: FileInput) -> str:
     Returns:
         Base64-encoded string of the file contents.
     """
+    if isinstance(file, bytes):
+        return base64.b64encode(file).decode("ascii")
+
     if isinstance(file, Path):
-        data = file.read_bytes()
-    elif isinstance(file, bytes):
-        data = file
-    else:
-        # File-like object
-        data = file.read()
+        with file.open("rb") as fh:
+            return _encode_stream_to_base64(fh)
+
+    # File-like object
+    return _encode_stream_to_base64(file)
+
+
+def _encode_stream_to_base64(stream: IO[bytes]) -> str:
+    """Base64-encode a binary stream in chunks.
+
+    Only one chunk of the input is held in memory at a time, instead of the
+    whole file plus its encoded copy.
 
-    return base64.b64encode(data).decode("ascii")
+    Args:
+        stream: Binary stream to read until EOF.
+
+    Returns:
+        Base64-encoded string of the stream contents.
+    """
+    parts: list[str] = []
+    pending = b""
+    while chunk := stream.read(_BASE64_CHUNK_SIZE):
+        if pending:
+            chunk = pending + chunk
+        # Short reads can leave a chunk that is not a multiple of 3; carry
+        # the remainder over so padding only appears at the end
+        cut = len(chunk) - len(chunk) % 3
+        parts.append(base64.b64encode(memoryview(chunk)[:cut]).decode("ascii"))
+        pending = chunk[cut:]
+    if pending:
+        parts.append(base64.b64encode(pending).decode("ascii"))
+    return "".join(parts)
@@ -7,11 +7,15 @@ import logging
 import os
 import random
 import time
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 
 from ._constants import (
+    DEFAULT_LIMITS,
     DEFAULT_RETRY_CONFIG,
     DEFAULT_TIMEOUT,
     ENV_VAR_LOG,
@@ -22,11 +26,23 @@ from ._exceptions import (
     APITimeoutError,
     raise_for_status,
 )
+from ._http_transport import (
+    env_proxies_configured,
+    get_shared_async_transport,
+    get_shared_sync_transport,
+    wrap_async_transport,
+)
 from ._version import __version__
 
 # Configure logger
 logger = logging.getLogger("docutray")
 
+# Default headers that do not depend on the API key
+_STATIC_HEADERS: dict[str, str] = {
+    "User-Agent": f"docutray-python/{__version__}",
+    "Accept": "application/json",
+}
+
 
 def _is_logging_enabled() -> bool:
     """Check if logging is enabled via environment variable.
@@ -38,14 +54,17 @@ def _is_logging_enabled() -> bool:
     return log_value in ("1", "true", "yes", "on", "debug")
 
 
-def build_headers(api_key: str) -> dict[str, str]:
+@lru_cache(maxsize=8)
+def build_headers(api_key: str) -> Mapping[str, str]:
     """Build the default headers for API requests.
 
+    The result is cached per API key, so it is returned as a read-only mapping.
+
     Args:
         api_key: The API key for authentication.
 
     Returns:
-        Dictionary of HTTP headers.
+        Read-only mapping of HTTP headers.
 
     Note:
         Content-Type is NOT included here because httpx automatically sets
@@ -54,11 +73,7 @@ def build_headers(api_key: str) -> dict[str, str]:
         - multipart/form-data with boundary for files= parameter
         Setting Content-Type explicitly would break multipart uploads.
     """
-    return {
-        "Authorization": f"Bearer {api_key}",
-        "User-Agent": f"docutray-python/{__version__}",
-        "Accept": "application/json",
-    }
+    return MappingProxyType({"Authorization": f"Bearer {api_key}", **_STATIC_HEADERS})
 
 
 def calculate_delay(
@@ -78,11 +93,14 @@ def calculate_delay(
     Returns:
         The delay in seconds before the next retry.
     """
-    # Calculate exponential backoff
-    delay = min(
-        config.initial_delay * (config.exponential_base**attempt),
-        config.max_delay,
-    )
+    # Exponential backoff, precomputed by RetryConfig for the attempts it allows
+    if attempt < len(config.delays):
+        delay = config.delays[attempt]
+    else:
+        delay = min(
+            config.initial_delay * (config.exponential_base**attempt),
+            config.max_delay,
+        )
 
     # Add jitter (random factor between jitter_min and jitter_max of delay)
     jitter_factor = random.uniform(config.jitter_min, config.jitter_max)
@@ -95,6 +113,48 @@ def calculate_delay(
     return delay
 
 
+def calculate_delay_decorrelated(
+    previous_delay: float,
+    config: RetryConfig,
+    retry_after: float | None = None,
+) -> float:
+    """Calculate the delay before the next retry using decorrelated jitter.
+
+    Each delay is drawn between ``initial_delay`` and three times the previous
+    delay, capped at ``max_delay``, so clients that failed together spread
+    their retries out instead of colliding again.
+
+    Args:
+        previous_delay: The delay used before the previous attempt, or
+            ``initial_delay`` before the first retry.
+        config: The retry configuration.
+        retry_after: Optional Retry-After value from the server (in seconds).
+
+    Returns:
+        The delay in seconds before the next retry.
+    """
+    upper = max(previous_delay, config.initial_delay) * 3
+    delay = min(config.max_delay, random.uniform(config.initial_delay, upper))
+
+    # Respect Retry-After header if provided
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+
+    return delay
+
+
+def _next_delay(
+    attempt: int,
+    config: RetryConfig,
+    previous_delay: float,
+    retry_after: float | None = None,
+) -> float:
+    """Pick the retry delay according to the config's backoff strategy."""
+    if config.backoff_strategy == "decorrelated":
+        return calculate_delay_decorrelated(previous_delay, config, retry_after)
+    return calculate_delay(attempt, config, retry_after)
+
+
 def should_retry(
     attempt: int,
     config: RetryConfig,
@@ -130,23 +190,127 @@ def should_retry(
 def _get_retry_after(response: httpx.Response) -> float | None:
     """Extract Retry-After header value from response.
 
+    The non-standard ``retry-after-ms`` header is checked first since it
+    carries millisecond precision.
+
     Args:
         response: The HTTP response.
 
     Returns:
         The Retry-After value in seconds, or None if not present.
     """
-    retry_after = response.headers.get("retry-after") or response.headers.get(
-        "Retry-After"
-    )
+    # httpx.Headers lookups are already case-insensitive
+    headers = response.headers
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
     if retry_after is None:
         return None
     try:
         return float(retry_after)
-    except (ValueError, TypeError):
+    except ValueError:
         return None
 
 
+def _to_connection_error(error: httpx.RequestError) -> APIConnectionError:
+    """Convert an httpx transport error into the SDK's connection error."""
+    if isinstance(error, httpx.TimeoutException):
+        return APITimeoutError(str(error))
+    return APIConnectionError(str(error))
+
+
+class _RetryPlan:
+    """Retry decisions for one request, shared by the sync and async clients.
+
+    The clients only run the request and sleep; this class decides whether a
+    failed attempt is retried, how long to wait, and logs the retry.
+    """
+
+    __slots__ = ("_config", "_logging_enabled", "_previous_delay", "total_attempts")
+
+    def __init__(self, config: RetryConfig, *, logging_enabled: bool) -> None:
+        self._config = config
+        self._logging_enabled = logging_enabled
+        self._previous_delay = config.initial_delay
+        self.total_attempts = config.max_retries + 1
+
+    def delay_after_response(
+        self, attempt: int, response: httpx.Response
+    ) -> float | None:
+        """Get the delay before retrying an error response.
+
+        Args:
+            attempt: The attempt that produced the response (0-indexed).
+            response: The non-success response.
+
+        Returns:
+            The delay in seconds, or None if the response should be raised.
+        """
+        status_code = response.status_code
+        # Same decision as should_retry() for a response, without the call
+        config = self._config
+        if (
+            attempt >= config.max_retries
+            or status_code not in config.retryable_status_codes
+        ):
+            return None
+
+        delay = self._next_delay(attempt, _get_retry_after(response))
+        if self._logging_enabled:
+            logger.warning(
+                "Request failed with status %d, retrying in %.2fs (attempt %d/%d)",
+                status_code,
+                delay,
+                attempt + 1,
+                self.total_attempts,
+            )
+        return delay
+
+    def delay_after_error(
+        self, attempt: int, error: APIConnectionError
+    ) -> float | None:
+        """Get the delay before retrying after a connection error or timeout.
+
+        Args:
+            attempt: The attempt that failed (0-indexed).
+            error: The SDK error the transport failure was converted to.
+
+        Returns:
+            The delay in seconds, or None if the error should be raised.
+        """
+        if not should_retry(attempt, self._config, exception=error):
+            return None
+
+        delay = self._next_delay(attempt)
+        if self._logging_enabled:
+            if isinstance(error, APITimeoutError):
+                logger.warning(
+                    "Request timed out, retrying in %.2fs (attempt %d/%d)",
+                    delay,
+                    attempt + 1,
+                    self.total_attempts,
+                )
+            else:
+                logger.warning(
+                    "Connection error: %s, retrying in %.2fs (attempt %d/%d)",
+                    error.message,
+                    delay,
+                    attempt + 1,
+                    self.total_attempts,
+                )
+        return delay
+
+    def _next_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        delay = _next_delay(attempt, self._config, self._previous_delay, retry_after)
+        self._previous_delay = delay
+        return delay
+
+
 class SyncHTTPClient:
     """Synchronous HTTP client wrapper around httpx with retry support."""
 
@@ -157,6 +321,7 @@ class SyncHTTPClient:
         base_url: str,
         timeout: httpx.Timeout | float | None = None,
         retry_config: RetryConfig | None = None,
+        http2: bool = False,
     ) -> None:
         """Initialize the sync HTTP client.
 
@@ -165,6 +330,7 @@ class SyncHTTPClient:
             base_url: The base URL for API requests.
             timeout: Request timeout configuration.
             retry_config: Configuration for retry behavior.
+            http2: Whether to enable HTTP/2. Requires the ``h2`` package.
         """
         self._api_key = api_key
         self._base_url = base_url
@@ -172,6 +338,9 @@ class SyncHTTPClient:
         self._retry_config = (
             retry_config if retry_config is not None else DEFAULT_RETRY_CONFIG
         )
+        self._http2 = http2
+        # Read DOCUTRAY_LOG once per client rather than on every request
+        self._logging_enabled = _is_logging_enabled()
         self._client: httpx.Client | None = None
 
     def _ensure_client(self) -> httpx.Client:
@@ -185,11 +354,22 @@ class SyncHTTPClient:
                 base_url=self._base_url,
                 headers=build_headers(self._api_key),
                 timeout=self._timeout,
+                # With env proxies httpx builds its own transports and mounts
+                transport=(
+                    None
+                    if env_proxies_configured()
+                    else get_shared_sync_transport(http2=self._http2)
+                ),
+                http2=self._http2,
+                limits=DEFAULT_LIMITS,
             )
         return self._client
 
     def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client.
+
+        The shared connection pool stays open for other clients.
+        """
         if self._client is not None:
             self._client.close()
             self._client = None
@@ -216,86 +396,29 @@ class SyncHTTPClient:
             APIError: If the API returns an error response after all retries.
         """
         client = self._ensure_client()
-        last_exception: Exception | None = None
-        logging_enabled = _is_logging_enabled()
+        plan = _RetryPlan(self._retry_config, logging_enabled=self._logging_enabled)
 
-        for attempt in range(self._retry_config.max_retries + 1):
+        for attempt in range(plan.total_attempts):
             try:
                 response = client.request(method, path, **kwargs)
-
-                # Check for HTTP errors
-                if not response.is_success:
-                    status_code = response.status_code
-
-                    # Check if we should retry
-                    if should_retry(
-                        attempt, self._retry_config, status_code=status_code
-                    ):
-                        retry_after = _get_retry_after(response)
-                        delay = calculate_delay(
-                            attempt, self._retry_config, retry_after
-                        )
-
-                        if logging_enabled:
-                            logger.warning(
-                                "Request failed with status %d, retrying in %.2fs (attempt %d/%d)",
-                                status_code,
-                                delay,
-                                attempt + 1,
-                                self._retry_config.max_retries + 1,
-                            )
-
-                        time.sleep(delay)
-                        continue
-
+            except httpx.RequestError as e:
+                error = _to_connection_error(e)
+                delay = plan.delay_after_error(attempt, error)
+                if delay is None:
+                    raise error from e
+            else:
+                if response.is_success:
+                    return response
+
+                delay = plan.delay_after_response(attempt, response)
+                if delay is None:
                     # Not retryable, raise immediately
                     raise_for_status(response)
+                    return response
 
-                return response
-
-            except httpx.TimeoutException as e:
-                last_exception = APITimeoutError(str(e))
-
-                if should_retry(attempt, self._retry_config, exception=last_exception):
-                    delay = calculate_delay(attempt, self._retry_config)
-
-                    if logging_enabled:
-                        logger.warning(
-                            "Request timed out, retrying in %.2fs (attempt %d/%d)",
-                            delay,
-                            attempt + 1,
-                            self._retry_config.max_retries + 1,
-                        )
-
-                    time.sleep(delay)
-                    continue
-
-                raise last_exception from e
-
-            except httpx.RequestError as e:
-                last_exception = APIConnectionError(str(e))
-
-                if should_retry(attempt, self._retry_config, exception=last_exception):
-                    delay = calculate_delay(attempt, self._retry_config)
-
-                    if logging_enabled:
-                        logger.warning(
-                            "Connection error: %s, retrying in %.2fs (attempt %d/%d)",
-                            str(e),
-                            delay,
-                            attempt + 1,
-                            self._retry_config.max_retries + 1,
-                        )
-
-                    time.sleep(delay)
-                    continue
-
-                raise last_exception from e
-
-        # Should not reach here, but just in case
-        if last_exception is not None:
-            raise last_exception
+            time.sleep(delay)
 
+        # Should not reach here: the last attempt never plans a retry
         raise APIConnectionError("Request failed after all retries")
 
 
@@ -309,6 +432,8 @@ class AsyncHTTPClient:
         base_url: str,
         timeout: httpx.Timeout | float | None = None,
         retry_config: RetryConfig | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the async HTTP client.
 
@@ -317,6 +442,9 @@ class AsyncHTTPClient:
             base_url: The base URL for API requests.
             timeout: Request timeout configuration.
             retry_config: Configuration for retry behavior.
+            http2: Whether to enable HTTP/2. Requires the ``h2`` package.
+            transport: Transport to send requests through instead of the
+                shared connection pool. It is not closed with the client.
         """
         self._api_key = api_key
         self._base_url = base_url
@@ -324,6 +452,10 @@ class AsyncHTTPClient:
         self._retry_config = (
             retry_config if retry_config is not None else DEFAULT_RETRY_CONFIG
         )
+        self._http2 = http2
+        self._transport = transport
+        # Read DOCUTRAY_LOG once per client rather than on every request
+        self._logging_enabled = _is_logging_enabled()
         self._client: httpx.AsyncClient | None = None
 
     def _ensure_client(self) -> httpx.AsyncClient:
@@ -337,11 +469,31 @@ class AsyncHTTPClient:
                 base_url=self._base_url,
                 headers=build_headers(self._api_key),
                 timeout=self._timeout,
+                transport=self._async_transport(),
+                http2=self._http2,
+                limits=DEFAULT_LIMITS,
             )
         return self._client
 
+    def _async_transport(self) -> httpx.AsyncBaseTransport | None:
+        """Pick the transport for the httpx client.
+
+        Returns:
+            The caller's transport, the loop's shared pool, or None to let
+            httpx apply the proxies configured in the environment.
+        """
+        if self._transport is not None:
+            return wrap_async_transport(self._transport)
+        if env_proxies_configured():
+            return None
+        return get_shared_async_transport(http2=self._http2)
+
     async def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client.
+
+        The loop's shared connection pool is closed too once no other client
+        uses it.
+        """
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -368,84 +520,27 @@ class AsyncHTTPClient:
             APIError: If the API returns an error response after all retries.
         """
         client = self._ensure_client()
-        last_exception: Exception | None = None
-        logging_enabled = _is_logging_enabled()
+        plan = _RetryPlan(self._retry_config, logging_enabled=self._logging_enabled)
 
-        for attempt in range(self._retry_config.max_retries + 1):
+        for attempt in range(plan.total_attempts):
             try:
                 response = await client.request(method, path, **kwargs)
-
-                # Check for HTTP errors
-                if not response.is_success:
-                    status_code = response.status_code
-
-                    # Check if we should retry
-                    if should_retry(
-                        attempt, self._retry_config, status_code=status_code
-                    ):
-                        retry_after = _get_retry_after(response)
-                        delay = calculate_delay(
-                            attempt, self._retry_config, retry_after
-                        )
-
-                        if logging_enabled:
-                            logger.warning(
-                                "Request failed with status %d, retrying in %.2fs (attempt %d/%d)",
-                                status_code,
-                                delay,
-                                attempt + 1,
-                                self._retry_config.max_retries + 1,
-                            )
-
-                        await asyncio.sleep(delay)
-                        continue
-
+            except httpx.RequestError as e:
+                error = _to_connection_error(e)
+                delay = plan.delay_after_error(attempt, error)
+                if delay is None:
+                    raise error from e
+            else:
+                if response.is_success:
+                    return response
+
+                delay = plan.delay_after_response(attempt, response)
+                if delay is None:
                     # Not retryable, raise immediately
                     raise_for_status(response)
+                    return response
 
-                return response
-
-            except httpx.TimeoutException as e:
-                last_exception = APITimeoutError(str(e))
-
-                if should_retry(attempt, self._retry_config, exception=last_exception):
-                    delay = calculate_delay(attempt, self._retry_config)
-
-                    if logging_enabled:
-                        logger.warning(
-                            "Request timed out, retrying in %.2fs (attempt %d/%d)",
-                            delay,
-                            attempt + 1,
-                            self._retry_config.max_retries + 1,
-                        )
-
-                    await asyncio.sleep(delay)
-                    continue
-
-                raise last_exception from e
-
-            except httpx.RequestError as e:
-                last_exception = APIConnectionError(str(e))
-
-                if should_retry(attempt, self._retry_config, exception=last_exception):
-                    delay = calculate_delay(attempt, self._retry_config)
-
-                    if logging_enabled:
-                        logger.warning(
-                            "Connection error: %s, retrying in %.2fs (attempt %d/%d)",
-                            str(e),
-                            delay,
-                            attempt + 1,
-                            self._retry_config.max_retries + 1,
-                        )
-
-                    await asyncio.sleep(delay)
-                    continue
-
-                raise last_exception from e
-
-        # Should not reach here, but just in case
-        if last_exception is not None:
-            raise last_exception
+            await asyncio.sleep(delay)
 
+        # Should not reach here: the last attempt never plans a retry
         raise APIConnectionError("Request failed after all retries")
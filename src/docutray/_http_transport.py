@@ -0,0 +1,232 @@
+"""Process-wide shared HTTP transports for the DocuTray SDK.
+
+Every ``Client`` builds its own ``httpx.Client``, but they all send requests
+through one connection pool so that keep-alive connections and TLS sessions
+survive across client instances. Async clients share a pool per event loop,
+since async connections cannot be used from a different loop; that pool is
+closed when the last open client on the loop is closed, so nothing is left
+behind when the loop ends. HTTP/1.1 and HTTP/2 clients use separate pools.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import urllib.request
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from ._constants import DEFAULT_LIMITS
+
+_lock = threading.Lock()
+_shared_sync_transports: dict[bool, httpx.HTTPTransport] = {}
+# Weakly keyed so that loops whose clients were never closed can still be
+# garbage-collected
+_shared_async_transports: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[bool, _LoopPool]
+] = WeakKeyDictionary()
+
+
+class _SharedSyncTransport(httpx.BaseTransport):
+    """Per-client handle on the shared sync transport.
+
+    Closing an ``httpx.Client`` closes its transport, so each client gets
+    this wrapper whose ``close()`` leaves the shared pool open.
+    """
+
+    def __init__(self, transport: httpx.HTTPTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        # The shared pool outlives individual clients
+        pass
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Per-client handle on an async transport passed in by the caller.
+
+    Closing the client leaves the caller's transport open.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # The caller owns the transport
+        pass
+
+
+class _LoopPool:
+    """The shared async transport of one event loop and its open clients."""
+
+    __slots__ = ("transport", "users")
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport) -> None:
+        self.transport = transport
+        self.users = 0
+
+
+class _PooledAsyncTransport(httpx.AsyncBaseTransport):
+    """Per-client handle on the shared async transport of an event loop.
+
+    Closing the last handle of a loop closes the loop's pool, so the
+    connections are released when short-lived clients are closed, e.g.
+    around each ``asyncio.run()``.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, http2: bool, pool: _LoopPool
+    ) -> None:
+        self._loop = loop
+        self._http2 = http2
+        self._pool = pool
+        self._transport = pool.transport
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with _lock:
+            self._pool.users -= 1
+            if self._pool.users > 0:
+                return
+            # shutdown_async() may already have replaced the pool
+            transports = _shared_async_transports.get(self._loop)
+            if transports is not None and transports.get(self._http2) is self._pool:
+                del transports[self._http2]
+                if not transports:
+                    del _shared_async_transports[self._loop]
+        await self._transport.aclose()
+
+
+def env_proxies_configured() -> bool:
+    """Check whether proxies are configured in the environment.
+
+    httpx only applies ``HTTP_PROXY``, ``HTTPS_PROXY``, ``ALL_PROXY`` and
+    ``NO_PROXY`` when a client builds its own transport, so clients skip the
+    shared pool while any of them is set.
+
+    Returns:
+        True if requests should go through httpx's environment proxy setup.
+    """
+    return bool(urllib.request.getproxies())
+
+
+def get_shared_sync_transport(*, http2: bool = False) -> httpx.BaseTransport:
+    """Get a handle on the process-wide sync transport.
+
+    Args:
+        http2: Whether to use the HTTP/2-enabled pool. Requires the ``h2``
+            package (``pip install docutray[http2]``).
+
+    Returns:
+        A transport for ``httpx.Client`` that does not close the shared pool.
+    """
+    with _lock:
+        transport = _shared_sync_transports.get(http2)
+        if transport is None:
+            transport = httpx.HTTPTransport(limits=DEFAULT_LIMITS, http2=http2)
+            _shared_sync_transports[http2] = transport
+        return _SharedSyncTransport(transport)
+
+
+def _forget_closed_loops() -> None:
+    """Drop the pools of event loops that have been closed.
+
+    Pools of loops whose clients were never closed cannot be closed anymore;
+    dropping them lets their connections be garbage-collected. Must be
+    called with ``_lock`` held.
+    """
+    for loop in [loop for loop in _shared_async_transports if loop.is_closed()]:
+        del _shared_async_transports[loop]
+
+
+def get_shared_async_transport(*, http2: bool = False) -> httpx.AsyncBaseTransport:
+    """Get a handle on the shared async transport for the running event loop.
+
+    Args:
+        http2: Whether to use the HTTP/2-enabled pool. Requires the ``h2``
+            package (``pip install docutray[http2]``).
+
+    Returns:
+        A transport for ``httpx.AsyncClient``. Closing it closes the shared
+        pool once no other client on the loop is using it.
+
+    Raises:
+        RuntimeError: If called outside of a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        transports = _shared_async_transports.get(loop)
+        if transports is None:
+            _forget_closed_loops()
+            transports = _shared_async_transports[loop] = {}
+        pool = transports.get(http2)
+        if pool is None:
+            pool = _LoopPool(
+                httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS, http2=http2)
+            )
+            transports[http2] = pool
+        pool.users += 1
+        return _PooledAsyncTransport(loop, http2, pool)
+
+
+def wrap_async_transport(
+    transport: httpx.AsyncBaseTransport,
+) -> httpx.AsyncBaseTransport:
+    """Wrap a caller-provided async transport so closing a client keeps it open.
+
+    Args:
+        transport: The transport to send requests through.
+
+    Returns:
+        A transport for ``httpx.AsyncClient`` that does not close ``transport``.
+    """
+    return _SharedAsyncTransport(transport)
+
+
+def shutdown() -> None:
+    """Close the process-wide sync connection pools.
+
+    This runs automatically at interpreter exit. Call it earlier to drop idle
+    connections, e.g. from a worker's shutdown hook, after closing the
+    clients that use the pools. Clients created afterwards open a new pool.
+    """
+    with _lock:
+        transports = list(_shared_sync_transports.values())
+        _shared_sync_transports.clear()
+    for transport in transports:
+        transport.close()
+
+
+async def shutdown_async() -> None:
+    """Close the shared async connection pools of the running event loop.
+
+    A loop's pools already close when its last client is closed, so this is
+    only needed for clients that are never closed. Call it before the loop
+    stops; clients created afterwards on the same loop open a new pool.
+
+    Raises:
+        RuntimeError: If called outside of a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        transports = _shared_async_transports.pop(loop, {})
+    for pool in transports.values():
+        await pool.transport.aclose()
+
+
+atexit.register(shutdown)
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Generic, TypeVar
 
-from .types.shared import Pagination
-
 if TYPE_CHECKING:
     from collections.abc import Awaitable
 
+    from .types.shared import Pagination
+
 T = TypeVar("T")
 
 
+def _check_prefetch(prefetch: int) -> None:
+    """Validate the ``prefetch`` argument of the paging iterators.
+
+    Raises:
+        ValueError: If prefetch is negative.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+
+
+def _last_page_number(pagination: Pagination) -> int:
+    """Return the number of the last page described by ``pagination``."""
+    if pagination.limit <= 0:
+        return pagination.page
+    return max(pagination.page, -(-pagination.total // pagination.limit))
+
+
 class Page(Generic[T]):
     """A page of results from a paginated API endpoint.
 
@@ -73,10 +93,16 @@ class Page(Generic[T]):
     def has_next_page(self) -> bool:
         """Check if there are more pages available.
 
+        An empty page also ends the list, even if ``total`` claims more items,
+        so iterators don't keep requesting empty pages.
+
         Returns:
             True if there are more pages, False otherwise.
         """
-        return self._pagination.page * self._pagination.limit < self._pagination.total
+        pagination = self._pagination
+        return (
+            bool(self._data) and pagination.page * pagination.limit < pagination.total
+        )
 
     def next_page(self) -> Page[T]:
         """Fetch the next page of results.
@@ -91,16 +117,30 @@ class Page(Generic[T]):
             raise StopIteration("No more pages")
         return self._fetch_page(self._pagination.page + 1)
 
-    def iter_pages(self) -> Iterator[Page[T]]:
+    def iter_pages(self, *, prefetch: int = 0) -> Iterator[Page[T]]:
         """Iterate through all pages starting from this page.
 
-        Yields:
-            Each page of results.
+        Args:
+            prefetch: Number of upcoming pages to fetch in background threads
+                while the caller works on the current one. 0 fetches each
+                page only when it is needed.
+
+        Returns:
+            An iterator over each page of results.
+
+        Raises:
+            ValueError: If prefetch is negative.
 
         Example:
             >>> for page in result.iter_pages():
             ...     print(f"Page {page.page}: {len(page.data)} items")
         """
+        _check_prefetch(prefetch)
+        if prefetch:
+            return self._iter_pages_prefetched(prefetch)
+        return self._iter_pages()
+
+    def _iter_pages(self) -> Iterator[Page[T]]:
         page = self
         while True:
             yield page
@@ -108,20 +148,48 @@ class Page(Generic[T]):
                 break
             page = page.next_page()
 
-    def auto_paging_iter(self) -> Iterator[T]:
+    def _iter_pages_prefetched(self, prefetch: int) -> Iterator[Page[T]]:
+        last_page = _last_page_number(self._pagination)
+        next_number = self._pagination.page + 1
+        pending: deque[Future[Page[T]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            page = self
+            while True:
+                while len(pending) < prefetch and next_number <= last_page:
+                    pending.append(executor.submit(self._fetch_page, next_number))
+                    next_number += 1
+                yield page
+                if not pending or not page.has_next_page():
+                    break
+                page = pending.popleft().result()
+        finally:
+            # Fetches still running finish in the background; queued ones
+            # are dropped so an early exit costs at most one request per worker
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def auto_paging_iter(self, *, prefetch: int = 0) -> Iterator[T]:
         """Iterate through all items across all pages.
 
         Automatically fetches subsequent pages as needed.
 
-        Yields:
-            Each item from all pages.
+        Args:
+            prefetch: Number of upcoming pages to fetch in background threads
+                while the caller consumes the current one. 0 fetches each
+                page only when it is needed.
+
+        Returns:
+            An iterator over each item from all pages.
+
+        Raises:
+            ValueError: If prefetch is negative.
 
         Example:
-            >>> for item in result.auto_paging_iter():
+            >>> for item in result.auto_paging_iter(prefetch=1):
             ...     print(item.name)
         """
-        for page in self.iter_pages():
-            yield from page.data
+        pages = self.iter_pages(prefetch=prefetch)
+        return (item for page in pages for item in page.data)
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over items in this page only.
@@ -195,10 +263,16 @@ class AsyncPage(Generic[T]):
     def has_next_page(self) -> bool:
         """Check if there are more pages available.
 
+        An empty page also ends the list, even if ``total`` claims more items,
+        so iterators don't keep requesting empty pages.
+
         Returns:
             True if there are more pages, False otherwise.
         """
-        return self._pagination.page * self._pagination.limit < self._pagination.total
+        pagination = self._pagination
+        return (
+            bool(self._data) and pagination.page * pagination.limit < pagination.total
+        )
 
     async def next_page(self) -> AsyncPage[T]:
         """Fetch the next page of results.
@@ -207,22 +281,38 @@ class AsyncPage(Generic[T]):
             The next page of results.
 
         Raises:
-            StopIteration: If there are no more pages.
+            StopAsyncIteration: If there are no more pages.
         """
         if not self.has_next_page():
-            raise StopIteration("No more pages")
+            # StopIteration can't escape a coroutine (PEP 479) and would
+            # surface as RuntimeError
+            raise StopAsyncIteration("No more pages")
         return await self._fetch_page(self._pagination.page + 1)
 
-    async def iter_pages_async(self) -> AsyncIterator[AsyncPage[T]]:
+    def iter_pages_async(self, *, prefetch: int = 0) -> AsyncIterator[AsyncPage[T]]:
         """Iterate through all pages starting from this page.
 
-        Yields:
-            Each page of results.
+        Args:
+            prefetch: Number of upcoming pages to fetch in background tasks
+                while the caller works on the current one. 0 fetches each
+                page only when it is needed.
+
+        Returns:
+            An async iterator over each page of results.
+
+        Raises:
+            ValueError: If prefetch is negative.
 
         Example:
             >>> async for page in result.iter_pages_async():
             ...     print(f"Page {page.page}: {len(page.data)} items")
         """
+        _check_prefetch(prefetch)
+        if prefetch:
+            return self._iter_pages_prefetched(prefetch)
+        return self._iter_pages()
+
+    async def _iter_pages(self) -> AsyncIterator[AsyncPage[T]]:
         page = self
         while True:
             yield page
@@ -230,19 +320,49 @@ class AsyncPage(Generic[T]):
                 break
             page = await page.next_page()
 
-    async def auto_paging_iter_async(self) -> AsyncIterator[T]:
+    async def _iter_pages_prefetched(
+        self, prefetch: int
+    ) -> AsyncIterator[AsyncPage[T]]:
+        last_page = _last_page_number(self._pagination)
+        next_number = self._pagination.page + 1
+        pending: deque[asyncio.Future[AsyncPage[T]]] = deque()
+        try:
+            page = self
+            while True:
+                while len(pending) < prefetch and next_number <= last_page:
+                    pending.append(asyncio.ensure_future(self._fetch_page(next_number)))
+                    next_number += 1
+                yield page
+                if not pending or not page.has_next_page():
+                    break
+                page = await pending.popleft()
+        finally:
+            for task in pending:
+                if not task.cancel() and not task.cancelled():
+                    # Already finished; retrieve any error so it is not logged
+                    task.exception()
+
+    async def auto_paging_iter_async(self, *, prefetch: int = 0) -> AsyncIterator[T]:
         """Iterate through all items across all pages.
 
         Automatically fetches subsequent pages as needed.
 
+        Args:
+            prefetch: Number of upcoming pages to fetch in background tasks
+                while the caller consumes the current one. 0 fetches each
+                page only when it is needed.
+
         Yields:
             Each item from all pages.
 
+        Raises:
+            ValueError: If prefetch is negative.
+
         Example:
-            >>> async for item in result.auto_paging_iter_async():
+            >>> async for item in result.auto_paging_iter_async(prefetch=1):
             ...     print(item.name)
         """
-        async for page in self.iter_pages_async():
+        async for page in self.iter_pages_async(prefetch=prefetch):
             for item in page.data:
                 yield item
 
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+import random
+import threading
 import time
-from collections.abc import Callable
-from typing import TYPE_CHECKING, TypeVar
-
-from ._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from ._constants import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_BACKOFF_FACTOR,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLL_JITTER,
+    DEFAULT_POLL_TIMEOUT,
+    DEFAULT_POLL_WORKERS,
+)
 from ._exceptions import APITimeoutError
 
 if TYPE_CHECKING:
@@ -19,6 +30,298 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", "ConversionStatus", "IdentificationStatus", "StepExecutionStatus")
 
+_poll_executor: ThreadPoolExecutor | None = None
+_poll_executor_lock = threading.Lock()
+
+
+def _get_poll_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used by wait_for_many_completions()."""
+    global _poll_executor
+    with _poll_executor_lock:
+        if _poll_executor is None:
+            _poll_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_POLL_WORKERS,
+                thread_name_prefix="docutray-poll",
+            )
+        return _poll_executor
+
+
+def _resolve_max_poll_interval(
+    poll_interval: float,
+    max_poll_interval: float | None,
+    backoff_factor: float,
+    jitter: float,
+) -> float:
+    """Validate backoff settings and return the effective interval cap.
+
+    Args:
+        poll_interval: Initial seconds between status checks.
+        max_poll_interval: Explicit interval cap, if any.
+        backoff_factor: Multiplier applied to the interval after each poll.
+        jitter: Random +/- fraction applied to each interval.
+
+    Returns:
+        The maximum number of seconds to wait between status checks.
+
+    Raises:
+        ValueError: If backoff_factor or jitter is out of range.
+    """
+    if backoff_factor < 1.0:
+        raise ValueError("backoff_factor must be >= 1.0")
+    if not 0.0 <= jitter < 1.0:
+        raise ValueError("jitter must be >= 0.0 and < 1.0")
+    if max_poll_interval is not None:
+        return max_poll_interval
+    return max(poll_interval, DEFAULT_MAX_POLL_INTERVAL)
+
+
+def _jittered(interval: float, jitter: float) -> float:
+    """Apply random +/- jitter to a poll interval.
+
+    Args:
+        interval: The base interval in seconds.
+        jitter: Fraction of the interval to randomize (0.0 disables jitter).
+
+    Returns:
+        The interval to sleep for.
+    """
+    if not jitter:
+        return interval
+    return interval * (1.0 + random.uniform(-jitter, jitter))
+
+
+# Maps each pollable status type to (job label, ID attribute). Filled on first
+# use since importing the type modules here would be circular.
+_STATUS_KINDS: dict[type, tuple[str, str]] = {}
+
+
+def _status_kind(status: object) -> tuple[str, str] | None:
+    """Look up the job label and ID attribute for a status object.
+
+    Args:
+        status: A status object returned by a get_status() call.
+
+    Returns:
+        A (label, ID attribute) pair, or None for unknown status types.
+        Subclasses (and mocks specced on a status type) resolve like their
+        base type.
+    """
+    if not _STATUS_KINDS:
+        from .types.convert import ConversionStatus
+        from .types.identify import IdentificationStatus
+        from .types.step import StepExecutionStatus
+
+        _STATUS_KINDS.update(
+            {
+                ConversionStatus: ("Conversion", "conversion_id"),
+                IdentificationStatus: ("Identification", "identification_id"),
+                StepExecutionStatus: ("Step execution", "execution_id"),
+            }
+        )
+    status_type = type(status)
+    kind = _STATUS_KINDS.get(status_type)
+    if kind is not None:
+        return kind
+    for base in status_type.__mro__[1:]:
+        kind = _STATUS_KINDS.get(base)
+        if kind is not None:
+            # Cache subclasses under their own type for the next lookup
+            _STATUS_KINDS[status_type] = kind
+            return kind
+    # Mocks specced on a status type only pass isinstance(), via __class__;
+    # each mock has its own type, so these are not cached
+    for base, kind in _STATUS_KINDS.items():
+        if isinstance(status, base):
+            return kind
+    return None
+
+
+def _timeout_error(
+    kind: tuple[str, str] | None, job_id: str | None, timeout: float
+) -> APITimeoutError:
+    """Build the error raised when polling runs out of time.
+
+    Args:
+        kind: The (label, ID attribute) pair from _status_kind().
+        job_id: The ID of the job being polled.
+        timeout: The timeout the caller asked for, in seconds.
+
+    Returns:
+        The error to raise.
+    """
+    if kind is None:
+        return APITimeoutError(f"Operation did not complete within {timeout} seconds")
+    return APITimeoutError(
+        f"{kind[0]} {job_id} did not complete within {timeout} seconds"
+    )
+
+
+def _poll_delay(
+    interval: float, jitter: float, status: object, remaining: float
+) -> float:
+    """Return how long to sleep before the next status check.
+
+    Args:
+        interval: The current base interval in seconds.
+        jitter: Fraction of the interval to randomize (0.0 disables jitter).
+        status: The latest status; a Retry-After hint on it extends the wait.
+        remaining: Seconds left before the timeout. The delay never exceeds
+            it, so the final check happens at the deadline instead of after
+            a full interval past it.
+
+    Returns:
+        The number of seconds to sleep.
+    """
+    delay = _jittered(interval, jitter)
+    retry_after: float | None = getattr(status, "_retry_after", None)
+    if retry_after is not None and retry_after > delay:
+        delay = retry_after
+    return min(delay, remaining)
+
+
+# Running mean of observed wait times per status type, as (mean, count). Used
+# to time the first poll of adaptive waits.
+_completion_stats: dict[type, tuple[float, int]] = {}
+_completion_stats_lock = threading.Lock()
+
+# Floor and fraction of the mean wait used for the first adaptive poll
+_MIN_ADAPTIVE_DELAY = 0.1
+_ADAPTIVE_DELAY_FRACTION = 0.8
+
+
+def _record_completion(status_type: type, elapsed: float) -> None:
+    """Fold an observed wait time into the running mean for its status type.
+
+    Args:
+        status_type: The type of the completed status object.
+        elapsed: Seconds from the start of the wait until completion was seen.
+    """
+    with _completion_stats_lock:
+        mean, count = _completion_stats.get(status_type, (0.0, 0))
+        count += 1
+        _completion_stats[status_type] = (mean + (elapsed - mean) / count, count)
+
+
+def _adaptive_first_delay(status_type: type) -> float | None:
+    """Get the first poll delay learned from earlier waits, if any.
+
+    Args:
+        status_type: The type of the status object being waited on.
+
+    Returns:
+        A delay slightly below the mean observed wait time, or None when
+        there is no history for the type yet.
+    """
+    stats = _completion_stats.get(status_type)
+    if stats is None:
+        return None
+    return max(_MIN_ADAPTIVE_DELAY, stats[0] * _ADAPTIVE_DELAY_FRACTION)
+
+
+class _PollPlan:
+    """Polling schedule shared by the sync and async wait loops.
+
+    Holds everything the loops need apart from how they sleep and fetch:
+    the resource and job ID to poll, the deadline and the growing interval.
+    """
+
+    __slots__ = (
+        "resource",
+        "job_id",
+        "_kind",
+        "_timeout",
+        "_deadline_ns",
+        "_interval",
+        "_max_interval",
+        "_backoff_factor",
+        "_jitter",
+        "_started_ns",
+        "_first_delay",
+        "_polled",
+    )
+
+    def __init__(
+        self,
+        status: object,
+        *,
+        poll_interval: float,
+        timeout: float,
+        max_poll_interval: float | None,
+        backoff_factor: float,
+        jitter: float,
+        adaptive: bool = False,
+    ) -> None:
+        """Validate the settings and start the clock.
+
+        Raises:
+            ValueError: If the status object doesn't have a resource
+                reference, or if backoff_factor or jitter is out of range.
+        """
+        resource = getattr(status, "_resource", None)
+        if resource is None:
+            raise ValueError(
+                "Status object doesn't have a resource reference. "
+                "Use get_status() to create a pollable status."
+            )
+        self.resource: Any = resource
+        self._max_interval = _resolve_max_poll_interval(
+            poll_interval, max_poll_interval, backoff_factor, jitter
+        )
+        self._interval = poll_interval
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._timeout = timeout
+        # Integer nanoseconds avoid float drift over long waits
+        self._started_ns = time.monotonic_ns()
+        self._deadline_ns = self._started_ns + int(timeout * 1_000_000_000)
+        self._first_delay = _adaptive_first_delay(type(status)) if adaptive else None
+        self._polled = False
+        # The job ID never changes, so resolve it once instead of on every poll
+        self._kind = _status_kind(status)
+        self.job_id: str | None = (
+            getattr(status, self._kind[1]) if self._kind is not None else None
+        )
+
+    def next_delay(self, status: Any) -> float | None:
+        """Get how long to sleep before polling again.
+
+        Args:
+            status: The latest status.
+
+        Returns:
+            The delay in seconds, or None if the status is complete.
+
+        Raises:
+            APITimeoutError: If the deadline has passed.
+        """
+        # Check completion first, then sleep if needed (avoids latency for
+        # fast ops)
+        if status.is_complete():
+            # A job that was already done when the wait began says nothing
+            # about how long jobs take
+            if self._polled:
+                elapsed = (time.monotonic_ns() - self._started_ns) / 1_000_000_000
+                _record_completion(type(status), elapsed)
+            return None
+
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._deadline_ns:
+            raise _timeout_error(self._kind, self.job_id, self._timeout)
+
+        remaining = (self._deadline_ns - now_ns) / 1_000_000_000
+        if not self._polled and self._first_delay is not None:
+            # Skip the polls that past waits show would find the job running
+            delay = _poll_delay(self._first_delay, self._jitter, status, remaining)
+        else:
+            # Grow the interval when backoff is enabled and wait longer if the
+            # server asked us to
+            delay = _poll_delay(self._interval, self._jitter, status, remaining)
+            self._interval = min(
+                self._max_interval, self._interval * self._backoff_factor
+            )
+        self._polled = True
+        return delay
+
 
 def wait_for_completion(
     status: T,
@@ -26,6 +329,10 @@ def wait_for_completion(
     poll_interval: float = DEFAULT_POLL_INTERVAL,
     timeout: float = DEFAULT_POLL_TIMEOUT,
     on_status: Callable[[T], None] | None = None,
+    max_poll_interval: float | None = None,
+    backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+    jitter: float = DEFAULT_POLL_JITTER,
+    adaptive: bool = False,
 ) -> T:
     """Wait for an async operation to complete by polling.
 
@@ -36,13 +343,24 @@ def wait_for_completion(
         on_status: Optional callback invoked with each status update. Called
             with the current status object after each poll, allowing progress
             tracking or logging.
+        max_poll_interval: Upper bound for the interval when backoff is
+            enabled. Defaults to the larger of poll_interval and 30 seconds.
+        backoff_factor: Multiplier applied to the interval after each poll.
+            Defaults to 1.0 (fixed interval).
+        jitter: Random +/- fraction applied to each interval to avoid
+            synchronized polling. Defaults to 0.0 (no jitter). A Retry-After
+            header on a status response lengthens the following wait.
+        adaptive: Time the first status check from how long earlier waits
+            for the same kind of job took in this process, instead of
+            poll_interval. Defaults to False.
 
     Returns:
         The final status with completion data.
 
     Raises:
         APITimeoutError: If the operation doesn't complete within timeout.
-        ValueError: If the status object doesn't have a resource reference.
+        ValueError: If the status object doesn't have a resource reference,
+            or if backoff_factor or jitter is out of range.
 
     Example:
         >>> def log_status(status):
@@ -50,69 +368,168 @@ def wait_for_completion(
         >>>
         >>> final = wait_for_completion(status, on_status=log_status)
     """
-    from .types.convert import ConversionStatus
-    from .types.identify import IdentificationStatus
-    from .types.step import StepExecutionStatus
+    plan = _PollPlan(
+        status,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        max_poll_interval=max_poll_interval,
+        backoff_factor=backoff_factor,
+        jitter=jitter,
+        adaptive=adaptive,
+    )
+    return _run_poll_loop(plan, status, on_status=on_status)
+
+
+def _run_poll_loop(
+    plan: _PollPlan,
+    status: T,
+    *,
+    on_status: Callable[[T], None] | None = None,
+    stop: threading.Event | None = None,
+) -> T:
+    """Poll a job on the calling thread until it completes.
 
-    resource = getattr(status, "_resource", None)
-    if resource is None:
-        raise ValueError(
-            "Status object doesn't have a resource reference. "
-            "Use get_status() to create a pollable status."
-        )
+    Args:
+        plan: The polling schedule for the job.
+        status: The initial status object.
+        on_status: Optional callback invoked with each status update.
+        stop: Event that ends the wait early when set; the latest status is
+            returned then.
+
+    Returns:
+        The final status, or the latest one if ``stop`` was set.
 
-    start_time = time.monotonic()
+    Raises:
+        APITimeoutError: If the operation doesn't complete within timeout.
+    """
+    resource = plan.resource
+    job_id = plan.job_id
     current_status = status
 
-    # Check completion first, then sleep if needed (avoids latency for fast ops)
     while True:
-        if current_status.is_complete():
+        delay = plan.next_delay(current_status)
+        if delay is None:
+            return current_status
+        if stop is None:
+            time.sleep(delay)
+        elif stop.wait(delay):
             return current_status
-
-        elapsed = time.monotonic() - start_time
-        if elapsed >= timeout:
-            if isinstance(current_status, ConversionStatus):
-                raise APITimeoutError(
-                    f"Conversion {current_status.conversion_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-            elif isinstance(current_status, IdentificationStatus):
-                raise APITimeoutError(
-                    f"Identification {current_status.identification_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-            elif isinstance(current_status, StepExecutionStatus):
-                raise APITimeoutError(
-                    f"Step execution {current_status.execution_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-            else:
-                raise APITimeoutError(
-                    f"Operation did not complete within {timeout} seconds"
-                )
-
-        # Sleep before polling for new status
-        time.sleep(poll_interval)
 
         # Get fresh status
-        if isinstance(current_status, ConversionStatus):
-            current_status = resource.get_status(current_status.conversion_id)
-        elif isinstance(current_status, IdentificationStatus):
-            current_status = resource.get_status(current_status.identification_id)
-        elif isinstance(current_status, StepExecutionStatus):
-            current_status = resource.get_status(current_status.execution_id)
+        if job_id is not None:
+            current_status = resource.get_status(job_id)
 
         # Invoke callback after each poll
         if on_status is not None:
             on_status(current_status)
 
 
+def _wait_until_stopped(
+    status: T,
+    stop: threading.Event,
+    *,
+    poll_interval: float,
+    timeout: float,
+    max_poll_interval: float | None,
+    backoff_factor: float,
+    jitter: float,
+) -> T:
+    """Run wait_for_completion() for one job of wait_for_many_completions().
+
+    The plan is built on the worker thread so that the timeout counts from
+    when polling starts, and the wait ends early once ``stop`` is set.
+    """
+    plan = _PollPlan(
+        status,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        max_poll_interval=max_poll_interval,
+        backoff_factor=backoff_factor,
+        jitter=jitter,
+    )
+    return _run_poll_loop(plan, status, stop=stop)
+
+
+def wait_for_many_completions(
+    statuses: Sequence[T],
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    timeout: float = DEFAULT_POLL_TIMEOUT,
+    max_poll_interval: float | None = None,
+    backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+    jitter: float = DEFAULT_POLL_JITTER,
+) -> list[T]:
+    """Wait for several async operations at once by polling them in parallel.
+
+    Each status is polled with wait_for_completion() on a shared thread pool,
+    so waiting for N jobs takes about as long as the slowest one instead of
+    the sum of all of them. Polls beyond the pool size start as threads free
+    up, and their timeout counts from that point.
+
+    Args:
+        statuses: Status objects returned by run_async() or get_status().
+        poll_interval: Seconds between status checks. Defaults to 2.0.
+        timeout: Maximum seconds to wait for each operation. Defaults to
+            300.0 (5 minutes).
+        max_poll_interval: Upper bound for the interval when backoff is
+            enabled. Defaults to the larger of poll_interval and 30 seconds.
+        backoff_factor: Multiplier applied to the interval after each poll.
+            Defaults to 1.0 (fixed interval).
+        jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+
+    Returns:
+        The final statuses, in the same order as ``statuses``.
+
+    Raises:
+        APITimeoutError: If an operation doesn't complete within timeout.
+        ValueError: If a status object doesn't have a resource reference,
+            or if backoff_factor or jitter is out of range.
+
+    Example:
+        >>> statuses = [client.convert.run_async(file=p, document_type_code="invoice")
+        ...             for p in paths]
+        >>> for final in wait_for_many_completions(statuses):
+        ...     print(final.status)
+    """
+    executor = _get_poll_executor()
+    # Set on the way out so that polls still running after a failure stop
+    # instead of holding pool threads until their own timeout
+    stop = threading.Event()
+    futures: dict[Future[T], int] = {
+        executor.submit(
+            _wait_until_stopped,
+            status,
+            stop,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter,
+        ): index
+        for index, status in enumerate(statuses)
+    }
+    results: list[T | None] = [None] * len(statuses)
+    try:
+        # Collect in completion order so the first failure surfaces at once
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+    return cast("list[T]", results)
+
+
 async def wait_for_completion_async(
     status: T,
     *,
     poll_interval: float = DEFAULT_POLL_INTERVAL,
     timeout: float = DEFAULT_POLL_TIMEOUT,
     on_status: Callable[[T], None] | Callable[[T], Awaitable[None]] | None = None,
+    max_poll_interval: float | None = None,
+    backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+    jitter: float = DEFAULT_POLL_JITTER,
+    adaptive: bool = False,
 ) -> T:
     """Wait for an async operation to complete by polling (async version).
 
@@ -123,13 +540,24 @@ async def wait_for_completion_async(
         on_status: Optional callback invoked with each status update. Can be
             a sync or async function. Called with the current status object
             after each poll, allowing progress tracking or logging.
+        max_poll_interval: Upper bound for the interval when backoff is
+            enabled. Defaults to the larger of poll_interval and 30 seconds.
+        backoff_factor: Multiplier applied to the interval after each poll.
+            Defaults to 1.0 (fixed interval).
+        jitter: Random +/- fraction applied to each interval to avoid
+            synchronized polling. Defaults to 0.0 (no jitter). A Retry-After
+            header on a status response lengthens the following wait.
+        adaptive: Time the first status check from how long earlier waits
+            for the same kind of job took in this process, instead of
+            poll_interval. Defaults to False.
 
     Returns:
         The final status with completion data.
 
     Raises:
         APITimeoutError: If the operation doesn't complete within timeout.
-        ValueError: If the status object doesn't have a resource reference.
+        ValueError: If the status object doesn't have a resource reference,
+            or if backoff_factor or jitter is out of range.
 
     Example:
         >>> async def log_status(status):
@@ -137,64 +565,99 @@ async def wait_for_completion_async(
         >>>
         >>> final = await wait_for_completion_async(status, on_status=log_status)
     """
-    from .types.convert import ConversionStatus
-    from .types.identify import IdentificationStatus
-    from .types.step import StepExecutionStatus
-
-    resource = getattr(status, "_resource", None)
-    if resource is None:
-        raise ValueError(
-            "Status object doesn't have a resource reference. "
-            "Use get_status() to create a pollable status."
-        )
-
-    start_time = time.monotonic()
+    plan = _PollPlan(
+        status,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        max_poll_interval=max_poll_interval,
+        backoff_factor=backoff_factor,
+        jitter=jitter,
+        adaptive=adaptive,
+    )
+    resource = plan.resource
+    job_id = plan.job_id
     current_status = status
 
-    # Helper to call on_status callback (handles both sync and async)
-    async def _call_on_status(s: T) -> None:
-        if on_status is not None:
-            result = on_status(s)
-            if asyncio.iscoroutine(result):
-                await result
+    # Decide once whether on_status is async instead of inspecting every result
+    on_status_is_async = inspect.iscoroutinefunction(on_status)
 
-    # Check completion first, then sleep if needed (avoids latency for fast ops)
     while True:
-        if current_status.is_complete():
+        delay = plan.next_delay(current_status)
+        if delay is None:
             return current_status
-
-        elapsed = time.monotonic() - start_time
-        if elapsed >= timeout:
-            if isinstance(current_status, ConversionStatus):
-                raise APITimeoutError(
-                    f"Conversion {current_status.conversion_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-            elif isinstance(current_status, IdentificationStatus):
-                raise APITimeoutError(
-                    f"Identification {current_status.identification_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-            elif isinstance(current_status, StepExecutionStatus):
-                raise APITimeoutError(
-                    f"Step execution {current_status.execution_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-            else:
-                raise APITimeoutError(
-                    f"Operation did not complete within {timeout} seconds"
-                )
-
-        # Sleep before polling for new status
-        await asyncio.sleep(poll_interval)
+        await asyncio.sleep(delay)
 
         # Get fresh status
-        if isinstance(current_status, ConversionStatus):
-            current_status = await resource.get_status(current_status.conversion_id)
-        elif isinstance(current_status, IdentificationStatus):
-            current_status = await resource.get_status(current_status.identification_id)
-        elif isinstance(current_status, StepExecutionStatus):
-            current_status = await resource.get_status(current_status.execution_id)
+        if job_id is not None:
+            current_status = await resource.get_status(job_id)
 
-        # Invoke callback after each poll
-        await _call_on_status(current_status)
+        # Invoke callback after each poll; other callables may still hand
+        # back a coroutine (e.g. a lambda or an object with async __call__)
+        if on_status is not None:
+            result = on_status(current_status)
+            if on_status_is_async or asyncio.iscoroutine(result):
+                await cast("Awaitable[None]", result)
+
+
+async def wait_for_many_completions_async(
+    statuses: Sequence[T],
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    timeout: float = DEFAULT_POLL_TIMEOUT,
+    max_poll_interval: float | None = None,
+    backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR,
+    jitter: float = DEFAULT_POLL_JITTER,
+) -> list[T]:
+    """Wait for several async operations at once (async version).
+
+    All statuses are polled concurrently on the running event loop, so
+    their status checks go out together on the shared connection pool
+    instead of from N unrelated loops. Concurrent checks for the same job
+    are coalesced into one request. If one operation fails, the others are
+    cancelled and the error is raised.
+
+    Args:
+        statuses: Status objects returned by run_async() or get_status().
+        poll_interval: Seconds between status checks. Defaults to 2.0.
+        timeout: Maximum seconds to wait for each operation. Defaults to
+            300.0 (5 minutes).
+        max_poll_interval: Upper bound for the interval when backoff is
+            enabled. Defaults to the larger of poll_interval and 30 seconds.
+        backoff_factor: Multiplier applied to the interval after each poll.
+            Defaults to 1.0 (fixed interval).
+        jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+
+    Returns:
+        The final statuses, in the same order as ``statuses``.
+
+    Raises:
+        APITimeoutError: If an operation doesn't complete within timeout.
+        ValueError: If a status object doesn't have a resource reference,
+            or if backoff_factor or jitter is out of range.
+
+    Example:
+        >>> statuses = await asyncio.gather(
+        ...     *(client.convert.run_async(file=p, document_type_code="invoice")
+        ...       for p in paths)
+        ... )
+        >>> for final in await wait_for_many_completions_async(statuses):
+        ...     print(final.status)
+    """
+    tasks = [
+        asyncio.ensure_future(
+            wait_for_completion_async(
+                status,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                max_poll_interval=max_poll_interval,
+                backoff_factor=backoff_factor,
+                jitter=jitter,
+            )
+        )
+        for status in statuses
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 import httpx
 
+from ._files import (
+    prepare_base64_upload,
+    prepare_document_request,
+    prepare_file_upload,
+    prepare_url_upload,
+)
+from ._utils import coalesce, json_dumps, json_loads
+
 if TYPE_CHECKING:
+    import asyncio
+
+    from pydantic import BaseModel
+
     from ._pagination import AsyncPage, Page
     from .resources.convert import AsyncConvert, Convert
     from .resources.document_types import AsyncDocumentTypes, DocumentTypes
@@ -23,6 +34,67 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Marks RawResponse caches that have not been filled yet (None is a valid body)
+_MISSING: Any = object()
+M = TypeVar("M", bound="BaseModel")
+
+# Parse functions shared by every RawResponse of the same model, keyed by
+# (model class, unwrap_data)
+_model_parsers: dict[tuple[type[Any], bool], Callable[[httpx.Response], Any]] = {}
+
+
+def _model_parser(
+    model_cls: type[M], *, unwrap_data: bool = False
+) -> Callable[[httpx.Response], M]:
+    """Get the shared function that parses a response body into ``model_cls``.
+
+    Args:
+        model_cls: The pydantic model to validate the JSON body with.
+        unwrap_data: Validate the body's "data" member instead of the whole
+            body when it is present.
+
+    Returns:
+        A parse function suitable for RawResponse.
+    """
+    key = (model_cls, unwrap_data)
+    parser = _model_parsers.get(key)
+    if parser is not None:
+        return cast("Callable[[httpx.Response], M]", parser)
+
+    def parse(response: httpx.Response) -> M:
+        # Validates straight from the bytes, without an intermediate dict
+        return model_cls.model_validate_json(response.content)
+
+    def parse_data(response: httpx.Response) -> M:
+        body = json_loads(response.content)
+        return model_cls.model_validate(body.get("data", body))
+
+    parser = parse_data if unwrap_data else parse
+    _model_parsers[key] = parser
+    return parser
+
+
+def _parse_search_result(response: httpx.Response) -> SearchResult:
+    """Parse a knowledge base search response into a SearchResult."""
+    from .types.knowledge_base import (
+        KnowledgeBaseDocument,
+        SearchResult,
+        SearchResultItem,
+    )
+
+    data = response.json()
+    items = []
+    for item_data in data.get("data", []):
+        doc = KnowledgeBaseDocument.model_validate(item_data.get("document", {}))
+        items.append(
+            SearchResultItem(document=doc, similarity=item_data.get("similarity", 0))
+        )
+    return SearchResult(
+        data=items,
+        query=data.get("query"),
+        resultsCount=data.get("resultsCount", len(items)),
+    )
+
 
 class RawResponse(Generic[T]):
     """A wrapper around an HTTP response providing access to raw details.
@@ -42,6 +114,8 @@ class RawResponse(Generic[T]):
         >>> print(result.data)
     """
 
+    __slots__ = ("_response", "_parse_func", "_json", "_parsed")
+
     def __init__(
         self,
         response: httpx.Response,
@@ -55,6 +129,8 @@ class RawResponse(Generic[T]):
         """
         self._response = response
         self._parse_func = parse_func
+        self._json: Any = _MISSING
+        self._parsed: Any = _MISSING
 
     @property
     def status_code(self) -> int:
@@ -82,16 +158,26 @@ class RawResponse(Generic[T]):
         return self._response.text
 
     def json(self) -> Any:
-        """Parse the response body as JSON."""
-        return self._response.json()
+        """Parse the response body as JSON.
+
+        The result is decoded once and returned on later calls.
+        """
+        if self._json is _MISSING:
+            self._json = json_loads(self._response.content)
+        return self._json
 
     def parse(self) -> T:
         """Parse the response body into the appropriate typed model.
 
+        The model is built on the first call; later calls return the same
+        instance.
+
         Returns:
             The parsed response model.
         """
-        return self._parse_func(self._response)
+        if self._parsed is _MISSING:
+            self._parsed = self._parse_func(self._response)
+        return cast("T", self._parsed)
 
 
 # ============================================================================
@@ -102,6 +188,8 @@ class RawResponse(Generic[T]):
 class ConvertWithRawResponse:
     """Wrapper for Convert resource that returns raw HTTP responses."""
 
+    __slots__ = ("_convert", "_request")
+
     def __init__(self, convert: Convert) -> None:
         """Initialize the wrapper.
 
@@ -109,6 +197,7 @@ class ConvertWithRawResponse:
             convert: The Convert resource instance.
         """
         self._convert = convert
+        self._request = convert._client._request
 
     def run(
         self,
@@ -133,40 +222,23 @@ class ConvertWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.convert import ConversionResult
 
-        if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                data["document_metadata"] = json.dumps(document_metadata)
-            response = self._convert._client._request(
-                "POST", "/api/convert", files=upload.files, data=data
-            )
-        elif url is not None:
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = self._convert._client._request("POST", "/api/convert", json=body)
-        elif file_base64 is not None:
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = self._convert._client._request("POST", "/api/convert", json=body)
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
+            response = self._request("POST", "/api/convert", **request_kwargs)
 
         return RawResponse(
             response,
-            lambda r: ConversionResult.model_validate(r.json()),
+            _model_parser(ConversionResult),
         )
 
     def run_async(
@@ -192,44 +264,23 @@ class ConvertWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.convert import ConversionStatus
 
-        if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                data["document_metadata"] = json.dumps(document_metadata)
-            response = self._convert._client._request(
-                "POST", "/api/convert-async", files=upload.files, data=data
-            )
-        elif url is not None:
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = self._convert._client._request(
-                "POST", "/api/convert-async", json=body
-            )
-        elif file_base64 is not None:
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = self._convert._client._request(
-                "POST", "/api/convert-async", json=body
-            )
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
+            response = self._request("POST", "/api/convert-async", **request_kwargs)
 
         return RawResponse(
             response,
-            lambda r: ConversionStatus.model_validate(r.json()),
+            _model_parser(ConversionStatus),
         )
 
     def get_status(self, conversion_id: str) -> RawResponse[ConversionStatus]:
@@ -243,18 +294,18 @@ class ConvertWithRawResponse:
         """
         from .types.convert import ConversionStatus
 
-        response = self._convert._client._request(
-            "GET", f"/api/convert-async/status/{conversion_id}"
-        )
+        response = self._request("GET", f"/api/convert-async/status/{conversion_id}")
         return RawResponse(
             response,
-            lambda r: ConversionStatus.model_validate(r.json()),
+            _model_parser(ConversionStatus),
         )
 
 
 class AsyncConvertWithRawResponse:
     """Wrapper for AsyncConvert resource that returns raw HTTP responses."""
 
+    __slots__ = ("_convert", "_request", "_inflight_status")
+
     def __init__(self, convert: AsyncConvert) -> None:
         """Initialize the wrapper.
 
@@ -262,6 +313,10 @@ class AsyncConvertWithRawResponse:
             convert: The AsyncConvert resource instance.
         """
         self._convert = convert
+        self._request = convert._client._request
+        self._inflight_status: dict[
+            str, asyncio.Future[RawResponse[ConversionStatus]]
+        ] = {}
 
     async def run(
         self,
@@ -286,44 +341,23 @@ class AsyncConvertWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.convert import ConversionResult
 
-        if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                data["document_metadata"] = json.dumps(document_metadata)
-            response = await self._convert._client._request(
-                "POST", "/api/convert", files=upload.files, data=data
-            )
-        elif url is not None:
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = await self._convert._client._request(
-                "POST", "/api/convert", json=body
-            )
-        elif file_base64 is not None:
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = await self._convert._client._request(
-                "POST", "/api/convert", json=body
-            )
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
+            response = await self._request("POST", "/api/convert", **request_kwargs)
 
         return RawResponse(
             response,
-            lambda r: ConversionResult.model_validate(r.json()),
+            _model_parser(ConversionResult),
         )
 
     async def run_async(
@@ -349,63 +383,49 @@ class AsyncConvertWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.convert import ConversionStatus
 
-        if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                data["document_metadata"] = json.dumps(document_metadata)
-            response = await self._convert._client._request(
-                "POST", "/api/convert-async", files=upload.files, data=data
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
+            response = await self._request(
+                "POST", "/api/convert-async", **request_kwargs
             )
-        elif url is not None:
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = await self._convert._client._request(
-                "POST", "/api/convert-async", json=body
-            )
-        elif file_base64 is not None:
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-            response = await self._convert._client._request(
-                "POST", "/api/convert-async", json=body
-            )
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
 
         return RawResponse(
             response,
-            lambda r: ConversionStatus.model_validate(r.json()),
+            _model_parser(ConversionStatus),
         )
 
     async def get_status(self, conversion_id: str) -> RawResponse[ConversionStatus]:
         """Get conversion status and return the raw HTTP response.
 
+        Concurrent calls for the same ID share a single request.
+
         Args:
             conversion_id: The conversion ID.
 
         Returns:
             RawResponse wrapping the HTTP response.
         """
+        return await coalesce(self._inflight_status, conversion_id, self._fetch_status)
+
+    async def _fetch_status(self, conversion_id: str) -> RawResponse[ConversionStatus]:
         from .types.convert import ConversionStatus
 
-        response = await self._convert._client._request(
+        response = await self._request(
             "GET", f"/api/convert-async/status/{conversion_id}"
         )
         return RawResponse(
             response,
-            lambda r: ConversionStatus.model_validate(r.json()),
+            _model_parser(ConversionStatus),
         )
 
 
@@ -417,6 +437,8 @@ class AsyncConvertWithRawResponse:
 class IdentifyWithRawResponse:
     """Wrapper for Identify resource that returns raw HTTP responses."""
 
+    __slots__ = ("_identify", "_request")
+
     def __init__(self, identify: Identify) -> None:
         """Initialize the wrapper.
 
@@ -424,6 +446,7 @@ class IdentifyWithRawResponse:
             identify: The Identify resource instance.
         """
         self._identify = identify
+        self._request = identify._client._request
 
     def run(
         self,
@@ -447,43 +470,34 @@ class IdentifyWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.identify import IdentificationResult
 
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = self._request(
+                    "POST", "/api/identify", files=upload.files, data=data
                 )
-            response = self._identify._client._request(
-                "POST", "/api/identify", files=upload.files, data=data
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = self._identify._client._request(
-                "POST", "/api/identify", json=body
-            )
+            response = self._request("POST", "/api/identify", json=body)
         elif file_base64 is not None:
             body = prepare_base64_upload(file_base64, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = self._identify._client._request(
-                "POST", "/api/identify", json=body
-            )
+            response = self._request("POST", "/api/identify", json=body)
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
         return RawResponse(
             response,
-            lambda r: IdentificationResult.model_validate(r.json()),
+            _model_parser(IdentificationResult),
         )
 
     def run_async(
@@ -508,43 +522,34 @@ class IdentifyWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.identify import IdentificationStatus
 
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = self._request(
+                    "POST", "/api/identify-async", files=upload.files, data=data
                 )
-            response = self._identify._client._request(
-                "POST", "/api/identify-async", files=upload.files, data=data
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = self._identify._client._request(
-                "POST", "/api/identify-async", json=body
-            )
+            response = self._request("POST", "/api/identify-async", json=body)
         elif file_base64 is not None:
             body = prepare_base64_upload(file_base64, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = self._identify._client._request(
-                "POST", "/api/identify-async", json=body
-            )
+            response = self._request("POST", "/api/identify-async", json=body)
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
         return RawResponse(
             response,
-            lambda r: IdentificationStatus.model_validate(r.json()),
+            _model_parser(IdentificationStatus),
         )
 
     def get_status(self, identification_id: str) -> RawResponse[IdentificationStatus]:
@@ -558,18 +563,20 @@ class IdentifyWithRawResponse:
         """
         from .types.identify import IdentificationStatus
 
-        response = self._identify._client._request(
+        response = self._request(
             "GET", f"/api/identify-async/status/{identification_id}"
         )
         return RawResponse(
             response,
-            lambda r: IdentificationStatus.model_validate(r.json()),
+            _model_parser(IdentificationStatus),
         )
 
 
 class AsyncIdentifyWithRawResponse:
     """Wrapper for AsyncIdentify resource that returns raw HTTP responses."""
 
+    __slots__ = ("_identify", "_request", "_inflight_status")
+
     def __init__(self, identify: AsyncIdentify) -> None:
         """Initialize the wrapper.
 
@@ -577,6 +584,10 @@ class AsyncIdentifyWithRawResponse:
             identify: The AsyncIdentify resource instance.
         """
         self._identify = identify
+        self._request = identify._client._request
+        self._inflight_status: dict[
+            str, asyncio.Future[RawResponse[IdentificationStatus]]
+        ] = {}
 
     async def run(
         self,
@@ -600,43 +611,34 @@ class AsyncIdentifyWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.identify import IdentificationResult
 
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = await self._request(
+                    "POST", "/api/identify", files=upload.files, data=data
                 )
-            response = await self._identify._client._request(
-                "POST", "/api/identify", files=upload.files, data=data
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = await self._identify._client._request(
-                "POST", "/api/identify", json=body
-            )
+            response = await self._request("POST", "/api/identify", json=body)
         elif file_base64 is not None:
             body = prepare_base64_upload(file_base64, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = await self._identify._client._request(
-                "POST", "/api/identify", json=body
-            )
+            response = await self._request("POST", "/api/identify", json=body)
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
         return RawResponse(
             response,
-            lambda r: IdentificationResult.model_validate(r.json()),
+            _model_parser(IdentificationResult),
         )
 
     async def run_async(
@@ -661,43 +663,34 @@ class AsyncIdentifyWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.identify import IdentificationStatus
 
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = await self._request(
+                    "POST", "/api/identify-async", files=upload.files, data=data
                 )
-            response = await self._identify._client._request(
-                "POST", "/api/identify-async", files=upload.files, data=data
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = await self._identify._client._request(
-                "POST", "/api/identify-async", json=body
-            )
+            response = await self._request("POST", "/api/identify-async", json=body)
         elif file_base64 is not None:
             body = prepare_base64_upload(file_base64, content_type=content_type)
             if document_type_code_options:
                 body["document_type_code_options"] = document_type_code_options
-            response = await self._identify._client._request(
-                "POST", "/api/identify-async", json=body
-            )
+            response = await self._request("POST", "/api/identify-async", json=body)
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
         return RawResponse(
             response,
-            lambda r: IdentificationStatus.model_validate(r.json()),
+            _model_parser(IdentificationStatus),
         )
 
     async def get_status(
@@ -705,20 +698,29 @@ class AsyncIdentifyWithRawResponse:
     ) -> RawResponse[IdentificationStatus]:
         """Get identification status and return the raw HTTP response.
 
+        Concurrent calls for the same ID share a single request.
+
         Args:
             identification_id: The identification ID.
 
         Returns:
             RawResponse wrapping the HTTP response.
         """
+        return await coalesce(
+            self._inflight_status, identification_id, self._fetch_status
+        )
+
+    async def _fetch_status(
+        self, identification_id: str
+    ) -> RawResponse[IdentificationStatus]:
         from .types.identify import IdentificationStatus
 
-        response = await self._identify._client._request(
+        response = await self._request(
             "GET", f"/api/identify-async/status/{identification_id}"
         )
         return RawResponse(
             response,
-            lambda r: IdentificationStatus.model_validate(r.json()),
+            _model_parser(IdentificationStatus),
         )
 
 
@@ -730,6 +732,8 @@ class AsyncIdentifyWithRawResponse:
 class DocumentTypesWithRawResponse:
     """Wrapper for DocumentTypes resource that returns raw HTTP responses."""
 
+    __slots__ = ("_document_types", "_request")
+
     def __init__(self, document_types: DocumentTypes) -> None:
         """Initialize the wrapper.
 
@@ -737,6 +741,7 @@ class DocumentTypesWithRawResponse:
             document_types: The DocumentTypes resource instance.
         """
         self._document_types = document_types
+        self._request = document_types._client._request
 
     def list(
         self,
@@ -767,12 +772,10 @@ class DocumentTypesWithRawResponse:
         if search is not None:
             params["search"] = search
 
-        response = self._document_types._client._request(
-            "GET", "/api/document-types", params=params
-        )
+        response = self._request("GET", "/api/document-types", params=params)
 
         def parse_page(r: httpx.Response) -> Page[DocumentType]:
-            data = r.json()
+            data = json_loads(r.content)
             pagination = Pagination.model_validate(data.get("pagination", {}))
             items = [DocumentType.model_validate(item) for item in data.get("data", [])]
             return Page(
@@ -796,12 +799,10 @@ class DocumentTypesWithRawResponse:
         """
         from .types.document_type import DocumentType
 
-        response = self._document_types._client._request(
-            "GET", f"/api/document-types/{type_id}"
-        )
+        response = self._request("GET", f"/api/document-types/{type_id}")
         return RawResponse(
             response,
-            lambda r: DocumentType.model_validate(r.json()),
+            _model_parser(DocumentType),
         )
 
     def validate(
@@ -820,20 +821,22 @@ class DocumentTypesWithRawResponse:
         """
         from .types.document_type import ValidationResult
 
-        response = self._document_types._client._request(
+        response = self._request(
             "POST",
             f"/api/document-types/{type_id}/validate",
             json=data,
         )
         return RawResponse(
             response,
-            lambda r: ValidationResult.model_validate(r.json()),
+            _model_parser(ValidationResult),
         )
 
 
 class AsyncDocumentTypesWithRawResponse:
     """Wrapper for AsyncDocumentTypes resource that returns raw HTTP responses."""
 
+    __slots__ = ("_document_types", "_request")
+
     def __init__(self, document_types: AsyncDocumentTypes) -> None:
         """Initialize the wrapper.
 
@@ -841,6 +844,7 @@ class AsyncDocumentTypesWithRawResponse:
             document_types: The AsyncDocumentTypes resource instance.
         """
         self._document_types = document_types
+        self._request = document_types._client._request
 
     async def list(
         self,
@@ -871,12 +875,10 @@ class AsyncDocumentTypesWithRawResponse:
         if search is not None:
             params["search"] = search
 
-        response = await self._document_types._client._request(
-            "GET", "/api/document-types", params=params
-        )
+        response = await self._request("GET", "/api/document-types", params=params)
 
         def parse_page(r: httpx.Response) -> AsyncPage[DocumentType]:
-            data = r.json()
+            data = json_loads(r.content)
             pagination = Pagination.model_validate(data.get("pagination", {}))
             items = [DocumentType.model_validate(item) for item in data.get("data", [])]
             return AsyncPage(
@@ -900,12 +902,10 @@ class AsyncDocumentTypesWithRawResponse:
         """
         from .types.document_type import DocumentType
 
-        response = await self._document_types._client._request(
-            "GET", f"/api/document-types/{type_id}"
-        )
+        response = await self._request("GET", f"/api/document-types/{type_id}")
         return RawResponse(
             response,
-            lambda r: DocumentType.model_validate(r.json()),
+            _model_parser(DocumentType),
         )
 
     async def validate(
@@ -924,14 +924,14 @@ class AsyncDocumentTypesWithRawResponse:
         """
         from .types.document_type import ValidationResult
 
-        response = await self._document_types._client._request(
+        response = await self._request(
             "POST",
             f"/api/document-types/{type_id}/validate",
             json=data,
         )
         return RawResponse(
             response,
-            lambda r: ValidationResult.model_validate(r.json()),
+            _model_parser(ValidationResult),
         )
 
 
@@ -943,6 +943,8 @@ class AsyncDocumentTypesWithRawResponse:
 class StepsWithRawResponse:
     """Wrapper for Steps resource that returns raw HTTP responses."""
 
+    __slots__ = ("_steps", "_request")
+
     def __init__(self, steps: Steps) -> None:
         """Initialize the wrapper.
 
@@ -950,6 +952,7 @@ class StepsWithRawResponse:
             steps: The Steps resource instance.
         """
         self._steps = steps
+        self._request = steps._client._request
 
     def run_async(
         self,
@@ -974,45 +977,35 @@ class StepsWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.step import StepExecutionStatus
 
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-
-            data: dict[str, Any] = {}
-            if input_data:
-                data["input_data"] = json.dumps(input_data)
-            response = self._steps._client._request(
-                "POST",
-                f"/api/steps-async/{step_id}",
-                files=upload.files,
-                data=data if data else None,
-            )
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {}
+                if input_data:
+                    data["input_data"] = json_dumps(input_data)
+                response = self._request(
+                    "POST",
+                    f"/api/steps-async/{step_id}",
+                    files=upload.files,
+                    data=data if data else None,
+                )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if input_data:
                 body["input_data"] = input_data
-            response = self._steps._client._request(
-                "POST", f"/api/steps-async/{step_id}", json=body
-            )
+            response = self._request("POST", f"/api/steps-async/{step_id}", json=body)
         elif file_base64 is not None:
             body = prepare_base64_upload(file_base64, content_type=content_type)
             if input_data:
                 body["input_data"] = input_data
-            response = self._steps._client._request(
-                "POST", f"/api/steps-async/{step_id}", json=body
-            )
+            response = self._request("POST", f"/api/steps-async/{step_id}", json=body)
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
         return RawResponse(
             response,
-            lambda r: StepExecutionStatus.model_validate(r.json()),
+            _model_parser(StepExecutionStatus),
         )
 
     def get_status(self, execution_id: str) -> RawResponse[StepExecutionStatus]:
@@ -1026,18 +1019,18 @@ class StepsWithRawResponse:
         """
         from .types.step import StepExecutionStatus
 
-        response = self._steps._client._request(
-            "GET", f"/api/steps-async/status/{execution_id}"
-        )
+        response = self._request("GET", f"/api/steps-async/status/{execution_id}")
         return RawResponse(
             response,
-            lambda r: StepExecutionStatus.model_validate(r.json()),
+            _model_parser(StepExecutionStatus),
         )
 
 
 class AsyncStepsWithRawResponse:
     """Wrapper for AsyncSteps resource that returns raw HTTP responses."""
 
+    __slots__ = ("_steps", "_request", "_inflight_status")
+
     def __init__(self, steps: AsyncSteps) -> None:
         """Initialize the wrapper.
 
@@ -1045,6 +1038,10 @@ class AsyncStepsWithRawResponse:
             steps: The AsyncSteps resource instance.
         """
         self._steps = steps
+        self._request = steps._client._request
+        self._inflight_status: dict[
+            str, asyncio.Future[RawResponse[StepExecutionStatus]]
+        ] = {}
 
     async def run_async(
         self,
@@ -1069,37 +1066,31 @@ class AsyncStepsWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from ._files import (
-            prepare_base64_upload,
-            prepare_file_upload,
-            prepare_url_upload,
-        )
         from .types.step import StepExecutionStatus
 
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-
-            data: dict[str, Any] = {}
-            if input_data:
-                data["input_data"] = json.dumps(input_data)
-            response = await self._steps._client._request(
-                "POST",
-                f"/api/steps-async/{step_id}",
-                files=upload.files,
-                data=data if data else None,
-            )
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {}
+                if input_data:
+                    data["input_data"] = json_dumps(input_data)
+                response = await self._request(
+                    "POST",
+                    f"/api/steps-async/{step_id}",
+                    files=upload.files,
+                    data=data if data else None,
+                )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if input_data:
                 body["input_data"] = input_data
-            response = await self._steps._client._request(
+            response = await self._request(
                 "POST", f"/api/steps-async/{step_id}", json=body
             )
         elif file_base64 is not None:
             body = prepare_base64_upload(file_base64, content_type=content_type)
             if input_data:
                 body["input_data"] = input_data
-            response = await self._steps._client._request(
+            response = await self._request(
                 "POST", f"/api/steps-async/{step_id}", json=body
             )
         else:
@@ -1107,26 +1098,31 @@ class AsyncStepsWithRawResponse:
 
         return RawResponse(
             response,
-            lambda r: StepExecutionStatus.model_validate(r.json()),
+            _model_parser(StepExecutionStatus),
         )
 
     async def get_status(self, execution_id: str) -> RawResponse[StepExecutionStatus]:
         """Get step execution status and return the raw HTTP response.
 
+        Concurrent calls for the same ID share a single request.
+
         Args:
             execution_id: The execution ID.
 
         Returns:
             RawResponse wrapping the HTTP response.
         """
+        return await coalesce(self._inflight_status, execution_id, self._fetch_status)
+
+    async def _fetch_status(
+        self, execution_id: str
+    ) -> RawResponse[StepExecutionStatus]:
         from .types.step import StepExecutionStatus
 
-        response = await self._steps._client._request(
-            "GET", f"/api/steps-async/status/{execution_id}"
-        )
+        response = await self._request("GET", f"/api/steps-async/status/{execution_id}")
         return RawResponse(
             response,
-            lambda r: StepExecutionStatus.model_validate(r.json()),
+            _model_parser(StepExecutionStatus),
         )
 
 
@@ -1138,6 +1134,8 @@ class AsyncStepsWithRawResponse:
 class KnowledgeBasesWithRawResponse:
     """Wrapper for KnowledgeBases resource that returns raw HTTP responses."""
 
+    __slots__ = ("_knowledge_bases", "_request")
+
     def __init__(self, knowledge_bases: KnowledgeBases) -> None:
         """Initialize the wrapper.
 
@@ -1145,6 +1143,7 @@ class KnowledgeBasesWithRawResponse:
             knowledge_bases: The KnowledgeBases resource instance.
         """
         self._knowledge_bases = knowledge_bases
+        self._request = knowledge_bases._client._request
 
     def list(
         self,
@@ -1179,12 +1178,10 @@ class KnowledgeBasesWithRawResponse:
         if is_active is not None:
             params["isActive"] = is_active
 
-        response = self._knowledge_bases._client._request(
-            "GET", "/api/knowledge-bases", params=params
-        )
+        response = self._request("GET", "/api/knowledge-bases", params=params)
 
         def parse_page(r: httpx.Response) -> Page[KnowledgeBase]:
-            data = r.json()
+            data = json_loads(r.content)
             pagination = Pagination.model_validate(data.get("pagination", {}))
             items = [
                 KnowledgeBase.model_validate(item) for item in data.get("data", [])
@@ -1210,12 +1207,10 @@ class KnowledgeBasesWithRawResponse:
         """
         from .types.knowledge_base import KnowledgeBase
 
-        response = self._knowledge_bases._client._request(
-            "GET", f"/api/knowledge-bases/{knowledge_base_id}"
-        )
+        response = self._request("GET", f"/api/knowledge-bases/{knowledge_base_id}")
         return RawResponse(
             response,
-            lambda r: KnowledgeBase.model_validate(r.json().get("data", r.json())),
+            _model_parser(KnowledgeBase, unwrap_data=True),
         )
 
     def search(
@@ -1239,12 +1234,6 @@ class KnowledgeBasesWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from .types.knowledge_base import (
-            KnowledgeBaseDocument,
-            SearchResult,
-            SearchResultItem,
-        )
-
         body: dict[str, Any] = {"query": query}
         if limit is not None:
             body["limit"] = limit
@@ -1253,31 +1242,13 @@ class KnowledgeBasesWithRawResponse:
         if include_metadata is not None:
             body["includeMetadata"] = include_metadata
 
-        response = self._knowledge_bases._client._request(
+        response = self._request(
             "POST",
             f"/api/knowledge-bases/{knowledge_base_id}/search",
             json=body,
         )
 
-        def parse_search(r: httpx.Response) -> SearchResult:
-            data = r.json()
-            items = []
-            for item_data in data.get("data", []):
-                doc = KnowledgeBaseDocument.model_validate(
-                    item_data.get("document", {})
-                )
-                items.append(
-                    SearchResultItem(
-                        document=doc, similarity=item_data.get("similarity", 0)
-                    )
-                )
-            return SearchResult(
-                data=items,
-                query=data.get("query"),
-                resultsCount=data.get("resultsCount", len(items)),
-            )
-
-        return RawResponse(response, parse_search)
+        return RawResponse(response, _parse_search_result)
 
     def sync(
         self,
@@ -1300,20 +1271,22 @@ class KnowledgeBasesWithRawResponse:
         if regenerate_embeddings is not None:
             body["regenerateEmbeddings"] = regenerate_embeddings
 
-        response = self._knowledge_bases._client._request(
+        response = self._request(
             "POST",
             f"/api/knowledge-bases/{knowledge_base_id}/sync",
             json=body if body else None,
         )
         return RawResponse(
             response,
-            lambda r: SyncResult.model_validate(r.json().get("data", r.json())),
+            _model_parser(SyncResult, unwrap_data=True),
         )
 
 
 class AsyncKnowledgeBasesWithRawResponse:
     """Wrapper for AsyncKnowledgeBases resource that returns raw HTTP responses."""
 
+    __slots__ = ("_knowledge_bases", "_request")
+
     def __init__(self, knowledge_bases: AsyncKnowledgeBases) -> None:
         """Initialize the wrapper.
 
@@ -1321,6 +1294,7 @@ class AsyncKnowledgeBasesWithRawResponse:
             knowledge_bases: The AsyncKnowledgeBases resource instance.
         """
         self._knowledge_bases = knowledge_bases
+        self._request = knowledge_bases._client._request
 
     async def list(
         self,
@@ -1355,12 +1329,10 @@ class AsyncKnowledgeBasesWithRawResponse:
         if is_active is not None:
             params["isActive"] = is_active
 
-        response = await self._knowledge_bases._client._request(
-            "GET", "/api/knowledge-bases", params=params
-        )
+        response = await self._request("GET", "/api/knowledge-bases", params=params)
 
         def parse_page(r: httpx.Response) -> AsyncPage[KnowledgeBase]:
-            data = r.json()
+            data = json_loads(r.content)
             pagination = Pagination.model_validate(data.get("pagination", {}))
             items = [
                 KnowledgeBase.model_validate(item) for item in data.get("data", [])
@@ -1386,12 +1358,12 @@ class AsyncKnowledgeBasesWithRawResponse:
         """
         from .types.knowledge_base import KnowledgeBase
 
-        response = await self._knowledge_bases._client._request(
+        response = await self._request(
             "GET", f"/api/knowledge-bases/{knowledge_base_id}"
         )
         return RawResponse(
             response,
-            lambda r: KnowledgeBase.model_validate(r.json().get("data", r.json())),
+            _model_parser(KnowledgeBase, unwrap_data=True),
         )
 
     async def search(
@@ -1415,12 +1387,6 @@ class AsyncKnowledgeBasesWithRawResponse:
         Returns:
             RawResponse wrapping the HTTP response.
         """
-        from .types.knowledge_base import (
-            KnowledgeBaseDocument,
-            SearchResult,
-            SearchResultItem,
-        )
-
         body: dict[str, Any] = {"query": query}
         if limit is not None:
             body["limit"] = limit
@@ -1429,31 +1395,13 @@ class AsyncKnowledgeBasesWithRawResponse:
         if include_metadata is not None:
             body["includeMetadata"] = include_metadata
 
-        response = await self._knowledge_bases._client._request(
+        response = await self._request(
             "POST",
             f"/api/knowledge-bases/{knowledge_base_id}/search",
             json=body,
         )
 
-        def parse_search(r: httpx.Response) -> SearchResult:
-            data = r.json()
-            items = []
-            for item_data in data.get("data", []):
-                doc = KnowledgeBaseDocument.model_validate(
-                    item_data.get("document", {})
-                )
-                items.append(
-                    SearchResultItem(
-                        document=doc, similarity=item_data.get("similarity", 0)
-                    )
-                )
-            return SearchResult(
-                data=items,
-                query=data.get("query"),
-                resultsCount=data.get("resultsCount", len(items)),
-            )
-
-        return RawResponse(response, parse_search)
+        return RawResponse(response, _parse_search_result)
 
     async def sync(
         self,
@@ -1476,12 +1424,12 @@ class AsyncKnowledgeBasesWithRawResponse:
         if regenerate_embeddings is not None:
             body["regenerateEmbeddings"] = regenerate_embeddings
 
-        response = await self._knowledge_bases._client._request(
+        response = await self._request(
             "POST",
             f"/api/knowledge-bases/{knowledge_base_id}/sync",
             json=body if body else None,
         )
         return RawResponse(
             response,
-            lambda r: SyncResult.model_validate(r.json().get("data", r.json())),
+            _model_parser(SyncResult, unwrap_data=True),
         )
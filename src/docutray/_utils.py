@@ -2,9 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import re
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any, TypeVar
 
-from ._constants import ENV_VAR_API_KEY
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+from ._constants import DEFAULT_TIMEOUT, ENV_VAR_API_KEY
+
+T = TypeVar("T")
+
+# Any integer orjson cannot hold exactly has at least 19 digits
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
 
 
 def get_api_key_from_env() -> str | None:
@@ -30,3 +48,105 @@ def mask_api_key(api_key: str | None) -> str:
     if len(api_key) <= 5:
         return "***"
     return f"{api_key[:5]}***"
+
+
+@lru_cache(maxsize=16)
+def _timeout_from_seconds(seconds: float) -> httpx.Timeout:
+    return httpx.Timeout(seconds)
+
+
+def resolve_timeout(timeout: httpx.Timeout | float | None) -> httpx.Timeout:
+    """Normalize a timeout argument to an httpx.Timeout.
+
+    Float timeouts are converted once and cached, since httpx.Timeout is
+    immutable and clients are often built with the same value.
+
+    Args:
+        timeout: An httpx.Timeout, a number of seconds, or None for the default.
+
+    Returns:
+        The timeout as an httpx.Timeout.
+    """
+    if timeout is None:
+        return DEFAULT_TIMEOUT
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    return _timeout_from_seconds(float(timeout))
+
+
+def json_loads(content: bytes) -> Any:
+    """Parse a JSON document from raw response bytes.
+
+    Uses orjson when it is installed (``pip install docutray[orjson]``),
+    which parses bytes directly instead of decoding them to str first. The
+    result always matches ``json.loads``: documents orjson would read
+    differently fall back to the standard library.
+
+    Args:
+        content: The raw JSON bytes.
+
+    Returns:
+        The parsed JSON value.
+
+    Raises:
+        ValueError: If the content is not valid JSON.
+    """
+    # orjson silently turns integers outside 64 bits into floats, so skip it
+    # when the body has a digit run long enough to hold one
+    if orjson is not None and _LONG_DIGIT_RUN.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # E.g. NaN or Infinity, which the standard library accepts
+            pass
+    return json.loads(content)
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a compact JSON string for a multipart form field.
+
+    Always uses the standard library encoder: orjson rejects non-str keys and
+    integers above 64 bits and writes NaN as null, so the form data would
+    depend on whether the optional extra is installed.
+
+    Args:
+        value: The JSON-serializable value.
+
+    Returns:
+        The JSON document as a string.
+    """
+    return json.dumps(value, separators=(",", ":"))
+
+
+async def coalesce(
+    inflight: dict[str, asyncio.Future[T]],
+    key: str,
+    fetch: Callable[[str], Awaitable[T]],
+) -> T:
+    """Share one ``fetch(key)`` call between concurrent callers.
+
+    The first caller starts ``fetch(key)`` as a task; callers arriving while
+    it runs wait for the same result instead of sending their own request.
+    Cancelling one caller does not cancel the shared task.
+
+    Args:
+        inflight: Calls in progress, keyed by ``key``. Owned by the caller.
+        key: Identifies the call, e.g. a conversion ID.
+        fetch: Async function performing the call.
+
+    Returns:
+        The result of ``fetch(key)``.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch(key))
+        inflight[key] = task
+
+        def _done(done: asyncio.Future[T]) -> None:
+            del inflight[key]
+            # Mark the error as retrieved even if every caller was cancelled
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_done)
+    return await asyncio.shield(task)
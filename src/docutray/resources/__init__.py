@@ -1,10 +1,31 @@
 """API resource classes for the DocuTray SDK."""
 
-from .convert import AsyncConvert, Convert
-from .document_types import AsyncDocumentTypes, DocumentTypes
-from .identify import AsyncIdentify, Identify
-from .knowledge_bases import AsyncKnowledgeBases, KnowledgeBases
-from .steps import AsyncSteps, Steps
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .convert import AsyncConvert, Convert
+    from .document_types import AsyncDocumentTypes, DocumentTypes
+    from .identify import AsyncIdentify, Identify
+    from .knowledge_bases import AsyncKnowledgeBases, KnowledgeBases
+    from .steps import AsyncSteps, Steps
+
+# Resource modules are imported on first attribute access (PEP 562) so that
+# using one resource does not load all of them.
+_LAZY_IMPORTS = {
+    "Convert": "convert",
+    "AsyncConvert": "convert",
+    "Identify": "identify",
+    "AsyncIdentify": "identify",
+    "DocumentTypes": "document_types",
+    "AsyncDocumentTypes": "document_types",
+    "KnowledgeBases": "knowledge_bases",
+    "AsyncKnowledgeBases": "knowledge_bases",
+    "Steps": "steps",
+    "AsyncSteps": "steps",
+}
 
 __all__ = [
     # Convert
@@ -23,3 +44,17 @@ __all__ = [
     "Steps",
     "AsyncSteps",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from .._files import prepare_base64_upload, prepare_file_upload, prepare_url_upload
+from .._files import prepare_document_request
+from .._http import _get_retry_after
 from .._types import FileInput
+from .._utils import coalesce
 from ..types.convert import ConversionResult, ConversionStatus
 
 if TYPE_CHECKING:
+    import asyncio
+
     from .._base_client import BaseAsyncClient, BaseClient
 
 
@@ -72,37 +75,19 @@ class Convert:
             ... )
             >>> print(result.data["total"])
         """
-        if file is not None:
-            # Multipart upload
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                # Multipart form data requires JSON-stringified metadata
-                data["document_metadata"] = json.dumps(document_metadata)
-
-            response = self._client._request(
-                "POST", "/api/convert", files=upload.files, data=data
-            )
-        elif url is not None:
-            # JSON with URL
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = self._client._request("POST", "/api/convert", json=body)
-        elif file_base64 is not None:
-            # JSON with base64
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = self._client._request("POST", "/api/convert", json=body)
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
-
-        return ConversionResult.model_validate(response.json())
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
+            response = self._client._request("POST", "/api/convert", **request_kwargs)
+
+        return ConversionResult.model_validate_json(response.content)
 
     def run_async(
         self,
@@ -139,39 +124,24 @@ class Convert:
             >>> # Poll for completion
             >>> final = status.wait()
         """
-        if file is not None:
-            # Multipart upload
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                # Multipart form data requires JSON-stringified metadata
-                data["document_metadata"] = json.dumps(document_metadata)
-
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
             response = self._client._request(
-                "POST", "/api/convert-async", files=upload.files, data=data
+                "POST", "/api/convert-async", **request_kwargs
             )
-        elif url is not None:
-            # JSON with URL
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = self._client._request("POST", "/api/convert-async", json=body)
-        elif file_base64 is not None:
-            # JSON with base64
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = self._client._request("POST", "/api/convert-async", json=body)
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
-
-        status = ConversionStatus.model_validate(response.json())
+
+        status = ConversionStatus.model_validate_json(response.content)
         # Store reference for polling
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     def get_status(self, conversion_id: str) -> ConversionStatus:
@@ -191,8 +161,9 @@ class Convert:
         response = self._client._request(
             "GET", f"/api/convert-async/status/{conversion_id}"
         )
-        status = ConversionStatus.model_validate(response.json())
+        status = ConversionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     @cached_property
@@ -230,6 +201,7 @@ class AsyncConvert:
             client: The parent async client instance.
         """
         self._client = client
+        self._inflight_status: dict[str, asyncio.Future[ConversionStatus]] = {}
 
     async def run(
         self,
@@ -254,34 +226,21 @@ class AsyncConvert:
         Returns:
             The conversion result with extracted data.
         """
-        if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                # Multipart form data requires JSON-stringified metadata
-                data["document_metadata"] = json.dumps(document_metadata)
-
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
             response = await self._client._request(
-                "POST", "/api/convert", files=upload.files, data=data
+                "POST", "/api/convert", **request_kwargs
             )
-        elif url is not None:
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = await self._client._request("POST", "/api/convert", json=body)
-        elif file_base64 is not None:
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = await self._client._request("POST", "/api/convert", json=body)
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
 
-        return ConversionResult.model_validate(response.json())
+        return ConversionResult.model_validate_json(response.content)
 
     async def run_async(
         self,
@@ -306,55 +265,45 @@ class AsyncConvert:
         Returns:
             The initial conversion status with conversion_id.
         """
-        if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"document_type_code": document_type_code}
-            if document_metadata:
-                # Multipart form data requires JSON-stringified metadata
-                data["document_metadata"] = json.dumps(document_metadata)
-
+        fields: dict[str, Any] = {"document_type_code": document_type_code}
+        if document_metadata:
+            fields["document_metadata"] = document_metadata
+        with prepare_document_request(
+            file=file,
+            url=url,
+            file_base64=file_base64,
+            content_type=content_type,
+            fields=fields,
+        ) as request_kwargs:
             response = await self._client._request(
-                "POST", "/api/convert-async", files=upload.files, data=data
+                "POST", "/api/convert-async", **request_kwargs
             )
-        elif url is not None:
-            body = prepare_url_upload(url, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
 
-            response = await self._client._request(
-                "POST", "/api/convert-async", json=body
-            )
-        elif file_base64 is not None:
-            body = prepare_base64_upload(file_base64, content_type=content_type)
-            body["document_type_code"] = document_type_code
-            if document_metadata:
-                body["document_metadata"] = document_metadata
-
-            response = await self._client._request(
-                "POST", "/api/convert-async", json=body
-            )
-        else:
-            raise ValueError("Must provide one of: file, url, or file_base64")
-
-        status = ConversionStatus.model_validate(response.json())
+        status = ConversionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     async def get_status(self, conversion_id: str) -> ConversionStatus:
         """Get the status of an asynchronous conversion.
 
+        Concurrent calls for the same ID share a single request.
+
         Args:
             conversion_id: The conversion ID returned by run_async().
 
         Returns:
             The current conversion status.
         """
+        return await coalesce(self._inflight_status, conversion_id, self._fetch_status)
+
+    async def _fetch_status(self, conversion_id: str) -> ConversionStatus:
         response = await self._client._request(
             "GET", f"/api/convert-async/status/{conversion_id}"
         )
-        status = ConversionStatus.model_validate(response.json())
+        status = ConversionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     @cached_property
@@ -6,6 +6,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from .._pagination import AsyncPage, Page
+from .._utils import json_loads
 from ..types.document_type import DocumentType, ValidationResult
 from ..types.shared import Pagination
 
@@ -59,7 +60,7 @@ class DocumentTypes:
             params["search"] = search
 
         response = self._client._request("GET", "/api/document-types", params=params)
-        data = response.json()
+        data = json_loads(response.content)
 
         pagination = Pagination.model_validate(data.get("pagination", {}))
         items = [DocumentType.model_validate(item) for item in data.get("data", [])]
@@ -124,7 +125,7 @@ class DocumentTypes:
             >>> print(f"Schema: {doc_type.schema_}")
         """
         response = self._client._request("GET", f"/api/document-types/{type_id}")
-        return DocumentType.model_validate(response.json())
+        return DocumentType.model_validate_json(response.content)
 
     def validate(
         self,
@@ -159,7 +160,7 @@ class DocumentTypes:
             f"/api/document-types/{type_id}/validate",
             json=data,
         )
-        return ValidationResult.model_validate(response.json())
+        return ValidationResult.model_validate_json(response.content)
 
     @cached_property
     def with_raw_response(self) -> DocumentTypesWithRawResponse:
@@ -222,7 +223,7 @@ class AsyncDocumentTypes:
         response = await self._client._request(
             "GET", "/api/document-types", params=params
         )
-        data = response.json()
+        data = json_loads(response.content)
 
         pagination = Pagination.model_validate(data.get("pagination", {}))
         items = [DocumentType.model_validate(item) for item in data.get("data", [])]
@@ -262,7 +263,7 @@ class AsyncDocumentTypes:
             The document type details including schema.
         """
         response = await self._client._request("GET", f"/api/document-types/{type_id}")
-        return DocumentType.model_validate(response.json())
+        return DocumentType.model_validate_json(response.content)
 
     async def validate(
         self,
@@ -283,7 +284,7 @@ class AsyncDocumentTypes:
             f"/api/document-types/{type_id}/validate",
             json=data,
         )
-        return ValidationResult.model_validate(response.json())
+        return ValidationResult.model_validate_json(response.content)
 
     @cached_property
     def with_raw_response(self) -> AsyncDocumentTypesWithRawResponse:
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from .._files import prepare_base64_upload, prepare_file_upload, prepare_url_upload
+from .._http import _get_retry_after
 from .._types import FileInput
+from .._utils import coalesce, json_dumps
 from ..types.identify import IdentificationResult, IdentificationStatus
 
 if TYPE_CHECKING:
+    import asyncio
+
     from .._base_client import BaseAsyncClient, BaseClient
 
 
@@ -76,15 +79,15 @@ class Identify:
             ... )
         """
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = self._client._request(
+                    "POST", "/api/identify", files=upload.files, data=data
                 )
-            response = self._client._request(
-                "POST", "/api/identify", files=upload.files, data=data
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
@@ -98,7 +101,7 @@ class Identify:
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
-        return IdentificationResult.model_validate(response.json())
+        return IdentificationResult.model_validate_json(response.content)
 
     def run_async(
         self,
@@ -131,18 +134,18 @@ class Identify:
             >>> print(f"Type: {final.document_type.code}")
         """
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = self._client._request(
+                    "POST",
+                    "/api/identify-async",
+                    files=upload.files,
+                    data=data,
                 )
-            response = self._client._request(
-                "POST",
-                "/api/identify-async",
-                files=upload.files,
-                data=data,
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
@@ -156,8 +159,9 @@ class Identify:
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
-        status = IdentificationStatus.model_validate(response.json())
+        status = IdentificationStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     def get_status(self, identification_id: str) -> IdentificationStatus:
@@ -177,8 +181,9 @@ class Identify:
         response = self._client._request(
             "GET", f"/api/identify-async/status/{identification_id}"
         )
-        status = IdentificationStatus.model_validate(response.json())
+        status = IdentificationStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     @cached_property
@@ -212,6 +217,7 @@ class AsyncIdentify:
             client: The parent async client instance.
         """
         self._client = client
+        self._inflight_status: dict[str, asyncio.Future[IdentificationStatus]] = {}
 
     async def run(
         self,
@@ -236,15 +242,15 @@ class AsyncIdentify:
             The identification result with document type and alternatives.
         """
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = await self._client._request(
+                    "POST", "/api/identify", files=upload.files, data=data
                 )
-            response = await self._client._request(
-                "POST", "/api/identify", files=upload.files, data=data
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
@@ -258,7 +264,7 @@ class AsyncIdentify:
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
-        return IdentificationResult.model_validate(response.json())
+        return IdentificationResult.model_validate_json(response.content)
 
     async def run_async(
         self,
@@ -283,18 +289,18 @@ class AsyncIdentify:
             The initial identification status with identification_id.
         """
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {"image_content_type": upload.content_type}
-            if document_type_code_options:
-                data["document_type_code_options"] = json.dumps(
-                    document_type_code_options
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {"image_content_type": upload.content_type}
+                if document_type_code_options:
+                    data["document_type_code_options"] = json_dumps(
+                        document_type_code_options
+                    )
+                response = await self._client._request(
+                    "POST",
+                    "/api/identify-async",
+                    files=upload.files,
+                    data=data,
                 )
-            response = await self._client._request(
-                "POST",
-                "/api/identify-async",
-                files=upload.files,
-                data=data,
-            )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_type_code_options:
@@ -312,24 +318,33 @@ class AsyncIdentify:
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
-        status = IdentificationStatus.model_validate(response.json())
+        status = IdentificationStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     async def get_status(self, identification_id: str) -> IdentificationStatus:
         """Get the status of an asynchronous identification.
 
+        Concurrent calls for the same ID share a single request.
+
         Args:
             identification_id: The identification ID returned by run_async().
 
         Returns:
             The current identification status.
         """
+        return await coalesce(
+            self._inflight_status, identification_id, self._fetch_status
+        )
+
+    async def _fetch_status(self, identification_id: str) -> IdentificationStatus:
         response = await self._client._request(
             "GET", f"/api/identify-async/status/{identification_id}"
         )
-        status = IdentificationStatus.model_validate(response.json())
+        status = IdentificationStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     @cached_property
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from .._files import prepare_base64_upload, prepare_file_upload, prepare_url_upload
+from .._http import _get_retry_after
 from .._types import FileInput
+from .._utils import coalesce, json_dumps
 from ..types.step import StepExecutionStatus
 
 if TYPE_CHECKING:
+    import asyncio
+
     from .._base_client import BaseAsyncClient, BaseClient
 
 
@@ -76,18 +79,18 @@ class Steps:
             >>> print(f"Execution ID: {status.execution_id}")
         """
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {}
-            if document_metadata:
-                # Multipart form data requires JSON-stringified metadata
-                data["document_metadata"] = json.dumps(document_metadata)
-
-            response = self._client._request(
-                "POST",
-                f"/api/steps-async/{step_id}",
-                files=upload.files,
-                data=data if data else None,
-            )
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {}
+                if document_metadata:
+                    # Multipart form data requires JSON-stringified metadata
+                    data["document_metadata"] = json_dumps(document_metadata)
+
+                response = self._client._request(
+                    "POST",
+                    f"/api/steps-async/{step_id}",
+                    files=upload.files,
+                    data=data if data else None,
+                )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_metadata:
@@ -107,8 +110,9 @@ class Steps:
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
-        status = StepExecutionStatus.model_validate(response.json())
+        status = StepExecutionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     def get_status(self, execution_id: str) -> StepExecutionStatus:
@@ -128,8 +132,9 @@ class Steps:
         response = self._client._request(
             "GET", f"/api/steps-async/status/{execution_id}"
         )
-        status = StepExecutionStatus.model_validate(response.json())
+        status = StepExecutionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     @cached_property
@@ -168,6 +173,7 @@ class AsyncSteps:
             client: The parent async client instance.
         """
         self._client = client
+        self._inflight_status: dict[str, asyncio.Future[StepExecutionStatus]] = {}
 
     async def run_async(
         self,
@@ -193,18 +199,18 @@ class AsyncSteps:
             The initial execution status with execution_id.
         """
         if file is not None:
-            upload = prepare_file_upload(file, content_type=content_type)
-            data: dict[str, Any] = {}
-            if document_metadata:
-                # Multipart form data requires JSON-stringified metadata
-                data["document_metadata"] = json.dumps(document_metadata)
-
-            response = await self._client._request(
-                "POST",
-                f"/api/steps-async/{step_id}",
-                files=upload.files,
-                data=data if data else None,
-            )
+            with prepare_file_upload(file, content_type=content_type) as upload:
+                data: dict[str, Any] = {}
+                if document_metadata:
+                    # Multipart form data requires JSON-stringified metadata
+                    data["document_metadata"] = json_dumps(document_metadata)
+
+                response = await self._client._request(
+                    "POST",
+                    f"/api/steps-async/{step_id}",
+                    files=upload.files,
+                    data=data if data else None,
+                )
         elif url is not None:
             body = prepare_url_upload(url, content_type=content_type)
             if document_metadata:
@@ -224,24 +230,31 @@ class AsyncSteps:
         else:
             raise ValueError("Must provide one of: file, url, or file_base64")
 
-        status = StepExecutionStatus.model_validate(response.json())
+        status = StepExecutionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     async def get_status(self, execution_id: str) -> StepExecutionStatus:
         """Get the status of a step execution.
 
+        Concurrent calls for the same ID share a single request.
+
         Args:
             execution_id: The execution ID returned by run_async().
 
         Returns:
             The current execution status.
         """
+        return await coalesce(self._inflight_status, execution_id, self._fetch_status)
+
+    async def _fetch_status(self, execution_id: str) -> StepExecutionStatus:
         response = await self._client._request(
             "GET", f"/api/steps-async/status/{execution_id}"
         )
-        status = StepExecutionStatus.model_validate(response.json())
+        status = StepExecutionStatus.model_validate_json(response.content)
         object.__setattr__(status, "_resource", self)
+        object.__setattr__(status, "_retry_after", _get_retry_after(response))
         return status
 
     @cached_property
@@ -59,6 +59,8 @@ class ConversionStatus(BaseModel):
 
     # Internal reference to the resource for polling
     _resource: Convert | AsyncConvert | None = None
+    # Server hint (Retry-After) for when to poll again, in seconds
+    _retry_after: float | None = None
 
     def is_complete(self) -> bool:
         """Check if the conversion has completed (success or error)."""
@@ -78,6 +80,10 @@ class ConversionStatus(BaseModel):
         poll_interval: float | None = None,
         timeout: float | None = None,
         on_status: Callable[[ConversionStatus], None] | None = None,
+        max_poll_interval: float | None = None,
+        backoff_factor: float | None = None,
+        jitter: float | None = None,
+        adaptive: bool = False,
     ) -> ConversionStatus:
         """Wait for the conversion to complete by polling.
 
@@ -86,6 +92,13 @@ class ConversionStatus(BaseModel):
             timeout: Maximum seconds to wait. Defaults to 300.0 (5 minutes).
             on_status: Optional callback invoked with each status update.
                 Called with the current status after each poll for progress tracking.
+            max_poll_interval: Upper bound for the interval when backoff is
+                enabled. Defaults to the larger of poll_interval and 30 seconds.
+            backoff_factor: Multiplier applied to the interval after each poll.
+                Defaults to 1.0 (fixed interval).
+            jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+            adaptive: Time the first status check from how long earlier
+                waits took in this process. Defaults to False.
 
         Returns:
             The final conversion status with data or error.
@@ -100,7 +113,12 @@ class ConversionStatus(BaseModel):
             >>> if final.is_success():
             ...     print(final.data)
         """
-        from .._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+        from .._constants import (
+            DEFAULT_POLL_BACKOFF_FACTOR,
+            DEFAULT_POLL_INTERVAL,
+            DEFAULT_POLL_JITTER,
+            DEFAULT_POLL_TIMEOUT,
+        )
         from .._polling import wait_for_completion
 
         return wait_for_completion(
@@ -108,6 +126,10 @@ class ConversionStatus(BaseModel):
             poll_interval=poll_interval or DEFAULT_POLL_INTERVAL,
             timeout=timeout or DEFAULT_POLL_TIMEOUT,
             on_status=on_status,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor or DEFAULT_POLL_BACKOFF_FACTOR,
+            jitter=jitter or DEFAULT_POLL_JITTER,
+            adaptive=adaptive,
         )
 
     async def wait_async(
@@ -118,6 +140,10 @@ class ConversionStatus(BaseModel):
         on_status: Callable[[ConversionStatus], None]
         | Callable[[ConversionStatus], Awaitable[None]]
         | None = None,
+        max_poll_interval: float | None = None,
+        backoff_factor: float | None = None,
+        jitter: float | None = None,
+        adaptive: bool = False,
     ) -> ConversionStatus:
         """Wait for the conversion to complete by polling (async version).
 
@@ -126,6 +152,13 @@ class ConversionStatus(BaseModel):
             timeout: Maximum seconds to wait. Defaults to 300.0 (5 minutes).
             on_status: Optional callback invoked with each status update.
                 Can be sync or async. Called with the current status after each poll.
+            max_poll_interval: Upper bound for the interval when backoff is
+                enabled. Defaults to the larger of poll_interval and 30 seconds.
+            backoff_factor: Multiplier applied to the interval after each poll.
+                Defaults to 1.0 (fixed interval).
+            jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+            adaptive: Time the first status check from how long earlier
+                waits took in this process. Defaults to False.
 
         Returns:
             The final conversion status with data or error.
@@ -133,7 +166,12 @@ class ConversionStatus(BaseModel):
         Raises:
             APITimeoutError: If the conversion doesn't complete within timeout.
         """
-        from .._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+        from .._constants import (
+            DEFAULT_POLL_BACKOFF_FACTOR,
+            DEFAULT_POLL_INTERVAL,
+            DEFAULT_POLL_JITTER,
+            DEFAULT_POLL_TIMEOUT,
+        )
         from .._polling import wait_for_completion_async
 
         return await wait_for_completion_async(
@@ -141,4 +179,8 @@ class ConversionStatus(BaseModel):
             poll_interval=poll_interval or DEFAULT_POLL_INTERVAL,
             timeout=timeout or DEFAULT_POLL_TIMEOUT,
             on_status=on_status,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor or DEFAULT_POLL_BACKOFF_FACTOR,
+            jitter=jitter or DEFAULT_POLL_JITTER,
+            adaptive=adaptive,
         )
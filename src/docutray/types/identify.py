@@ -79,6 +79,8 @@ class IdentificationStatus(BaseModel):
 
     # Internal reference to the resource for polling
     _resource: Identify | AsyncIdentify | None = None
+    # Server hint (Retry-After) for when to poll again, in seconds
+    _retry_after: float | None = None
 
     def is_complete(self) -> bool:
         """Check if the identification has completed (success or error)."""
@@ -98,6 +100,10 @@ class IdentificationStatus(BaseModel):
         poll_interval: float | None = None,
         timeout: float | None = None,
         on_status: Callable[[IdentificationStatus], None] | None = None,
+        max_poll_interval: float | None = None,
+        backoff_factor: float | None = None,
+        jitter: float | None = None,
+        adaptive: bool = False,
     ) -> IdentificationStatus:
         """Wait for the identification to complete by polling.
 
@@ -106,6 +112,13 @@ class IdentificationStatus(BaseModel):
             timeout: Maximum seconds to wait. Defaults to 300.0 (5 minutes).
             on_status: Optional callback invoked with each status update.
                 Called with the current status after each poll for progress tracking.
+            max_poll_interval: Upper bound for the interval when backoff is
+                enabled. Defaults to the larger of poll_interval and 30 seconds.
+            backoff_factor: Multiplier applied to the interval after each poll.
+                Defaults to 1.0 (fixed interval).
+            jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+            adaptive: Time the first status check from how long earlier
+                waits took in this process. Defaults to False.
 
         Returns:
             The final identification status with results or error.
@@ -120,7 +133,12 @@ class IdentificationStatus(BaseModel):
             >>> if final.is_success():
             ...     print(final.document_type.name)
         """
-        from .._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+        from .._constants import (
+            DEFAULT_POLL_BACKOFF_FACTOR,
+            DEFAULT_POLL_INTERVAL,
+            DEFAULT_POLL_JITTER,
+            DEFAULT_POLL_TIMEOUT,
+        )
         from .._polling import wait_for_completion
 
         return wait_for_completion(
@@ -128,6 +146,10 @@ class IdentificationStatus(BaseModel):
             poll_interval=poll_interval or DEFAULT_POLL_INTERVAL,
             timeout=timeout or DEFAULT_POLL_TIMEOUT,
             on_status=on_status,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor or DEFAULT_POLL_BACKOFF_FACTOR,
+            jitter=jitter or DEFAULT_POLL_JITTER,
+            adaptive=adaptive,
         )
 
     async def wait_async(
@@ -138,6 +160,10 @@ class IdentificationStatus(BaseModel):
         on_status: Callable[[IdentificationStatus], None]
         | Callable[[IdentificationStatus], Awaitable[None]]
         | None = None,
+        max_poll_interval: float | None = None,
+        backoff_factor: float | None = None,
+        jitter: float | None = None,
+        adaptive: bool = False,
     ) -> IdentificationStatus:
         """Wait for the identification to complete by polling (async version).
 
@@ -146,6 +172,13 @@ class IdentificationStatus(BaseModel):
             timeout: Maximum seconds to wait. Defaults to 300.0 (5 minutes).
             on_status: Optional callback invoked with each status update.
                 Can be sync or async. Called with the current status after each poll.
+            max_poll_interval: Upper bound for the interval when backoff is
+                enabled. Defaults to the larger of poll_interval and 30 seconds.
+            backoff_factor: Multiplier applied to the interval after each poll.
+                Defaults to 1.0 (fixed interval).
+            jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+            adaptive: Time the first status check from how long earlier
+                waits took in this process. Defaults to False.
 
         Returns:
             The final identification status with results or error.
@@ -153,7 +186,12 @@ class IdentificationStatus(BaseModel):
         Raises:
             APITimeoutError: If the identification doesn't complete within timeout.
         """
-        from .._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+        from .._constants import (
+            DEFAULT_POLL_BACKOFF_FACTOR,
+            DEFAULT_POLL_INTERVAL,
+            DEFAULT_POLL_JITTER,
+            DEFAULT_POLL_TIMEOUT,
+        )
         from .._polling import wait_for_completion_async
 
         return await wait_for_completion_async(
@@ -161,4 +199,8 @@ class IdentificationStatus(BaseModel):
             poll_interval=poll_interval or DEFAULT_POLL_INTERVAL,
             timeout=timeout or DEFAULT_POLL_TIMEOUT,
             on_status=on_status,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor or DEFAULT_POLL_BACKOFF_FACTOR,
+            jitter=jitter or DEFAULT_POLL_JITTER,
+            adaptive=adaptive,
         )
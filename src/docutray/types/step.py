@@ -47,6 +47,8 @@ class StepExecutionStatus(BaseModel):
 
     # Internal reference to the resource for polling
     _resource: Steps | AsyncSteps | None = None
+    # Server hint (Retry-After) for when to poll again, in seconds
+    _retry_after: float | None = None
 
     def is_complete(self) -> bool:
         """Check if the execution has completed (success or error)."""
@@ -66,6 +68,10 @@ class StepExecutionStatus(BaseModel):
         poll_interval: float | None = None,
         timeout: float | None = None,
         on_status: Callable[[StepExecutionStatus], None] | None = None,
+        max_poll_interval: float | None = None,
+        backoff_factor: float | None = None,
+        jitter: float | None = None,
+        adaptive: bool = False,
     ) -> StepExecutionStatus:
         """Wait for the step execution to complete by polling.
 
@@ -74,6 +80,13 @@ class StepExecutionStatus(BaseModel):
             timeout: Maximum seconds to wait. Defaults to 300.0 (5 minutes).
             on_status: Optional callback invoked with each status update.
                 Called with the current status after each poll for progress tracking.
+            max_poll_interval: Upper bound for the interval when backoff is
+                enabled. Defaults to the larger of poll_interval and 30 seconds.
+            backoff_factor: Multiplier applied to the interval after each poll.
+                Defaults to 1.0 (fixed interval).
+            jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+            adaptive: Time the first status check from how long earlier
+                waits took in this process. Defaults to False.
 
         Returns:
             The final execution status with data or error.
@@ -88,7 +101,12 @@ class StepExecutionStatus(BaseModel):
             >>> if final.is_success():
             ...     print(final.data)
         """
-        from .._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+        from .._constants import (
+            DEFAULT_POLL_BACKOFF_FACTOR,
+            DEFAULT_POLL_INTERVAL,
+            DEFAULT_POLL_JITTER,
+            DEFAULT_POLL_TIMEOUT,
+        )
         from .._polling import wait_for_completion
 
         return wait_for_completion(
@@ -96,6 +114,10 @@ class StepExecutionStatus(BaseModel):
             poll_interval=poll_interval or DEFAULT_POLL_INTERVAL,
             timeout=timeout or DEFAULT_POLL_TIMEOUT,
             on_status=on_status,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor or DEFAULT_POLL_BACKOFF_FACTOR,
+            jitter=jitter or DEFAULT_POLL_JITTER,
+            adaptive=adaptive,
         )
 
     async def wait_async(
@@ -106,6 +128,10 @@ class StepExecutionStatus(BaseModel):
         on_status: Callable[[StepExecutionStatus], None]
         | Callable[[StepExecutionStatus], Awaitable[None]]
         | None = None,
+        max_poll_interval: float | None = None,
+        backoff_factor: float | None = None,
+        jitter: float | None = None,
+        adaptive: bool = False,
     ) -> StepExecutionStatus:
         """Wait for the step execution to complete by polling (async version).
 
@@ -114,6 +140,13 @@ class StepExecutionStatus(BaseModel):
             timeout: Maximum seconds to wait. Defaults to 300.0 (5 minutes).
             on_status: Optional callback invoked with each status update.
                 Can be sync or async. Called with the current status after each poll.
+            max_poll_interval: Upper bound for the interval when backoff is
+                enabled. Defaults to the larger of poll_interval and 30 seconds.
+            backoff_factor: Multiplier applied to the interval after each poll.
+                Defaults to 1.0 (fixed interval).
+            jitter: Random +/- fraction applied to each interval. Defaults to 0.0.
+            adaptive: Time the first status check from how long earlier
+                waits took in this process. Defaults to False.
 
         Returns:
             The final execution status with data or error.
@@ -121,7 +154,12 @@ class StepExecutionStatus(BaseModel):
         Raises:
             APITimeoutError: If the execution doesn't complete within timeout.
         """
-        from .._constants import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_TIMEOUT
+        from .._constants import (
+            DEFAULT_POLL_BACKOFF_FACTOR,
+            DEFAULT_POLL_INTERVAL,
+            DEFAULT_POLL_JITTER,
+            DEFAULT_POLL_TIMEOUT,
+        )
         from .._polling import wait_for_completion_async
 
         return await wait_for_completion_async(
@@ -129,4 +167,8 @@ class StepExecutionStatus(BaseModel):
             poll_interval=poll_interval or DEFAULT_POLL_INTERVAL,
             timeout=timeout or DEFAULT_POLL_TIMEOUT,
             on_status=on_status,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor or DEFAULT_POLL_BACKOFF_FACTOR,
+            jitter=jitter or DEFAULT_POLL_JITTER,
+            adaptive=adaptive,
         )
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import os
+import subprocess
+import sys
+import weakref
 from unittest import mock
 
+import httpx
 import pytest
 
-from docutray import AsyncClient, AuthenticationError, Client
+from docutray import (
+    AsyncClient,
+    AuthenticationError,
+    Client,
+    _http_transport,
+    shutdown,
+    shutdown_async,
+)
+from docutray._http import build_headers
 
 
 class TestClientInstantiation:
@@ -82,8 +96,6 @@ class TestClientConfiguration:
 
     def test_default_timeout(self) -> None:
         """Client uses default granular timeout when not specified."""
-        import httpx
-
         client = Client(api_key="sk_test")
         assert isinstance(client._timeout, httpx.Timeout)
         assert client._timeout.connect == 5.0
@@ -95,9 +107,60 @@ class TestClientConfiguration:
     def test_custom_timeout(self) -> None:
         """Client uses custom timeout when specified."""
         client = Client(api_key="sk_test", timeout=30.0)
-        assert client._timeout == 30.0
+        assert client._timeout == httpx.Timeout(30.0)
+        client.close()
+
+    def test_float_timeout_conversion_is_cached(self) -> None:
+        """Clients built with the same float timeout share one httpx.Timeout."""
+        first = Client(api_key="sk_test", timeout=15.0)
+        second = Client(api_key="sk_test", timeout=15.0)
+        assert first._timeout is second._timeout
+        first.close()
+        second.close()
+
+    def test_http2_disabled_by_default(self) -> None:
+        """HTTP/2 is opt-in."""
+        client = Client(api_key="sk_test")
+        assert client._http._http2 is False
         client.close()
 
+    def test_http2_opt_in(self) -> None:
+        """http2=True is passed through to the HTTP layer."""
+        client = Client(api_key="sk_test", http2=True)
+        assert client._http._http2 is True
+        client.close()
+
+
+class TestDefaultClient:
+    """Tests for get_default_client()."""
+
+    def test_default_client_is_shared(self) -> None:
+        """get_default_client returns the same instance on every call."""
+        import docutray._client as client_module
+        from docutray import get_default_client
+
+        with (
+            mock.patch.dict(os.environ, {"DOCUTRAY_API_KEY": "sk_env_key"}),
+            mock.patch.object(client_module, "_default_client", None),
+        ):
+            first = get_default_client()
+            assert get_default_client() is first
+            assert first._api_key == "sk_env_key"
+            first.close()
+
+    def test_default_client_requires_api_key(self) -> None:
+        """get_default_client raises when no API key is configured."""
+        import docutray._client as client_module
+        from docutray import get_default_client
+
+        env = {k: v for k, v in os.environ.items() if k != "DOCUTRAY_API_KEY"}
+        with (
+            mock.patch.dict(os.environ, env, clear=True),
+            mock.patch.object(client_module, "_default_client", None),
+        ):
+            with pytest.raises(AuthenticationError):
+                get_default_client()
+
 
 class TestContextManagers:
     """Tests for context manager functionality."""
@@ -117,6 +180,263 @@ class TestContextManagers:
         assert client._http_client is None
 
 
+class TestSharedTransport:
+    """Tests for the connection pool shared between clients."""
+
+    def test_sync_clients_share_connection_pool(self) -> None:
+        """Separate clients send requests through the same pool."""
+        first = Client(api_key="sk_test_1")
+        second = Client(api_key="sk_test_2")
+        try:
+            first_transport = first._http._ensure_client()._transport
+            second_transport = second._http._ensure_client()._transport
+            assert first_transport._transport is second_transport._transport
+        finally:
+            first.close()
+            second.close()
+
+    def test_shared_pool_keeps_idle_connections(self) -> None:
+        """Idle connections outlive the gaps between polling requests."""
+        client = Client(api_key="sk_test_1")
+        try:
+            pool = client._http._ensure_client()._transport._transport._pool
+            assert pool._keepalive_expiry == 30.0
+            assert pool._max_connections == 100
+        finally:
+            client.close()
+
+    def test_close_keeps_shared_pool_open(self) -> None:
+        """Closing one client does not close the pool used by others."""
+        first = Client(api_key="sk_test_1")
+        pool = first._http._ensure_client()._transport._transport
+        first.close()
+
+        second = Client(api_key="sk_test_2")
+        try:
+            assert second._http._ensure_client()._transport._transport is pool
+        finally:
+            second.close()
+
+    async def test_async_clients_share_pool_per_loop(self) -> None:
+        """Async clients on the same event loop share a pool."""
+        async with (
+            AsyncClient(api_key="sk_test_1") as first,
+            AsyncClient(api_key="sk_test_2") as second,
+        ):
+            first_transport = first._http._ensure_client()._transport
+            second_transport = second._http._ensure_client()._transport
+            assert first_transport._transport is second_transport._transport
+
+    async def test_async_client_uses_custom_transport(self) -> None:
+        """A caller-provided transport replaces the pool and is left open."""
+        seen: list[str] = []
+
+        class RecordingTransport(httpx.AsyncBaseTransport):
+            closed = False
+
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                seen.append(request.url.path)
+                return httpx.Response(200, json={})
+
+            async def aclose(self) -> None:
+                self.closed = True
+
+        transport = RecordingTransport()
+        async with AsyncClient(api_key="sk_test_1", transport=transport) as client:
+            response = await client._request("GET", "/api/ping")
+
+        assert response.status_code == 200
+        assert seen == ["/api/ping"]
+        assert not transport.closed
+
+    def test_shutdown_closes_pool(self) -> None:
+        """shutdown() closes the shared pool; later clients get a new one."""
+        first = Client(api_key="sk_test_1")
+        pool = first._http._ensure_client()._transport._transport
+        first.close()
+
+        shutdown()
+
+        second = Client(api_key="sk_test_2")
+        try:
+            assert second._http._ensure_client()._transport._transport is not pool
+        finally:
+            second.close()
+
+    async def test_shutdown_async_closes_loop_pool(self) -> None:
+        """shutdown_async() closes the running loop's shared pool."""
+        async with AsyncClient(api_key="sk_test_1") as first:
+            pool = first._http._ensure_client()._transport._transport
+
+        await shutdown_async()
+
+        async with AsyncClient(api_key="sk_test_2") as second:
+            assert second._http._ensure_client()._transport._transport is not pool
+
+    def test_async_pool_released_after_each_loop(self) -> None:
+        """Pools of finished event loops are closed and forgotten."""
+
+        async def main() -> None:
+            async with (
+                AsyncClient(api_key="sk_test_1") as first,
+                AsyncClient(api_key="sk_test_2") as second,
+            ):
+                first._http._ensure_client()
+                second._http._ensure_client()
+                assert len(_http_transport._shared_async_transports) == 1
+
+        with mock.patch.object(
+            httpx.AsyncHTTPTransport, "aclose", autospec=True
+        ) as mock_aclose:
+            for _ in range(5):
+                asyncio.run(main())
+
+        assert mock_aclose.call_count == 5
+        assert not _http_transport._shared_async_transports
+
+    def test_unclosed_async_clients_do_not_pin_loops(self) -> None:
+        """Loops whose clients were never closed are not kept alive."""
+        loops: list[weakref.ref[asyncio.AbstractEventLoop]] = []
+
+        async def main() -> None:
+            client = AsyncClient(api_key="sk_test_1")
+            client._http._ensure_client()
+            loops.append(weakref.ref(asyncio.get_running_loop()))
+
+        for _ in range(3):
+            asyncio.run(main())
+        gc.collect()
+
+        assert all(loop() is None for loop in loops)
+        assert not _http_transport._shared_async_transports
+
+    def test_closed_loop_pools_dropped_on_next_pool(self) -> None:
+        """Pools of closed loops are forgotten even if the loop is still referenced."""
+        clients: list[AsyncClient] = []
+
+        async def main() -> None:
+            client = AsyncClient(api_key="sk_test_1")
+            client._http._ensure_client()
+            clients.append(client)
+
+        for _ in range(3):
+            asyncio.run(main())
+
+        assert len(_http_transport._shared_async_transports) == 1
+
+    async def test_async_pool_stays_open_while_clients_remain(self) -> None:
+        """Closing one async client keeps the pool open for the others."""
+        async with AsyncClient(api_key="sk_test_1") as first:
+            pool = first._http._ensure_client()._transport._transport
+            async with AsyncClient(api_key="sk_test_2") as second:
+                second._http._ensure_client()
+            third = AsyncClient(api_key="sk_test_3")
+            try:
+                assert third._http._ensure_client()._transport._transport is pool
+            finally:
+                await third.close()
+
+    def test_sync_client_honours_env_proxy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Proxies from the environment are mounted instead of the shared pool."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        client = Client(api_key="sk_test_1")
+        try:
+            mounts = client._http._ensure_client()._mounts
+            assert any(
+                transport is not None and transport._pool._proxy_url is not None
+                for transport in mounts.values()
+            )
+        finally:
+            client.close()
+
+    async def test_async_client_honours_env_proxy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Async clients mount environment proxies too."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        async with AsyncClient(api_key="sk_test_1") as client:
+            assert client._http._ensure_client()._mounts
+            assert not _http_transport._shared_async_transports
+
+    def test_default_headers_cached_per_api_key(self) -> None:
+        """Clients with the same key reuse one read-only header mapping."""
+        first = Client(api_key="sk_test_1")
+        second = Client(api_key="sk_test_1")
+        try:
+            assert first._http._ensure_client().headers["Authorization"] == (
+                "Bearer sk_test_1"
+            )
+            assert build_headers("sk_test_1") is build_headers("sk_test_1")
+            with pytest.raises(TypeError):
+                build_headers("sk_test_1")["Accept"] = "text/plain"  # type: ignore[index]
+            assert second._http._ensure_client().headers["Accept"] == "application/json"
+        finally:
+            first.close()
+            second.close()
+
+
+class TestAsyncGather:
+    """Tests for AsyncClient.gather()."""
+
+    async def test_gather_preserves_order(self) -> None:
+        """Results are returned in the order the awaitables were given."""
+
+        async def value(v: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return v
+
+        async with AsyncClient(api_key="sk_test") as client:
+            results = await client.gather(value(1, 0.02), value(2, 0.0), value(3, 0.01))
+
+        assert results == [1, 2, 3]
+
+    async def test_gather_limits_concurrency(self) -> None:
+        """No more than max_concurrency awaitables run at once."""
+        running = 0
+        peak = 0
+
+        async def task() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async with AsyncClient(api_key="sk_test") as client:
+            await client.gather(*(task() for _ in range(10)), max_concurrency=3)
+
+        assert peak == 3
+
+    async def test_gather_return_exceptions(self) -> None:
+        """Exceptions are returned in place when return_exceptions is True."""
+
+        async def fail() -> int:
+            raise RuntimeError("boom")
+
+        async def ok() -> int:
+            return 1
+
+        async with AsyncClient(api_key="sk_test") as client:
+            results = await client.gather(ok(), fail(), return_exceptions=True)
+
+        assert results[0] == 1
+        assert isinstance(results[1], RuntimeError)
+
+    async def test_gather_rejects_invalid_concurrency(self) -> None:
+        """max_concurrency must be at least 1."""
+
+        async def ok() -> int:
+            return 1
+
+        async with AsyncClient(api_key="sk_test") as client:
+            with pytest.raises(ValueError, match="max_concurrency"):
+                await client.gather(ok(), max_concurrency=0)
+
+
 class TestSafeRepr:
     """Tests for credential masking in repr."""
 
@@ -143,3 +463,29 @@ class TestSafeRepr:
         repr_str = repr(client)
         assert "https://custom.api.com" in repr_str
         client.close()
+
+
+class TestLazyImports:
+    """Tests for lazily imported modules."""
+
+    def test_import_does_not_load_types_or_resources(self) -> None:
+        """Importing docutray defers loading types and resource modules."""
+        code = (
+            "import sys, docutray; "
+            "print(any(m.startswith(('docutray.types', 'docutray.resources')) "
+            "for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_lazy_type_reexports(self) -> None:
+        """Type re-exports resolve to the classes in docutray.types."""
+        import docutray
+        import docutray.types
+
+        assert docutray.ConversionResult is docutray.types.ConversionResult
+        assert "ConversionResult" in dir(docutray)
+        with pytest.raises(AttributeError):
+            docutray.DoesNotExist  # noqa: B018
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 import httpx
 import pytest
 
@@ -65,6 +67,13 @@ class TestDocuTrayError:
         error = DocuTrayError("Test error message")
         assert str(error) == "Test error message"
 
+    def test_message_can_be_reassigned(self) -> None:
+        """Assigning message updates it and the string representation."""
+        error = DocuTrayError("Test error message")
+        error.message = "With more context"
+        assert error.message == "With more context"
+        assert str(error) == "With more context"
+
 
 class TestAPIConnectionError:
     """Tests for APIConnectionError."""
@@ -417,6 +426,40 @@ class TestRaiseForStatus:
             raise_for_status(response)
         assert exc_info.value.request_id == "req_lower"
 
+    def test_headers_not_copied(self) -> None:
+        """The error exposes the response's case-insensitive headers."""
+        response = httpx.Response(400, json={}, headers={"X-Request-ID": "req_1"})
+        with pytest.raises(BadRequestError) as exc_info:
+            raise_for_status(response)
+        error = exc_info.value
+        assert error.headers is response.headers
+        assert error.headers["X-Request-Id"] == "req_1"
+
+    def test_rate_limit_details_parsed_from_response(self) -> None:
+        """RateLimitError reads Retry-After from httpx headers at construction."""
+        response = httpx.Response(
+            429,
+            json={"error": "Too many", "limit": 100, "remaining": 0},
+            headers={"Retry-After": "12"},
+        )
+        with pytest.raises(RateLimitError) as exc_info:
+            raise_for_status(response)
+        error = exc_info.value
+        assert error.retry_after == 12.0
+        assert error.limit == 100
+        assert error.remaining == 0
+
+    def test_json_body_parsed_without_orjson(self) -> None:
+        """The stdlib parser is used when orjson is not installed."""
+        response = httpx.Response(400, json={"message": "Bad input"})
+        with (
+            mock.patch("docutray._utils.orjson", None),
+            pytest.raises(BadRequestError) as exc_info,
+        ):
+            raise_for_status(response)
+        assert exc_info.value.message == "Bad input"
+        assert exc_info.value.body == {"message": "Bad input"}
+
     def test_handles_non_json_response(self) -> None:
         """Non-JSON responses are handled gracefully."""
         response = httpx.Response(
@@ -427,3 +470,30 @@ class TestRaiseForStatus:
         with pytest.raises(InternalServerError) as exc_info:
             raise_for_status(response)
         assert "Plain text error" in exc_info.value.message
+
+    def test_parses_json_with_mixed_case_content_type(self) -> None:
+        """Content types are matched case-insensitively."""
+        response = httpx.Response(
+            400,
+            content=b'{"error": {"message": "Bad input"}}',
+            headers={"Content-Type": "Application/JSON; charset=utf-8"},
+        )
+        with pytest.raises(BadRequestError) as exc_info:
+            raise_for_status(response)
+        assert exc_info.value.message == "Bad input"
+
+    def test_skips_json_parse_for_non_json_content_type(self) -> None:
+        """Bodies declared as non-JSON are used as text without parsing."""
+        response = httpx.Response(
+            502,
+            content=b"<html><body>Bad Gateway</body></html>",
+            headers={"Content-Type": "text/html"},
+        )
+        with (
+            mock.patch("docutray._exceptions.json_loads") as json_loads,
+            pytest.raises(InternalServerError) as exc_info,
+        ):
+            raise_for_status(response)
+        json_loads.assert_not_called()
+        assert exc_info.value.body is None
+        assert "Bad Gateway" in exc_info.value.message
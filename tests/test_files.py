@@ -6,10 +6,13 @@ import base64
 from io import BytesIO
 from pathlib import Path
 
+import pytest
+
 from docutray._files import (
     detect_content_type,
     encode_file_to_base64,
     prepare_base64_upload,
+    prepare_document_request,
     prepare_file_upload,
     prepare_url_upload,
 )
@@ -61,6 +64,15 @@ class TestDetectContentType:
         content_type = detect_content_type(path)
         assert content_type in ("application/octet-stream", None) or content_type
 
+    def test_uppercase_extension(self) -> None:
+        """Extensions are matched case-insensitively."""
+        assert detect_content_type(Path("SCAN.PDF")) == "application/pdf"
+
+    def test_mimetypes_fallback(self) -> None:
+        """Extensions outside the SDK table fall back to mimetypes."""
+        assert detect_content_type(Path("notes.txt")) == "text/plain"
+        assert detect_content_type(Path("README")) == "application/octet-stream"
+
 
 class TestPrepareFileUpload:
     """Tests for prepare_file_upload()."""
@@ -106,25 +118,40 @@ class TestPrepareFileUpload:
         test_file = tmp_path / "test.pdf"
         test_file.write_bytes(b"test pdf content")
 
-        upload = prepare_file_upload(test_file)
+        with prepare_file_upload(test_file) as upload:
+            assert "image" in upload.files
+            filename, file_obj, content_type = upload.files["image"]
+            assert filename == "test.pdf"
+            assert content_type == "application/pdf"
+            assert file_obj.read() == b"test pdf content"
 
-        assert "image" in upload.files
-        filename, file_obj, content_type = upload.files["image"]
-        assert filename == "test.pdf"
-        assert content_type == "application/pdf"
-        assert file_obj.read() == b"test pdf content"
+        # The SDK opened the file, so it closes it
+        assert file_obj.closed
 
     def test_from_path_png(self, tmp_path: Path) -> None:
         """Prepare upload from PNG file path."""
         test_file = tmp_path / "image.png"
         test_file.write_bytes(b"fake png content")
 
-        upload = prepare_file_upload(test_file)
-
-        filename, _, content_type = upload.files["image"]
+        with prepare_file_upload(test_file) as upload:
+            filename, _, content_type = upload.files["image"]
         assert filename == "image.png"
         assert content_type == "image/png"
 
+    def test_close_leaves_user_file_open(self) -> None:
+        """Closing the upload does not close a caller's file object."""
+        file_obj = BytesIO(b"content")
+        with prepare_file_upload(file_obj):
+            pass
+        assert not file_obj.closed
+
+    def test_file_object_name_uses_basename(self) -> None:
+        """A path-like name on a file object is reduced to its basename."""
+        file_obj = BytesIO(b"content")
+        file_obj.name = "/var/uploads/invoice.pdf"  # type: ignore[attr-defined]
+        upload = prepare_file_upload(file_obj)
+        assert upload.files["image"][0] == "invoice.pdf"
+
 
 class TestPrepareUrlUpload:
     """Tests for prepare_url_upload()."""
@@ -177,6 +204,76 @@ class TestPrepareBase64Upload:
         assert result == {"image_base64": b64_data}
 
 
+class TestPrepareDocumentRequest:
+    """Tests for prepare_document_request()."""
+
+    def test_file_is_multipart_with_json_encoded_fields(self) -> None:
+        """Files become multipart uploads with non-string fields JSON-encoded."""
+        fields = {"document_type_code": "invoice", "document_metadata": {"ref": 1}}
+
+        with prepare_document_request(
+            file=b"%PDF-1.4",
+            url=None,
+            file_base64=None,
+            content_type="application/pdf",
+            fields=fields,
+        ) as kwargs:
+            assert set(kwargs) == {"files", "data"}
+            assert kwargs["data"] == {
+                "document_type_code": "invoice",
+                "document_metadata": '{"ref":1}',
+            }
+
+    def test_owned_file_closed_after_block(self, tmp_path: Path) -> None:
+        """Files opened from a path stay open only inside the block."""
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"%PDF-1.4")
+
+        with prepare_document_request(
+            file=path, url=None, file_base64=None, content_type=None, fields={}
+        ) as kwargs:
+            handle = kwargs["files"]["image"][1]
+            assert not handle.closed
+
+        assert handle.closed
+
+    def test_url_is_json_body(self) -> None:
+        """URLs become a JSON body with the fields merged in."""
+        with prepare_document_request(
+            file=None,
+            url="https://example.com/doc.pdf",
+            file_base64=None,
+            content_type=None,
+            fields={"document_metadata": {"ref": 1}},
+        ) as kwargs:
+            assert kwargs == {
+                "json": {
+                    "image_url": "https://example.com/doc.pdf",
+                    "document_metadata": {"ref": 1},
+                }
+            }
+
+    def test_base64_is_json_body(self) -> None:
+        """Base64 documents become a JSON body."""
+        with prepare_document_request(
+            file=None,
+            url=None,
+            file_base64="SGVsbG8=",
+            content_type="application/pdf",
+            fields={"document_type_code": "invoice"},
+        ) as kwargs:
+            assert kwargs["json"]["image_base64"] == "SGVsbG8="
+            assert kwargs["json"]["document_type_code"] == "invoice"
+
+    def test_no_input_raises(self) -> None:
+        """Omitting every document input raises ValueError."""
+        with pytest.raises(ValueError, match="Must provide one of"):
+            with prepare_document_request(
+                file=None, url=None, file_base64=None, content_type=None, fields={}
+            ):
+                pass
+
+
 class TestEncodeFileToBase64:
     """Tests for encode_file_to_base64()."""
 
@@ -204,3 +301,15 @@ class TestEncodeFileToBase64:
         result = encode_file_to_base64(file_obj)
 
         assert result == base64.b64encode(data).decode("ascii")
+
+    def test_encode_large_stream_in_chunks(self) -> None:
+        """Chunked encoding matches a one-shot encode, including short reads."""
+        data = bytes(range(256)) * 50_000 + b"tail"
+
+        class ShortReads(BytesIO):
+            def read(self, size: int | None = -1) -> bytes:
+                return super().read(min(size or 1, 1_000_001))
+
+        expected = base64.b64encode(data).decode("ascii")
+        assert encode_file_to_base64(BytesIO(data)) == expected
+        assert encode_file_to_base64(ShortReads(data)) == expected
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from docutray._pagination import AsyncPage, Page
@@ -92,6 +94,38 @@ class TestPage:
 
         assert page.has_next_page() is False
 
+    def test_has_next_page_false_on_empty_page_before_total(self) -> None:
+        """An empty page ends the list even if total reports more items."""
+        pagination = Pagination(total=50, page=3, limit=10)
+        page: Page[str] = Page(
+            data=[],
+            pagination=pagination,
+            fetch_page=lambda p: page,
+        )
+
+        assert page.has_next_page() is False
+
+    def test_iter_pages_stops_at_empty_page(self) -> None:
+        """iter_pages does not walk through trailing empty pages."""
+        calls: list[int] = []
+
+        def fetch(page_num: int) -> Page[str]:
+            calls.append(page_num)
+            return Page(
+                data=[],
+                pagination=Pagination(total=50, page=page_num, limit=10),
+                fetch_page=fetch,
+            )
+
+        page: Page[str] = Page(
+            data=["a"] * 10,
+            pagination=Pagination(total=50, page=1, limit=10),
+            fetch_page=fetch,
+        )
+
+        assert list(page.auto_paging_iter()) == ["a"] * 10
+        assert calls == [2]
+
     def test_next_page_fetches_next(self) -> None:
         """next_page calls fetch_page with next page number."""
         fetch_calls: list[int] = []
@@ -145,6 +179,7 @@ class TestPage:
 
     def test_iter_pages_multi_page(self) -> None:
         """iter_pages yields all pages sequentially."""
+
         def mock_fetch(page_num: int) -> Page[str]:
             if page_num == 1:
                 return Page(
@@ -188,6 +223,7 @@ class TestPage:
 
     def test_auto_paging_iter_multi_page(self) -> None:
         """auto_paging_iter yields all items across pages."""
+
         def mock_fetch(page_num: int) -> Page[str]:
             if page_num == 1:
                 return Page(
@@ -321,9 +357,25 @@ class TestAsyncPage:
         assert fetch_calls == [2]
         assert next_page.page == 2
 
+    async def test_async_next_page_raises_on_last_page(self) -> None:
+        """AsyncPage next_page raises StopAsyncIteration on last page."""
+
+        async def mock_fetch(p: int) -> AsyncPage[str]:
+            return page
+
+        page: AsyncPage[str] = AsyncPage(
+            data=["a"] * 10,
+            pagination=Pagination(total=10, page=1, limit=10),
+            fetch_page=mock_fetch,
+        )
+
+        with pytest.raises(StopAsyncIteration, match="No more pages"):
+            await page.next_page()
+
     @pytest.mark.asyncio
     async def test_async_iter_pages(self) -> None:
         """AsyncPage iter_pages_async yields all pages."""
+
         async def mock_fetch(page_num: int) -> AsyncPage[str]:
             if page_num == 1:
                 return AsyncPage(
@@ -355,6 +407,7 @@ class TestAsyncPage:
     @pytest.mark.asyncio
     async def test_async_auto_paging_iter(self) -> None:
         """AsyncPage auto_paging_iter_async yields all items."""
+
         async def mock_fetch(page_num: int) -> AsyncPage[str]:
             if page_num == 1:
                 return AsyncPage(
@@ -379,3 +432,147 @@ class TestAsyncPage:
         items = [item async for item in page.auto_paging_iter_async()]
 
         assert items == ["a", "b", "c", "d", "e"]
+
+
+def _make_sync_pages(total: int, limit: int, calls: list[int]) -> Page[int]:
+    """Build a chain of sync pages over ``range(total)``, recording fetches."""
+
+    def fetch(page_num: int) -> Page[int]:
+        calls.append(page_num)
+        start = (page_num - 1) * limit
+        return Page(
+            data=list(range(start, min(start + limit, total))),
+            pagination=Pagination(total=total, page=page_num, limit=limit),
+            fetch_page=fetch,
+        )
+
+    return Page(
+        data=list(range(min(limit, total))),
+        pagination=Pagination(total=total, page=1, limit=limit),
+        fetch_page=fetch,
+    )
+
+
+def _make_async_pages(total: int, limit: int, calls: list[int]) -> AsyncPage[int]:
+    """Build a chain of async pages over ``range(total)``, recording fetches."""
+
+    async def fetch(page_num: int) -> AsyncPage[int]:
+        calls.append(page_num)
+        start = (page_num - 1) * limit
+        return AsyncPage(
+            data=list(range(start, min(start + limit, total))),
+            pagination=Pagination(total=total, page=page_num, limit=limit),
+            fetch_page=fetch,
+        )
+
+    return AsyncPage(
+        data=list(range(min(limit, total))),
+        pagination=Pagination(total=total, page=1, limit=limit),
+        fetch_page=fetch,
+    )
+
+
+class TestPagePrefetch:
+    """Tests for background page prefetching in the sync iterators."""
+
+    @pytest.mark.parametrize("prefetch", [1, 3])
+    def test_auto_paging_iter_prefetch_yields_all_items(self, prefetch: int) -> None:
+        """Prefetching returns the same items in order."""
+        calls: list[int] = []
+        page = _make_sync_pages(total=11, limit=2, calls=calls)
+
+        items = list(page.auto_paging_iter(prefetch=prefetch))
+
+        assert items == list(range(11))
+        assert sorted(calls) == [2, 3, 4, 5, 6]
+
+    def test_next_page_fetched_before_current_is_consumed(self) -> None:
+        """The next page is requested while the current one is being read."""
+        calls: list[int] = []
+        page = _make_sync_pages(total=6, limit=2, calls=calls)
+        pages = page.iter_pages(prefetch=1)
+
+        assert next(pages) is page
+        pages.close()
+
+        assert calls == [2]
+
+    def test_early_stop_skips_remaining_pages(self) -> None:
+        """Stopping early does not walk the rest of the list."""
+        calls: list[int] = []
+        page = _make_sync_pages(total=100, limit=2, calls=calls)
+
+        for item in page.auto_paging_iter(prefetch=1):
+            if item == 2:
+                break
+
+        assert len(calls) <= 2
+
+    def test_negative_prefetch_rejected(self) -> None:
+        """A negative prefetch raises ValueError."""
+        page = _make_sync_pages(total=4, limit=2, calls=[])
+
+        with pytest.raises(ValueError, match="prefetch"):
+            page.auto_paging_iter(prefetch=-1)
+
+
+class TestAsyncPagePrefetch:
+    """Tests for background page prefetching in the async iterators."""
+
+    @pytest.mark.parametrize("prefetch", [1, 3])
+    async def test_auto_paging_iter_prefetch_yields_all_items(
+        self, prefetch: int
+    ) -> None:
+        """Prefetching returns the same items in order."""
+        calls: list[int] = []
+        page = _make_async_pages(total=11, limit=2, calls=calls)
+
+        items = [item async for item in page.auto_paging_iter_async(prefetch=prefetch)]
+
+        assert items == list(range(11))
+        assert calls == [2, 3, 4, 5, 6]
+
+    async def test_next_page_fetched_while_current_is_consumed(self) -> None:
+        """The next page's request runs while the caller reads the current one."""
+        calls: list[int] = []
+        page = _make_async_pages(total=6, limit=2, calls=calls)
+        pages = page.iter_pages_async(prefetch=1)
+
+        assert await pages.__anext__() is page
+        await asyncio.sleep(0)
+
+        assert calls == [2]
+        await pages.aclose()
+
+    async def test_early_stop_cancels_pending_fetch(self) -> None:
+        """Stopping early cancels the fetch still in flight."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch(page_num: int) -> AsyncPage[int]:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            raise AssertionError("fetch should have been cancelled")
+
+        page: AsyncPage[int] = AsyncPage(
+            data=[0, 1],
+            pagination=Pagination(total=10, page=1, limit=2),
+            fetch_page=fetch,
+        )
+        pages = page.iter_pages_async(prefetch=1)
+
+        await pages.__anext__()
+        await started.wait()
+        await pages.aclose()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    def test_negative_prefetch_rejected(self) -> None:
+        """A negative prefetch raises ValueError."""
+        page = _make_async_pages(total=4, limit=2, calls=[])
+
+        with pytest.raises(ValueError, match="prefetch"):
+            page.iter_pages_async(prefetch=-1)
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import time
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from docutray import _polling
 from docutray._exceptions import APITimeoutError
-from docutray._polling import wait_for_completion, wait_for_completion_async
+from docutray._polling import (
+    wait_for_completion,
+    wait_for_completion_async,
+    wait_for_many_completions,
+    wait_for_many_completions_async,
+)
 from docutray.types.convert import ConversionStatus
 from docutray.types.identify import IdentificationStatus
 from docutray.types.step import StepExecutionStatus
@@ -162,6 +171,415 @@ class TestPollingTimeout:
         assert "exec_xyz" in str(exc_info.value)
 
 
+class TestPollingBackoff:
+    """Tests for exponential backoff between polls."""
+
+    def _processing_resource(self, polls: int) -> MagicMock:
+        """Build a resource returning PROCESSING `polls` times, then SUCCESS."""
+        statuses = [
+            ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+            for _ in range(polls)
+        ]
+        statuses.append(ConversionStatus(conversion_id="conv_123", status="SUCCESS"))
+        resource = MagicMock()
+        resource.get_status = MagicMock(side_effect=statuses)
+        return resource
+
+    def test_fixed_interval_by_default(self) -> None:
+        """Without backoff the interval stays constant."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._resource = self._processing_resource(3)
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=1.0)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0] * 4
+
+    def test_interval_grows_and_is_capped(self) -> None:
+        """Backoff multiplies the interval up to max_poll_interval."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._resource = self._processing_resource(4)
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(
+                status,
+                poll_interval=1.0,
+                max_poll_interval=5.0,
+                backoff_factor=2.0,
+            )
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        """Jitter randomizes each interval within +/- the given fraction."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._resource = self._processing_resource(9)
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=1.0, jitter=0.2)
+
+        for call in mock_sleep.call_args_list:
+            assert 0.8 <= call.args[0] <= 1.2
+
+    def test_invalid_backoff_factor_raises(self) -> None:
+        """A backoff factor below 1.0 is rejected."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._resource = MagicMock()
+
+        with pytest.raises(ValueError, match="backoff_factor"):
+            wait_for_completion(status, backoff_factor=0.5)
+
+    def test_retry_after_hint_extends_wait(self) -> None:
+        """A longer Retry-After hint on the status overrides the interval."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._retry_after = 5.0
+        hinted = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        hinted._retry_after = 0.5
+        resource = MagicMock()
+        resource.get_status = MagicMock(
+            side_effect=[
+                hinted,
+                ConversionStatus(conversion_id="conv_123", status="SUCCESS"),
+            ]
+        )
+        status._resource = resource
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=1.0)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [5.0, 1.0]
+
+    def test_sleep_clamped_to_timeout(self) -> None:
+        """The last sleep ends at the deadline rather than a full interval later."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._resource = self._processing_resource(1)
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=60.0, timeout=0.5)
+
+        assert 0.0 < mock_sleep.call_args_list[0].args[0] <= 0.5
+
+    async def test_async_interval_grows(self) -> None:
+        """Async polling applies the same backoff schedule."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        resource = AsyncMock()
+        resource.get_status = AsyncMock(
+            side_effect=[
+                ConversionStatus(conversion_id="conv_123", status="PROCESSING"),
+                ConversionStatus(conversion_id="conv_123", status="SUCCESS"),
+            ]
+        )
+        status._resource = resource
+
+        with patch("docutray._polling.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await wait_for_completion_async(
+                status, poll_interval=0.5, backoff_factor=3.0
+            )
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.5]
+
+    async def test_async_retry_after_hint_extends_wait(self) -> None:
+        """Async polling honors a Retry-After hint on the status."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        status._retry_after = 3.0
+        resource = AsyncMock()
+        resource.get_status = AsyncMock(
+            return_value=ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+        status._resource = resource
+
+        with patch("docutray._polling.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await wait_for_completion_async(status, poll_interval=0.5)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3.0]
+
+
+class TestWaitForManyCompletions:
+    """Tests for polling several operations in parallel."""
+
+    def _resource(self, *statuses: ConversionStatus) -> MagicMock:
+        resource = MagicMock()
+        resource.get_status = MagicMock(side_effect=list(statuses))
+        return resource
+
+    def test_returns_results_in_input_order(self) -> None:
+        """Final statuses come back in the order they were passed in."""
+        slow = ConversionStatus(conversion_id="conv_slow", status="PROCESSING")
+        slow._resource = self._resource(
+            ConversionStatus(conversion_id="conv_slow", status="PROCESSING"),
+            ConversionStatus(conversion_id="conv_slow", status="SUCCESS"),
+        )
+        fast = ConversionStatus(conversion_id="conv_fast", status="PROCESSING")
+        fast._resource = self._resource(
+            ConversionStatus(conversion_id="conv_fast", status="SUCCESS"),
+        )
+
+        results = wait_for_many_completions([slow, fast], poll_interval=0.01)
+
+        assert [r.conversion_id for r in results] == ["conv_slow", "conv_fast"]
+        assert all(r.status == "SUCCESS" for r in results)
+
+    def test_polls_overlap(self) -> None:
+        """Jobs are polled concurrently rather than one after another."""
+        statuses = []
+        for i in range(4):
+            status = ConversionStatus(conversion_id=f"conv_{i}", status="PROCESSING")
+            status._resource = self._resource(
+                ConversionStatus(conversion_id=f"conv_{i}", status="SUCCESS"),
+            )
+            statuses.append(status)
+
+        start = time.monotonic()
+        wait_for_many_completions(statuses, poll_interval=0.2)
+
+        assert time.monotonic() - start < 0.6
+
+    def test_failure_is_raised(self) -> None:
+        """A job that times out raises APITimeoutError."""
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        resource = MagicMock()
+        resource.get_status = MagicMock(return_value=status)
+        status._resource = resource
+
+        with pytest.raises(APITimeoutError, match="conv_123"):
+            wait_for_many_completions([status], poll_interval=0.01, timeout=0.03)
+
+    def test_failure_stops_other_polls(self) -> None:
+        """After one job fails, the others stop polling before their timeout."""
+        failing = ConversionStatus(conversion_id="conv_bad", status="PROCESSING")
+        failing._resource = MagicMock()
+        failing._resource.get_status = MagicMock(side_effect=RuntimeError("boom"))
+        slow = ConversionStatus(conversion_id="conv_slow", status="PROCESSING")
+        slow_resource = MagicMock()
+        slow_resource.get_status = MagicMock(return_value=slow)
+        slow._resource = slow_resource
+
+        with pytest.raises(RuntimeError, match="boom"):
+            wait_for_many_completions([failing, slow], poll_interval=0.01)
+        # Allow for a status check that was already in flight
+        time.sleep(0.02)
+        calls = slow_resource.get_status.call_count
+
+        time.sleep(0.1)
+
+        assert slow_resource.get_status.call_count == calls
+
+    def test_empty_input(self) -> None:
+        """No statuses gives no results."""
+        assert wait_for_many_completions([]) == []
+
+
+class TestWaitForManyCompletionsAsync:
+    """Tests for polling several operations concurrently on an event loop."""
+
+    def _resource(self, *statuses: ConversionStatus) -> AsyncMock:
+        resource = AsyncMock()
+        resource.get_status = AsyncMock(side_effect=list(statuses))
+        return resource
+
+    async def test_returns_results_in_input_order(self) -> None:
+        """Final statuses come back in the order they were passed in."""
+        slow = ConversionStatus(conversion_id="conv_slow", status="PROCESSING")
+        slow._resource = self._resource(
+            ConversionStatus(conversion_id="conv_slow", status="PROCESSING"),
+            ConversionStatus(conversion_id="conv_slow", status="SUCCESS"),
+        )
+        fast = ConversionStatus(conversion_id="conv_fast", status="PROCESSING")
+        fast._resource = self._resource(
+            ConversionStatus(conversion_id="conv_fast", status="SUCCESS"),
+        )
+
+        results = await wait_for_many_completions_async(
+            [slow, fast], poll_interval=0.01
+        )
+
+        assert [r.conversion_id for r in results] == ["conv_slow", "conv_fast"]
+        assert all(r.status == "SUCCESS" for r in results)
+
+    async def test_polls_overlap(self) -> None:
+        """Jobs are polled concurrently rather than one after another."""
+        statuses = []
+        for i in range(4):
+            status = ConversionStatus(conversion_id=f"conv_{i}", status="PROCESSING")
+            status._resource = self._resource(
+                ConversionStatus(conversion_id=f"conv_{i}", status="SUCCESS"),
+            )
+            statuses.append(status)
+
+        start = time.monotonic()
+        await wait_for_many_completions_async(statuses, poll_interval=0.2)
+
+        assert time.monotonic() - start < 0.6
+
+    async def test_failure_cancels_other_polls(self) -> None:
+        """The first error is raised and the remaining polls stop."""
+        failing = ConversionStatus(conversion_id="conv_bad", status="PROCESSING")
+        failing_resource = AsyncMock()
+        failing_resource.get_status = AsyncMock(side_effect=RuntimeError("boom"))
+        failing._resource = failing_resource
+        slow = ConversionStatus(conversion_id="conv_slow", status="PROCESSING")
+        slow_resource = AsyncMock()
+        slow_resource.get_status = AsyncMock(return_value=slow)
+        slow._resource = slow_resource
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await wait_for_many_completions_async([failing, slow], poll_interval=0.01)
+        calls = slow_resource.get_status.await_count
+
+        await asyncio.sleep(0.05)
+
+        assert slow_resource.get_status.await_count == calls
+
+    async def test_empty_input(self) -> None:
+        """No statuses gives no results."""
+        assert await wait_for_many_completions_async([]) == []
+
+
+class TestAdaptivePolling:
+    """Tests for timing the first poll from earlier waits."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_stats(self) -> Iterator[None]:
+        _polling._completion_stats.clear()
+        yield
+        _polling._completion_stats.clear()
+
+    def _pending(self, *statuses: ConversionStatus) -> ConversionStatus:
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        resource = MagicMock()
+        resource.get_status = MagicMock(side_effect=list(statuses))
+        status._resource = resource
+        return status
+
+    def test_records_wait_time_after_polling(self) -> None:
+        """A wait that needed polling updates the running mean."""
+        status = self._pending(
+            ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+
+        with patch("docutray._polling.time.sleep"):
+            wait_for_completion(status, poll_interval=1.0)
+
+        mean, count = _polling._completion_stats[ConversionStatus]
+        assert count == 1
+        assert 0.0 <= mean < 1.0
+
+    def test_already_complete_is_not_recorded(self) -> None:
+        """A status that is done before any poll leaves the stats alone."""
+        status = ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        status._resource = MagicMock()
+
+        wait_for_completion(status)
+
+        assert ConversionStatus not in _polling._completion_stats
+
+    def test_first_sleep_uses_mean(self) -> None:
+        """With history, the first sleep is just below the mean wait."""
+        _polling._completion_stats[ConversionStatus] = (10.0, 3)
+        status = self._pending(
+            ConversionStatus(conversion_id="conv_123", status="PROCESSING"),
+            ConversionStatus(conversion_id="conv_123", status="SUCCESS"),
+        )
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=1.0, adaptive=True)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [pytest.approx(8.0), 1.0]
+
+    def test_without_history_uses_poll_interval(self) -> None:
+        """Without history, adaptive waits start at poll_interval."""
+        status = self._pending(
+            ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=1.0, adaptive=True)
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_history_ignored_unless_adaptive(self) -> None:
+        """Regular waits keep the fixed first interval."""
+        _polling._completion_stats[ConversionStatus] = (10.0, 3)
+        status = self._pending(
+            ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+
+        with patch("docutray._polling.time.sleep") as mock_sleep:
+            wait_for_completion(status, poll_interval=1.0)
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    async def test_async_first_sleep_uses_mean(self) -> None:
+        """The async loop honours the learned first delay too."""
+        _polling._completion_stats[ConversionStatus] = (0.05, 1)
+        status = ConversionStatus(conversion_id="conv_123", status="PROCESSING")
+        resource = AsyncMock()
+        resource.get_status = AsyncMock(
+            return_value=ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+        status._resource = resource
+
+        with patch("docutray._polling.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await wait_for_completion_async(status, poll_interval=1.0, adaptive=True)
+
+        mock_sleep.assert_awaited_once_with(0.1)
+
+
+class TestStatusSubclasses:
+    """Tests for polling status subclasses and test doubles."""
+
+    def test_subclass_is_refetched(self) -> None:
+        """Subclasses of a status type are polled by their ID."""
+
+        class MyStatus(ConversionStatus):
+            pass
+
+        status = MyStatus(conversion_id="conv_123", status="PROCESSING")
+        resource = MagicMock()
+        resource.get_status = MagicMock(
+            return_value=ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+        status._resource = resource
+
+        with patch("docutray._polling.time.sleep"):
+            result = wait_for_completion(status, poll_interval=1.0)
+
+        assert result.status == "SUCCESS"
+        resource.get_status.assert_called_once_with("conv_123")
+
+    def test_subclass_timeout_names_job(self) -> None:
+        """Timeout messages use the base type's label for subclasses."""
+
+        class MyStatus(IdentificationStatus):
+            pass
+
+        status = MyStatus(identification_id="id_123", status="PROCESSING")
+        resource = MagicMock()
+        resource.get_status = MagicMock(return_value=status)
+        status._resource = resource
+
+        with pytest.raises(APITimeoutError, match="Identification id_123"):
+            wait_for_completion(status, poll_interval=0.01, timeout=0.03)
+
+    def test_specced_mock_is_refetched(self) -> None:
+        """Mocks specced on a status type are polled by their ID."""
+        status = MagicMock(spec=ConversionStatus)
+        status.conversion_id = "conv_123"
+        status.is_complete.return_value = False
+        status._resource = MagicMock()
+        status._resource.get_status = MagicMock(
+            return_value=ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+
+        with patch("docutray._polling.time.sleep"):
+            result = wait_for_completion(status, poll_interval=1.0)
+
+        assert result.status == "SUCCESS"
+        status._resource.get_status.assert_called_once_with("conv_123")
+
+
 class TestPollingNoResource:
     """Tests for polling without resource reference."""
 
@@ -313,6 +731,31 @@ class TestAsyncPolling:
         assert result.status == "SUCCESS"
         assert callback_statuses == ["PROCESSING", "SUCCESS"]
 
+    async def test_async_on_status_callable_returning_coroutine(self) -> None:
+        """A plain callable that returns a coroutine is still awaited."""
+        initial_status = ConversionStatus(
+            conversion_id="conv_123",
+            status="PROCESSING",
+        )
+        mock_resource = AsyncMock()
+        mock_resource.get_status = AsyncMock(
+            return_value=ConversionStatus(conversion_id="conv_123", status="SUCCESS")
+        )
+        initial_status._resource = mock_resource
+
+        callback_statuses: list[str] = []
+
+        async def track_status(s: ConversionStatus) -> None:
+            callback_statuses.append(s.status)
+
+        await wait_for_completion_async(
+            initial_status,
+            poll_interval=0.01,
+            on_status=lambda s: track_status(s),
+        )
+
+        assert callback_statuses == ["SUCCESS"]
+
     async def test_async_callback_not_invoked_on_initial_complete(self) -> None:
         """Async callback not invoked when status is already complete."""
         status = ConversionStatus(
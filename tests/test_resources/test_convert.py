@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 import respx
@@ -125,6 +127,22 @@ class TestConvertGetStatus:
         assert not status.is_complete()
         assert not status.is_success()
 
+    def test_get_status_keeps_retry_after_hint(
+        self, client: Client, mock_api: respx.MockRouter
+    ) -> None:
+        """A Retry-After header on the status response is kept for polling."""
+        mock_api.get("/api/convert-async/status/conv_123").mock(
+            return_value=httpx.Response(
+                200,
+                headers={"Retry-After": "7"},
+                json={"conversion_id": "conv_123", "status": "PROCESSING"},
+            )
+        )
+
+        status = client.convert.get_status("conv_123")
+
+        assert status._retry_after == 7.0
+
     def test_get_status_success(self, client: Client, mock_api: respx.MockRouter) -> None:
         """Get status returns SUCCESS state with data."""
         mock_api.get("/api/convert-async/status/conv_123").mock(
@@ -365,3 +383,23 @@ class TestAsyncConvertGetStatus:
         assert status.is_complete()
         assert status.is_error()
         assert "timeout" in status.error.lower()
+
+    async def test_async_concurrent_get_status_shares_request(
+        self, async_client: AsyncClient, mock_api: respx.MockRouter
+    ) -> None:
+        """Concurrent get_status calls for one ID send a single request."""
+        route = mock_api.get("/api/convert-async/status/conv_123").mock(
+            return_value=httpx.Response(
+                200, json={"conversion_id": "conv_123", "status": "PROCESSING"}
+            )
+        )
+
+        first, second = await asyncio.gather(
+            async_client.convert.get_status("conv_123"),
+            async_client.convert.get_status("conv_123"),
+        )
+
+        assert route.call_count == 1
+        assert first.status == second.status == "PROCESSING"
+        await async_client.convert.get_status("conv_123")
+        assert route.call_count == 2
@@ -69,6 +69,25 @@ class TestDocumentTypesList:
         assert response.page == 2
         assert response.limit == 5
 
+    def test_list_keeps_big_integers(
+        self, client: Client, mock_api: respx.MockRouter
+    ) -> None:
+        """Untyped page data keeps integers beyond 64 bits exact."""
+        mock_api.get("/api/document-types").mock(
+            return_value=httpx.Response(
+                200,
+                content=(
+                    b'{"data": [{"id": "dt_1", "name": "Invoice", "codeType": "invoice",'
+                    b' "schema_": {"maximum": 123456789012345678901234567890}}],'
+                    b' "pagination": {"total": 1, "page": 1, "limit": 10}}'
+                ),
+            )
+        )
+
+        response = client.document_types.list()
+
+        assert response.data[0].schema_ == {"maximum": 123456789012345678901234567890}
+
     def test_list_with_search(self, client: Client, mock_api: respx.MockRouter) -> None:
         """List document types with search filter."""
         route = mock_api.get("/api/document-types").mock(
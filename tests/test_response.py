@@ -24,7 +24,9 @@ class TestRawResponse:
     def test_headers(self) -> None:
         """RawResponse exposes headers from underlying response."""
         mock_response = MagicMock(spec=httpx.Response)
-        mock_response.headers = httpx.Headers({"x-request-id": "req_123", "content-type": "application/json"})
+        mock_response.headers = httpx.Headers(
+            {"x-request-id": "req_123", "content-type": "application/json"}
+        )
 
         raw = RawResponse(mock_response, lambda r: None)
 
@@ -59,10 +61,7 @@ class TestRawResponse:
 
     def test_json(self) -> None:
         """RawResponse can parse JSON from response."""
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.json.return_value = {"data": "test"}
-
-        raw = RawResponse(mock_response, lambda r: None)
+        raw = RawResponse(httpx.Response(200, json={"data": "test"}), lambda r: None)
 
         assert raw.json() == {"data": "test"}
 
@@ -95,7 +94,7 @@ class TestRawResponse:
         assert isinstance(result, int)
 
     def test_multiple_parse_calls(self) -> None:
-        """RawResponse.parse() can be called multiple times."""
+        """RawResponse.parse() parses once and returns the cached model."""
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.json.return_value = {"count": 0}
 
@@ -108,9 +107,58 @@ class TestRawResponse:
 
         raw = RawResponse(mock_response, parse_func)
 
-        # Each call to parse() invokes parse_func
+        # Only the first call to parse() invokes parse_func
         result1 = raw.parse()
         result2 = raw.parse()
 
         assert result1 == 1
-        assert result2 == 2
+        assert result2 == 1
+        assert call_count == 1
+
+    def test_no_instance_dict(self) -> None:
+        """RawResponse uses __slots__ instead of a per-instance __dict__."""
+        raw = RawResponse(MagicMock(spec=httpx.Response), lambda r: None)
+
+        assert not hasattr(raw, "__dict__")
+
+    def test_json_keeps_big_integers(self) -> None:
+        """Integers beyond 64 bits are not turned into floats."""
+        response = httpx.Response(
+            200, content=b'{"data": {"total": 123456789012345678901234567890}}'
+        )
+
+        raw = RawResponse(response, lambda r: None)
+
+        assert raw.json() == {"data": {"total": 123456789012345678901234567890}}
+
+    def test_json_decoded_once(self) -> None:
+        """RawResponse.json() decodes the body once."""
+        raw = RawResponse(httpx.Response(200, json={"count": 0}), lambda r: None)
+
+        assert raw.json() is raw.json()
+
+
+class TestModelParser:
+    """Tests for the shared parse functions used by raw responses."""
+
+    def test_parser_shared_per_model(self) -> None:
+        """Raw responses for the same model reuse one parse function."""
+        from docutray._response import _model_parser
+        from docutray.types.convert import ConversionStatus
+
+        assert _model_parser(ConversionStatus) is _model_parser(ConversionStatus)
+        assert _model_parser(ConversionStatus) is not _model_parser(
+            ConversionStatus, unwrap_data=True
+        )
+
+    def test_unwrap_data(self) -> None:
+        """unwrap_data validates the body's "data" member when present."""
+        from docutray._response import _model_parser
+        from docutray.types.knowledge_base import SyncResult
+
+        parse = _model_parser(SyncResult, unwrap_data=True)
+        wrapped = httpx.Response(200, json={"data": {"status": "started"}})
+        bare = httpx.Response(200, json={"status": "completed"})
+
+        assert parse(wrapped).status == "started"
+        assert parse(bare).status == "completed"
@@ -22,7 +22,12 @@ from docutray._constants import (
     RETRYABLE_STATUS_CODES,
     RetryConfig,
 )
-from docutray._http import calculate_delay, should_retry
+from docutray._http import (
+    _get_retry_after,
+    calculate_delay,
+    calculate_delay_decorrelated,
+    should_retry,
+)
 
 
 class TestRetryConfig:
@@ -49,6 +54,22 @@ class TestRetryConfig:
         assert modified.max_delay == original.max_delay
         assert original.max_retries == 2  # Original unchanged
 
+    def test_with_same_max_retries_returns_same_config(self) -> None:
+        """with_max_retries reuses the config when the value is unchanged."""
+        assert DEFAULT_RETRY_CONFIG.with_max_retries(2) is DEFAULT_RETRY_CONFIG
+
+    def test_delays_precomputed(self) -> None:
+        """The backoff schedule is computed once per config."""
+        config = RetryConfig(max_retries=4, initial_delay=0.5, max_delay=4.0)
+        assert config.delays == (0.5, 1.0, 2.0, 4.0, 4.0)
+        assert config.with_max_retries(1).delays == (0.5, 1.0)
+
+    def test_status_codes_coerced_to_frozenset(self) -> None:
+        """Status codes given as another iterable are stored as a frozenset."""
+        config = RetryConfig(retryable_status_codes=[429, 503])  # type: ignore[arg-type]
+        assert config.retryable_status_codes == frozenset({429, 503})
+        assert isinstance(config.retryable_status_codes, frozenset)
+
     def test_config_is_frozen(self) -> None:
         """RetryConfig is immutable."""
         config = RetryConfig()
@@ -155,6 +176,51 @@ class TestCalculateDelay:
         assert delay == 5.0
 
 
+class TestCalculateDelayDecorrelated:
+    """Tests for calculate_delay_decorrelated function."""
+
+    def test_draws_between_initial_and_three_times_previous(self) -> None:
+        """The delay is drawn from [initial_delay, 3 * previous_delay]."""
+        config = RetryConfig(initial_delay=0.5, max_delay=8.0)
+        with mock.patch.object(random, "uniform", return_value=1.2) as uniform:
+            assert calculate_delay_decorrelated(2.0, config) == 1.2
+        uniform.assert_called_once_with(0.5, 6.0)
+
+    def test_capped_at_max_delay(self) -> None:
+        """The delay never exceeds max_delay."""
+        config = RetryConfig(initial_delay=0.5, max_delay=8.0)
+        with mock.patch.object(random, "uniform", side_effect=lambda a, b: b):
+            assert calculate_delay_decorrelated(6.0, config) == 8.0
+
+    def test_retry_after_takes_precedence(self) -> None:
+        """Retry-After wins when larger than the drawn delay."""
+        config = RetryConfig(initial_delay=0.5)
+        with mock.patch.object(random, "uniform", return_value=0.5):
+            assert calculate_delay_decorrelated(0.5, config, retry_after=3.0) == 3.0
+
+
+class TestGetRetryAfter:
+    """Tests for _get_retry_after function."""
+
+    def test_seconds_header(self) -> None:
+        """Retry-After is parsed case-insensitively as seconds."""
+        response = httpx.Response(429, headers={"Retry-After": "2.5"})
+        assert _get_retry_after(response) == 2.5
+
+    def test_milliseconds_header_preferred(self) -> None:
+        """retry-after-ms takes precedence over Retry-After."""
+        response = httpx.Response(
+            429, headers={"retry-after-ms": "250", "Retry-After": "1"}
+        )
+        assert _get_retry_after(response) == 0.25
+
+    def test_missing_or_invalid(self) -> None:
+        """Missing or non-numeric values give None."""
+        assert _get_retry_after(httpx.Response(429)) is None
+        response = httpx.Response(429, headers={"Retry-After": "soon"})
+        assert _get_retry_after(response) is None
+
+
 class TestShouldRetry:
     """Tests for should_retry function."""
 
@@ -226,6 +292,18 @@ class TestClientMaxRetries:
         with pytest.raises(ValueError, match="max_retries must be >= 0"):
             AsyncClient(api_key="sk_test", max_retries=-1)
 
+    def test_decorrelated_backoff_strategy(self) -> None:
+        """Client passes the backoff strategy into its retry config."""
+        client = Client(api_key="sk_test", backoff_strategy="decorrelated")
+        assert client._retry_config.backoff_strategy == "decorrelated"
+        assert client._retry_config.max_retries == 2
+        client.close()
+
+    def test_invalid_backoff_strategy_raises_error(self) -> None:
+        """Unknown backoff strategies are rejected."""
+        with pytest.raises(ValueError, match="backoff_strategy"):
+            Client(api_key="sk_test", backoff_strategy="linear")  # type: ignore[arg-type]
+
 
 class TestRetryBehavior:
     """Integration tests for retry behavior."""
@@ -249,6 +327,29 @@ class TestRetryBehavior:
         assert route.call_count == 3
         client.close()
 
+    @respx.mock
+    def test_decorrelated_delays_grow_from_previous_delay(self) -> None:
+        """Each decorrelated delay is drawn relative to the previous one."""
+        respx.get("https://app.docutray.com/test").mock(
+            side_effect=[
+                httpx.Response(500, text="Server Error"),
+                httpx.Response(500, text="Server Error"),
+                httpx.Response(200, json={"success": True}),
+            ]
+        )
+
+        client = Client(
+            api_key="sk_test", max_retries=2, backoff_strategy="decorrelated"
+        )
+        with (
+            mock.patch.object(random, "uniform", side_effect=lambda a, b: b),
+            mock.patch("docutray._http.time.sleep") as sleep,
+        ):
+            client._http.request("GET", "/test")
+
+        assert [c.args[0] for c in sleep.call_args_list] == [1.5, 4.5]
+        client.close()
+
     @respx.mock
     def test_retries_on_429(self) -> None:
         """Client retries on 429 with Retry-After."""
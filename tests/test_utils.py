@@ -0,0 +1,148 @@
+"""Tests for internal utilities."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from docutray._utils import coalesce, json_dumps, json_loads
+
+
+class TestCoalesce:
+    """Tests for sharing in-flight async calls."""
+
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Callers with the same key wait for one fetch."""
+        calls: list[str] = []
+        release = asyncio.Event()
+
+        async def fetch(key: str) -> str:
+            calls.append(key)
+            await release.wait()
+            return key.upper()
+
+        inflight: dict[str, asyncio.Future[str]] = {}
+        waiters = [
+            asyncio.ensure_future(coalesce(inflight, "a", fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["A", "A", "A"]
+        assert calls == ["a"]
+        assert inflight == {}
+
+    async def test_different_keys_fetch_separately(self) -> None:
+        """Different keys are not coalesced."""
+        calls: list[str] = []
+
+        async def fetch(key: str) -> str:
+            calls.append(key)
+            return key
+
+        inflight: dict[str, asyncio.Future[str]] = {}
+        await asyncio.gather(
+            coalesce(inflight, "a", fetch), coalesce(inflight, "b", fetch)
+        )
+
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_cancelling_one_caller_keeps_shared_call(self) -> None:
+        """A cancelled caller does not cancel the call other callers wait on."""
+        release = asyncio.Event()
+
+        async def fetch(key: str) -> str:
+            await release.wait()
+            return key
+
+        inflight: dict[str, asyncio.Future[str]] = {}
+        first = asyncio.ensure_future(coalesce(inflight, "a", fetch))
+        second = asyncio.ensure_future(coalesce(inflight, "a", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "a"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_error_reaches_every_caller(self) -> None:
+        """An error from the shared call is raised to all callers."""
+
+        async def fetch(key: str) -> str:
+            await asyncio.sleep(0)
+            raise ValueError(key)
+
+        inflight: dict[str, asyncio.Future[str]] = {}
+        results = await asyncio.gather(
+            coalesce(inflight, "a", fetch),
+            coalesce(inflight, "a", fetch),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert inflight == {}
+
+
+class TestJsonLoads:
+    """Tests for parsing response bodies."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'{"a": 123456789012345678901234567890}',
+            b'{"a": -9223372036854775809}',
+            b'{"a": 18446744073709551615}',
+            b'{"a": NaN, "b": Infinity}',
+            b'{"a": [1, 2.5, "x", null]}',
+        ],
+    )
+    def test_matches_stdlib(self, content: bytes) -> None:
+        """Results are the same as json.loads, with orjson installed or not."""
+        result = json_loads(content)
+        with mock.patch("docutray._utils.orjson", None):
+            fallback = json_loads(content)
+
+        assert repr(result) == repr(fallback) == repr(json.loads(content))
+
+    def test_invalid_json_raises_value_error(self) -> None:
+        """Malformed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            json_loads(b"{not json")
+
+
+class TestJsonDumps:
+    """Tests for serializing multipart JSON form fields."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_round_trip(self, use_orjson: bool) -> None:
+        """Output is compact JSON with or without orjson."""
+        value = {"ref": "A-1", "tags": ["x", "y"], "nested": {"n": 1}}
+
+        encoded = self._dumps(value, use_orjson)
+
+        assert " " not in encoded
+        assert json.loads(encoded) == value
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ({1: "a"}, '{"1":"a"}'),
+            ({"big": 2**70}, '{"big":1180591620717411303424}'),
+            ({"n": float("nan")}, '{"n":NaN}'),
+        ],
+    )
+    def test_matches_stdlib(self, use_orjson: bool, value: Any, expected: str) -> None:
+        """Values orjson handles differently are encoded like json.dumps."""
+        assert self._dumps(value, use_orjson) == expected
+
+    def _dumps(self, value: Any, use_orjson: bool) -> str:
+        if use_orjson:
+            return json_dumps(value)
+        with mock.patch("docutray._utils.orjson", None):
+            return json_dumps(value)